@@ -3,16 +3,39 @@
 Responsibilities:
 - Define explicit silence trimming and peak normalization defaults.
 - Apply in-place, idempotent WAV transformations without transcoding.
+- Fuse merged-output trim and normalization into one read/write pass.
+- Decode and encode PCM samples in bulk through `array` where possible.
+- View little-endian PCM frames as samples in place instead of copying them.
 """
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
 import io
 from pathlib import Path
+import sys
 import wave
 
 
+def _array_typecode(item_size: int) -> str | None:
+    """Return a signed `array` typecode with the given item size, if one exists."""
+
+    for typecode in ("h", "i", "l"):
+        if array(typecode).itemsize == item_size:
+            return typecode
+    return None
+
+
+_PCM_ARRAY_TYPECODES = {
+    width: typecode
+    for width in (2, 4)
+    if (typecode := _array_typecode(width)) is not None
+}
+"""Signed `array` typecodes used to decode 16- and 32-bit little-endian PCM in bulk."""
+
+
 @dataclass(frozen=True, slots=True)
 class PostprocessPolicy:
     """Deterministic WAV postprocessing policy.
@@ -35,35 +58,33 @@ class AudioPostProcessor:
         self._policy = policy if policy is not None else PostprocessPolicy()
 
     def process_merged(self, audio_path: Path) -> Path:
-        """Apply trim+normalize policy in deterministic order to a merged file."""
+        """Apply trim+normalize policy in deterministic order to a merged file.
 
-        trimmed = self.trim_silence(audio_path)
-        return self.normalize(trimmed)
-
-    def normalize(self, audio_path: Path) -> Path:
-        """Normalize WAV peak amplitude to policy target and return output path."""
+        Both transforms run on one in-memory frame buffer, so the file is read
+        once and rewritten at most once.
+        """
 
         if audio_path.suffix.lower() != ".wav":
             return audio_path
 
         params, frames = self._read_wav_frames(audio_path)
-        if params.nframes == 0:
-            return audio_path
+        processed = self._normalized_frames(
+            self._trimmed_frames(frames, params), params.sampwidth
+        )
+        if processed != frames:
+            self._write_wav_frames(audio_path, params, processed)
+        return audio_path
 
-        peak = self._peak_abs(frames, params.sampwidth)
-        if peak <= 0:
-            return audio_path
+    def normalize(self, audio_path: Path) -> Path:
+        """Normalize WAV peak amplitude to policy target and return output path."""
 
-        max_amplitude = (1 << (params.sampwidth * 8 - 1)) - 1
-        target_peak = int(round(max_amplitude * self._policy.target_peak_ratio))
-        if abs(peak - target_peak) <= 1:
+        if audio_path.suffix.lower() != ".wav":
             return audio_path
 
-        gain = target_peak / float(peak)
-        normalized = self._scale_pcm(frames, params.sampwidth, gain)
-        if normalized == frames:
-            return audio_path
-        self._write_wav_frames(audio_path, params, normalized)
+        params, frames = self._read_wav_frames(audio_path)
+        normalized = self._normalized_frames(frames, params.sampwidth)
+        if normalized != frames:
+            self._write_wav_frames(audio_path, params, normalized)
         return audio_path
 
     def trim_silence(self, audio_path: Path) -> Path:
@@ -73,40 +94,60 @@ class AudioPostProcessor:
             return audio_path
 
         params, frames = self._read_wav_frames(audio_path)
-        if params.nframes == 0:
-            return audio_path
+        trimmed = self._trimmed_frames(frames, params)
+        if trimmed != frames:
+            self._write_wav_frames(audio_path, params, trimmed)
+        return audio_path
+
+    def _normalized_frames(self, frames: bytes, sample_width: int) -> bytes:
+        """Return PCM frames scaled so their absolute peak matches the policy target."""
 
-        frame_width = params.nchannels * params.sampwidth
+        if not frames:
+            return frames
+
+        peak = self._peak_abs(frames, sample_width)
+        if peak <= 0:
+            return frames
+
+        max_amplitude = (1 << (sample_width * 8 - 1)) - 1
+        target_peak = int(round(max_amplitude * self._policy.target_peak_ratio))
+        if abs(peak - target_peak) <= 1:
+            return frames
+
+        gain = target_peak / float(peak)
+        return self._scale_pcm(frames, sample_width, gain)
+
+    def _trimmed_frames(self, frames: bytes, params: wave._wave_params) -> bytes:
+        """Return PCM frames without leading/trailing frames under the silence threshold."""
+
+        frame_count = params.nframes
+        if frame_count == 0:
+            return frames
+
+        channels = max(1, params.nchannels)
+        frame_width = channels * params.sampwidth
         max_amplitude = (1 << (params.sampwidth * 8 - 1)) - 1
         threshold = max(
             1,
             int(round(max_amplitude * self._policy.silence_threshold_ratio)),
         )
 
-        start_index = 0
-        end_index = params.nframes
-
-        for index in range(params.nframes):
-            frame = frames[index * frame_width : (index + 1) * frame_width]
-            if self._peak_abs(frame, params.sampwidth) > threshold:
-                start_index = index
-                break
-        else:
-            if frames != b"":
-                self._write_wav_frames(audio_path, params, b"")
-            return audio_path
-
-        for index in range(params.nframes - 1, -1, -1):
-            frame = frames[index * frame_width : (index + 1) * frame_width]
-            if self._peak_abs(frame, params.sampwidth) > threshold:
-                end_index = index + 1
-                break
+        samples = self._iter_samples(frames, params.sampwidth)
+        first_loud = next(
+            (index for index, sample in enumerate(samples) if abs(sample) > threshold),
+            None,
+        )
+        if first_loud is None:
+            return b""
+        last_loud = next(
+            index
+            for index in range(len(samples) - 1, first_loud - 1, -1)
+            if abs(samples[index]) > threshold
+        )
 
-        trimmed = frames[start_index * frame_width : end_index * frame_width]
-        if trimmed == frames:
-            return audio_path
-        self._write_wav_frames(audio_path, params, trimmed)
-        return audio_path
+        start_index = first_loud // channels
+        end_index = min(frame_count, last_loud // channels + 1)
+        return frames[start_index * frame_width : end_index * frame_width]
 
     def _read_wav_frames(self, audio_path: Path) -> tuple[wave._wave_params, bytes]:
         """Read WAV headers and PCM frame bytes from disk."""
@@ -135,14 +176,10 @@ class AudioPostProcessor:
     def _peak_abs(self, frames: bytes, sample_width: int) -> int:
         """Return absolute peak sample amplitude for PCM payload."""
 
-        if sample_width not in (1, 2, 3, 4) or not frames:
+        samples = self._iter_samples(frames, sample_width)
+        if not samples:
             return 0
-        peak = 0
-        for sample in self._iter_samples(frames, sample_width):
-            absolute = abs(sample)
-            if absolute > peak:
-                peak = absolute
-        return peak
+        return max(max(samples), -min(samples))
 
     def _scale_pcm(self, frames: bytes, sample_width: int, gain: float) -> bytes:
         """Scale PCM payload with clamping and return scaled bytes."""
@@ -157,33 +194,55 @@ class AudioPostProcessor:
             min_value = -(1 << (sample_width * 8 - 1))
             max_value = (1 << (sample_width * 8 - 1)) - 1
 
-        scaled_chunks: list[bytes] = []
-        for sample in self._iter_samples(frames, sample_width):
-            scaled = int(round(sample * gain))
-            clamped = min(max_value, max(min_value, scaled))
-            scaled_chunks.append(self._sample_to_bytes(clamped, sample_width))
-        return b"".join(scaled_chunks)
+        return self._encode_samples(
+            [
+                min(max_value, max(min_value, int(round(sample * gain))))
+                for sample in self._iter_samples(frames, sample_width)
+            ],
+            sample_width,
+        )
+
+    def _iter_samples(self, frames: bytes, sample_width: int) -> Sequence[int]:
+        """Decode PCM frame bytes into signed integer samples.
 
-    def _iter_samples(self, frames: bytes, sample_width: int) -> list[int]:
-        """Decode PCM frame bytes into signed integer samples."""
+        16- and 32-bit PCM on little-endian hosts is returned as a zero-copy
+        `memoryview` cast over the frame bytes; big-endian hosts decode through
+        a byteswapped `array`. 8-bit PCM is offset per byte, and 24-bit PCM has
+        no native array type and is decoded per sample. Trailing partial samples
+        are ignored.
+        """
 
         if sample_width not in (1, 2, 3, 4):
             return []
 
-        samples: list[int] = []
-        for offset in range(0, len(frames), sample_width):
-            chunk = frames[offset : offset + sample_width]
-            if len(chunk) != sample_width:
-                continue
-            if sample_width == 1:
-                samples.append(chunk[0] - 128)
-            else:
-                samples.append(int.from_bytes(chunk, "little", signed=True))
+        usable = len(frames) - len(frames) % sample_width
+        if sample_width == 1:
+            return [value - 128 for value in frames[:usable]]
+        typecode = _PCM_ARRAY_TYPECODES.get(sample_width)
+        if typecode is None:
+            return [
+                int.from_bytes(frames[offset : offset + sample_width], "little", signed=True)
+                for offset in range(0, usable, sample_width)
+            ]
+        if sys.byteorder == "little":
+            return memoryview(frames)[:usable].cast(typecode)
+        samples = array(typecode)
+        samples.frombytes(frames[:usable])
+        samples.byteswap()
         return samples
 
-    def _sample_to_bytes(self, sample: int, sample_width: int) -> bytes:
-        """Encode signed integer sample to PCM bytes."""
+    def _encode_samples(self, samples: Sequence[int], sample_width: int) -> bytes:
+        """Encode signed integer samples to little-endian PCM bytes."""
 
         if sample_width == 1:
-            return bytes([sample + 128])
-        return int(sample).to_bytes(sample_width, "little", signed=True)
+            return bytes(sample + 128 for sample in samples)
+        typecode = _PCM_ARRAY_TYPECODES.get(sample_width)
+        if typecode is None:
+            return b"".join(
+                int(sample).to_bytes(sample_width, "little", signed=True)
+                for sample in samples
+            )
+        encoded = array(typecode, samples)
+        if sys.byteorder != "little":
+            encoded.byteswap()
+        return encoded.tobytes()
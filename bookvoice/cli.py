@@ -310,6 +310,8 @@ def _resolve_command_base_config(
         chunk_size_chars=loaded_config.chunk_size_chars,
         chapter_selection=resolved_chapters,
         resume=loaded_config.resume,
+        provider_concurrency=loaded_config.provider_concurrency,
+        response_cache_dir=loaded_config.response_cache_dir,
         extra=resolved_extra,
     )
 
@@ -337,6 +339,8 @@ def _apply_runtime_sources(
         chunk_size_chars=base_config.chunk_size_chars,
         chapter_selection=base_config.chapter_selection,
         resume=base_config.resume,
+        provider_concurrency=base_config.provider_concurrency,
+        response_cache_dir=base_config.response_cache_dir,
         runtime_sources=RuntimeConfigSources(
             cli=runtime_cli_values,
             secure=runtime_secure_values,
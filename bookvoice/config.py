@@ -113,6 +113,10 @@ class BookvoiceConfig:
         chunk_size_chars: Target chunk size in characters.
         chapter_selection: Optional 1-based chapter selection expression.
         resume: Whether pipeline should attempt to resume from artifacts.
+        provider_concurrency: Maximum in-flight provider calls per stage; `1` keeps
+            translate, rewrite, and TTS calls sequential.
+        response_cache_dir: Optional directory for a persistent translate/rewrite
+            response cache shared across runs; `None` keeps caching in memory.
         runtime_sources: Optional runtime source overrides injected by CLI.
         extra: Additional metadata for future extensions.
     """
@@ -132,6 +136,8 @@ class BookvoiceConfig:
     chunk_size_chars: int = 1800
     chapter_selection: str | None = None
     resume: bool = False
+    provider_concurrency: int = 1
+    response_cache_dir: Path | None = None
     runtime_sources: RuntimeConfigSources = field(default_factory=RuntimeConfigSources)
     extra: dict[str, str] = field(default_factory=dict)
 
@@ -148,6 +154,8 @@ class BookvoiceConfig:
         self._require_non_empty(self.tts_voice, "tts_voice")
         if self.chunk_size_chars <= 0:
             raise ValueError("`chunk_size_chars` must be a positive integer.")
+        if self.provider_concurrency <= 0:
+            raise ValueError("`provider_concurrency` must be a positive integer.")
 
     @property
     def input_path(self) -> Path:
@@ -410,6 +418,8 @@ class ConfigLoader:
             "chunk_size_chars",
             "chapter_selection",
             "resume",
+            "provider_concurrency",
+            "response_cache_dir",
             "output_format",
             "package_mode",
             "package_chapters",
@@ -469,6 +479,12 @@ class ConfigLoader:
             env_map, "BOOKVOICE_CHAPTER_SELECTION"
         )
         resume = ConfigLoader._optional_env_boolean(env_map, "BOOKVOICE_RESUME") or False
+        provider_concurrency = ConfigLoader._optional_env_positive_int(
+            env_map, "BOOKVOICE_PROVIDER_CONCURRENCY"
+        ) or 1
+        response_cache_dir = ConfigLoader._optional_env_path(
+            env_map, "BOOKVOICE_RESPONSE_CACHE_DIR"
+        )
         provider_translator = (
             ConfigLoader._optional_env_string(env_map, "BOOKVOICE_PROVIDER_TRANSLATOR")
             or "openai"
@@ -569,6 +585,8 @@ class ConfigLoader:
             chunk_size_chars=chunk_size,
             chapter_selection=chapter_selection,
             resume=resume,
+            provider_concurrency=provider_concurrency,
+            response_cache_dir=response_cache_dir,
             runtime_sources=RuntimeConfigSources(env=runtime_env),
             extra=packaging_extra,
         )
@@ -655,6 +673,18 @@ class ConfigLoader:
             source_label,
             default=False,
         )
+        provider_concurrency = ConfigLoader._optional_positive_int(
+            payload,
+            "provider_concurrency",
+            source_label,
+            default=1,
+        )
+        response_cache_dir_value = ConfigLoader._optional_non_empty_string(
+            payload, "response_cache_dir", source_label
+        )
+        response_cache_dir = (
+            Path(response_cache_dir_value) if response_cache_dir_value is not None else None
+        )
         extra = ConfigLoader._optional_string_map(payload, "extra", source_label)
         output_format = ConfigLoader._optional_non_empty_string(
             payload, "output_format", source_label
@@ -722,6 +752,8 @@ class ConfigLoader:
             chunk_size_chars=chunk_size,
             chapter_selection=chapter_selection,
             resume=resume,
+            provider_concurrency=provider_concurrency,
+            response_cache_dir=response_cache_dir,
             extra=extra,
         )
         config.validate()
@@ -313,7 +313,7 @@ class EpubExporter:
             f"{scope_entries}|"
             + "|".join(f"{chapter.index}:{chapter.title}" for chapter in document.chapters)
         )
-        digest = sha256(fingerprint.encode("utf-8")).hexdigest()[:24]
+        digest = sha256(fingerprint.encode("utf-8"), usedforsecurity=False).hexdigest()[:24]
         return f"urn:bookvoice:translated:{digest}"
 
     @staticmethod
@@ -0,0 +1,131 @@
+"""JSON encoding helpers for persisted Bookvoice artifacts.
+
+Responsibilities:
+- Encode artifact payloads into deterministic UTF-8 JSON bytes.
+- Decode UTF-8 JSON artifact bytes without an intermediate text decode.
+- Use `orjson` as an optional accelerator when it is installed.
+- Encode `pathlib` paths as strings in both encoders.
+- Keep stdlib `NaN` / `Infinity` output for non-finite floats in both encoders.
+- Stream top-level artifact lists item by item with an identical byte layout.
+- Fall back to stdlib `json` with an identical document layout otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Iterator
+from pathlib import PurePath
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on optional accelerator
+    _orjson = None
+
+_ORJSON_ARTIFACT_OPTIONS = (
+    _orjson.OPT_INDENT_2 | _orjson.OPT_SORT_KEYS if _orjson is not None else 0
+)
+
+def _contains_non_finite_float(value: object) -> bool:
+    """Return whether a payload holds NaN or infinity, which `orjson` writes as `null`."""
+
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_contains_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_non_finite_float(item) for item in value)
+    return False
+
+
+def _encode_default(value: object) -> str:
+    """Encode values outside the JSON type domain that artifacts may carry."""
+
+    if isinstance(value, PurePath):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json_artifact(payload: Any) -> bytes:
+    """Encode payload as indented, key-sorted UTF-8 JSON artifact bytes.
+
+    `pathlib` paths are written as their string form. Float spelling depends
+    on the encoder (`orjson` writes `1e16` where stdlib `json` writes
+    `1e+16`); both decode to the same value.
+
+    Payloads outside the `orjson` type domain (for example non-string keys or
+    integers wider than 64 bits) are encoded with stdlib `json` instead, as are
+    payloads with NaN or infinity, which `orjson` would write as `null`.
+    """
+
+    if _orjson is not None:
+        try:
+            encoded = _orjson.dumps(
+                payload, default=_encode_default, option=_ORJSON_ARTIFACT_OPTIONS
+            )
+        except TypeError:
+            pass
+        else:
+            if b"null" not in encoded or not _contains_non_finite_float(payload):
+                return encoded
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        indent=2,
+        sort_keys=True,
+        default=_encode_default,
+    ).encode("utf-8")
+
+
+def iter_json_artifact_chunks(payload: Any) -> Iterator[bytes]:
+    """Yield the bytes of `encode_json_artifact(payload)` in bounded pieces.
+
+    Top-level list values (chunks, translations, rewrites, ...) are encoded one
+    item at a time, so the full serialized document is never held in memory.
+    JSON strings cannot contain raw newlines, so nested items are re-indented
+    by prefixing each encoded line.
+    """
+
+    if (
+        not isinstance(payload, dict)
+        or not payload
+        or not all(isinstance(key, str) for key in payload)
+    ):
+        yield encode_json_artifact(payload)
+        return
+
+    yield b"{"
+    separator = b"\n"
+    for key in sorted(payload):
+        value = payload[key]
+        yield separator
+        separator = b",\n"
+        yield b"  " + json.dumps(key, ensure_ascii=False).encode("utf-8") + b": "
+        if isinstance(value, list) and value:
+            yield b"["
+            item_separator = b"\n    "
+            for item in value:
+                yield item_separator
+                item_separator = b",\n    "
+                yield encode_json_artifact(item).replace(b"\n", b"\n    ")
+            yield b"\n  ]"
+        else:
+            yield encode_json_artifact(value).replace(b"\n", b"\n  ")
+    yield b"\n}"
+
+
+def decode_json_artifact(data: bytes) -> Any:
+    """Decode UTF-8 JSON artifact bytes into Python values.
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid UTF-8 JSON.
+    """
+
+    if _orjson is not None:
+        return _orjson.loads(data)
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise json.JSONDecodeError(f"Invalid UTF-8 payload: {exc.reason}", "", 0) from exc
+    return json.loads(text)
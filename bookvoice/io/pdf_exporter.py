@@ -4,6 +4,7 @@ Responsibilities:
 - Render translated-document chapters into reader-friendly PDF pages.
 - Keep chapter ordering, output layout, and metadata deterministic.
 - Apply explicit unsupported-glyph fallback for non-Latin-1 characters.
+- Import `pypdf` only when a PDF is actually written.
 """
 
 from __future__ import annotations
@@ -13,9 +14,6 @@ from pathlib import Path
 import re
 from typing import Final
 
-from pypdf import PdfWriter
-from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
-
 from ..models.datatypes import TranslatedDocument, TranslatedDocumentChapter
 
 _A4_WIDTH: Final[float] = 595.276
@@ -59,7 +57,14 @@ class PdfExporter:
     """Render canonical translated-document payloads as deterministic PDF files."""
 
     def export(self, request: PdfExportRequest) -> Path:
-        """Write a deterministic PDF file and return the emitted path."""
+        """Write a deterministic PDF file and return the emitted path.
+
+        `pypdf` is imported here so that importing the pipeline does not pay its
+        start-up cost unless a PDF reader export is requested.
+        """
+
+        from pypdf import PdfWriter
+        from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
 
         request.output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -3,10 +3,13 @@
 Responsibilities:
 - Define minimal interface for extracting plain text from PDF inputs.
 - Support full-document extraction and page-wise extraction workflows.
+- Extract page-wise text in contiguous page ranges on parallel `pdftotext` workers.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import os
 import re
 import subprocess
 from pathlib import Path
@@ -18,6 +21,21 @@ class PdfExtractionError(RuntimeError):
     """Raised when text extraction from PDF cannot be completed."""
 
 
+def _contiguous_page_ranges(page_count: int, parts: int) -> list[tuple[int, int]]:
+    """Split pages `1..page_count` into at most `parts` contiguous inclusive ranges."""
+
+    parts = max(1, min(parts, page_count))
+    base, remainder = divmod(page_count, parts)
+    ranges: list[tuple[int, int]] = []
+    first = 1
+    for part in range(parts):
+        last = first + base + (1 if part < remainder else 0) - 1
+        if last >= first:
+            ranges.append((first, last))
+        first = last + 1
+    return ranges
+
+
 class PdfTextExtractor:
     """Extractor for text-based PDFs using the `pdftotext` tool."""
 
@@ -39,25 +57,42 @@ class PdfTextExtractor:
         return text
 
     def extract_pages(self, pdf_path: Path) -> list[str]:
-        """Extract text per page from a PDF file."""
+        """Extract text per page from a PDF file.
+
+        Pages are split into one contiguous range per CPU, and each range is
+        extracted by its own `pdftotext` process instead of one process per page.
+        """
 
         try:
             page_count = self._page_count(pdf_path)
+            page_ranges = _contiguous_page_ranges(page_count, os.cpu_count() or 1)
+            if len(page_ranges) <= 1:
+                range_pages = [
+                    self.extract_page_range(pdf_path, first, last) for first, last in page_ranges
+                ]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=len(page_ranges), thread_name_prefix="bookvoice-pdftotext"
+                ) as executor:
+                    range_pages = list(
+                        executor.map(
+                            lambda page_range: self.extract_page_range(pdf_path, *page_range),
+                            page_ranges,
+                        )
+                    )
         except PdfExtractionError as exc:
             if not self._is_missing_binary_error(exc):
                 raise
             return self._extract_pages_with_pypdf(pdf_path)
+        return [page for pages in range_pages for page in pages]
 
-        pages: list[str] = []
-        for page in range(1, page_count + 1):
-            try:
-                page_text = self._run_pdftotext(pdf_path, first_page=page, last_page=page)
-                pages.append(page_text.replace("\f", "\n").strip())
-            except PdfExtractionError as exc:
-                if not self._is_missing_binary_error(exc):
-                    raise
-                return self._extract_pages_with_pypdf(pdf_path)
-        return pages
+    def extract_page_range(self, pdf_path: Path, first_page: int, last_page: int) -> list[str]:
+        """Extract text for each page in the inclusive 1-based range with one `pdftotext` run."""
+
+        page_count = last_page - first_page + 1
+        output = self._run_pdftotext(pdf_path, first_page=first_page, last_page=last_page)
+        pages = [page.strip() for page in output.split("\f")[:page_count]]
+        return pages + [""] * (page_count - len(pages))
 
     def _run_pdftotext(
         self, pdf_path: Path, first_page: int | None = None, last_page: int | None = None
@@ -3,12 +3,30 @@
 Responsibilities:
 - Provide deterministic filesystem storage for text, JSON, and audio artifacts.
 - Offer lookup methods used by cache and resume flows.
+- Persist text and JSON artifacts on a background writer while later stages run.
+- Replace artifact files atomically so readers never see partial writes.
+- Encode large text artifacts in bounded slices to cap peak memory.
+- Coalesce streamed JSON pieces through a large write buffer.
+- Skip rewriting JSON artifacts whose persisted bytes already match the payload.
 """
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
 from pathlib import Path
+import threading
+from types import TracebackType
+from typing import BinaryIO
+
+from .json_codec import iter_json_artifact_chunks
+
+_TEXT_WRITE_SLICE_CHARS = 1 << 20
+"""Characters encoded per write when persisting text artifacts."""
+
+_JSON_WRITE_BUFFER_SIZE = 1 << 20
+"""File buffer size for streamed JSON artifacts, which arrive as many small pieces."""
 
 
 class ArtifactStore:
@@ -18,32 +36,43 @@ class ArtifactStore:
         """Initialize the store with a root output directory."""
 
         self.root = root
+        self._prepared_dirs: set[Path] = set()
+
+    def _write_path(self, relative_path: Path) -> Path:
+        """Resolve a write target and create its parent directory once per store."""
+
+        path = self.root / relative_path
+        parent = path.parent
+        if parent not in self._prepared_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._prepared_dirs.add(parent)
+        return path
 
     def save_text(self, relative_path: Path, content: str) -> Path:
         """Save text content and return final path."""
 
-        path = self.root / relative_path
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        path = self._write_path(relative_path)
+        _replace_file(path, content)
         return path
 
     def save_json(self, relative_path: Path, payload: dict[str, object]) -> Path:
-        """Save JSON-serializable payload and return final path."""
+        """Save JSON-serializable payload and return final path.
 
-        path = self.root / relative_path
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True),
-            encoding="utf-8",
-        )
+        Resumed runs re-save manifests and stage artifacts with identical
+        content, so an existing file whose bytes already match the encoded
+        payload is left untouched instead of being rewritten. The payload is
+        encoded once either way.
+        """
+
+        path = self._write_path(relative_path)
+        _replace_changed_file(path, iter_json_artifact_chunks(payload))
         return path
 
     def save_audio(self, relative_path: Path, data: bytes) -> Path:
         """Save audio bytes and return final path."""
 
-        path = self.root / relative_path
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(data)
+        path = self._write_path(relative_path)
+        _replace_file(path, data)
         return path
 
     def load_text(self, relative_path: Path) -> str:
@@ -56,3 +85,152 @@ class ArtifactStore:
         """Return whether the given artifact exists."""
 
         return (self.root / relative_path).exists()
+
+
+def _replace_file(path: Path, data: str | bytes | Iterable[bytes]) -> None:
+    """Write data to a sibling temporary file, then rename it over `path`.
+
+    Resume treats an existing artifact file as a completed stage, so an
+    interrupted write must never leave a truncated file at the final path.
+    Text is encoded in bounded slices and iterables of byte chunks are
+    written incrementally, so no full encoded copy of a large artifact is held.
+    Byte-chunk iterables go through a 1 MiB buffer so the per-item pieces of
+    large JSON artifacts reach the file in few `write` calls.
+    """
+
+    temporary = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        if isinstance(data, str):
+            with temporary.open("wb") as handle:
+                for start in range(0, len(data), _TEXT_WRITE_SLICE_CHARS):
+                    handle.write(
+                        data[start : start + _TEXT_WRITE_SLICE_CHARS].encode("utf-8")
+                    )
+        elif isinstance(data, bytes):
+            temporary.write_bytes(data)
+        else:
+            with temporary.open("wb", buffering=_JSON_WRITE_BUFFER_SIZE) as handle:
+                handle.writelines(data)
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def _replace_changed_file(path: Path, chunks: Iterable[bytes]) -> None:
+    """Replace `path` with the concatenated byte chunks unless it already holds them.
+
+    Chunks are compared against the existing file as they are produced, so
+    identical content is never written. On the first difference the verified
+    prefix is copied back from the existing file and the remaining chunks are
+    written after it, so no chunk is produced twice.
+    """
+
+    try:
+        existing = path.open("rb", buffering=_JSON_WRITE_BUFFER_SIZE)
+    except OSError:
+        _replace_file(path, chunks)
+        return
+    with existing:
+        pending = iter(chunks)
+        matched_length = 0
+        for chunk in pending:
+            if existing.read(len(chunk)) != chunk:
+                _replace_file(
+                    path, _chunks_after_prefix(existing, matched_length, chunk, pending)
+                )
+                return
+            matched_length += len(chunk)
+        if existing.read(1):
+            _replace_file(path, _chunks_after_prefix(existing, matched_length, b"", pending))
+
+
+def _chunks_after_prefix(
+    existing: BinaryIO, prefix_length: int, chunk: bytes, pending: Iterator[bytes]
+) -> Iterator[bytes]:
+    """Yield the first `prefix_length` bytes of `existing`, then `chunk` and `pending`.
+
+    `existing` is closed once its prefix is copied, so the file can be replaced.
+    """
+
+    existing.seek(0)
+    remaining = prefix_length
+    while remaining > 0:
+        block = existing.read(min(_JSON_WRITE_BUFFER_SIZE, remaining))
+        if not block:
+            raise OSError(f"Artifact changed while it was being rewritten: {existing.name}")
+        remaining -= len(block)
+        yield block
+    existing.close()
+    yield chunk
+    yield from pending
+
+
+class DeferredArtifactWriter:
+    """Persist text and JSON artifacts on one background thread in submission order.
+
+    Artifact paths are returned immediately so callers can keep building
+    manifest metadata; `flush` (or leaving the context manager) waits for all
+    pending writes and re-raises the first write failure.
+    """
+
+    def __init__(self, store: ArtifactStore) -> None:
+        """Initialize the writer for one artifact store."""
+
+        self.store = store
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="bookvoice-artifacts"
+        )
+        self._pending: list[Future[Path]] = []
+
+    def save_text(self, relative_path: Path, content: str) -> Path:
+        """Queue a text artifact write and return its final path."""
+
+        self._pending.append(
+            self._executor.submit(self.store.save_text, relative_path, content)
+        )
+        return self.store.root / relative_path
+
+    def save_json(self, relative_path: Path, payload: dict[str, object]) -> Path:
+        """Queue a JSON artifact write and return its final path."""
+
+        self._pending.append(
+            self._executor.submit(self.store.save_json, relative_path, payload)
+        )
+        return self.store.root / relative_path
+
+    def flush(self) -> None:
+        """Wait for queued writes and re-raise the first failure, if any."""
+
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        """Flush queued writes and stop the background thread."""
+
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> DeferredArtifactWriter:
+        """Return the writer for use as a context manager."""
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush queued writes; keep an in-flight exception as the primary error."""
+
+        if exc_type is None:
+            self.close()
+            return
+        try:
+            self.close()
+        except Exception:
+            pass
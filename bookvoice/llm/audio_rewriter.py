@@ -33,35 +33,44 @@ class AudioRewriter:
         api_key: str | None = None,
         response_cache: ResponseCache | None = None,
         rate_limiter: RateLimiter | None = None,
+        max_connections: int = 1,
     ) -> None:
         """Initialize OpenAI-backed rewrite settings."""
 
         self.model = model
         self.provider_id = provider_id
         self.cache = response_cache if response_cache is not None else ResponseCache()
-        self.client = OpenAIChatClient(api_key=api_key, rate_limiter=rate_limiter)
+        self.client = OpenAIChatClient(
+            api_key=api_key, rate_limiter=rate_limiter, max_connections=max_connections
+        )
         self.prompts = PromptLibrary()
 
     def rewrite(self, translation: TranslationResult) -> RewriteResult:
-        """Rewrite translated text with OpenAI chat-completions."""
+        """Rewrite translated text with OpenAI chat-completions.
+
+        Cache keys cover the rendered prompts, so prompt changes never reuse
+        responses persisted by earlier versions.
+        """
 
+        system_prompt = self.prompts.rewrite_system_prompt()
+        user_prompt = self.prompts.rewrite_for_audio_prompt(
+            translated_text=translation.translated_text
+        )
         cache_key = self.cache.make_key(
             provider=self.provider_id,
             model=self.model,
             operation="rewrite",
-            input_identity={"translated_text": translation.translated_text},
+            input_identity={"system_prompt": system_prompt, "user_prompt": user_prompt},
         )
-        rewritten_text = self.cache.get(cache_key)
-        if rewritten_text is None:
-            rewritten_text = self.client.chat_completion_text(
+        rewritten_text = self.cache.get_or_compute(
+            cache_key,
+            lambda: self.client.chat_completion_text(
                 model=self.model,
-                system_prompt=self.prompts.rewrite_system_prompt(),
-                user_prompt=self.prompts.rewrite_for_audio_prompt(
-                    translated_text=translation.translated_text
-                ),
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
                 temperature=0.0,
-            )
-            self.cache.set(cache_key, rewritten_text)
+            ),
+        )
         return RewriteResult(
             translation=translation,
             rewritten_text=rewritten_text,
@@ -87,6 +96,11 @@ class AudioRewriter:
 
         return self.client.retry_attempt_count
 
+    def close(self) -> None:
+        """Close the underlying provider client's HTTP session."""
+
+        self.client.close()
+
 
 class DeterministicBypassRewriter:
     """Deterministic rewrite bypass that returns translated text unchanged."""
@@ -4,13 +4,20 @@ Responsibilities:
 - Build stable cache keys from provider/model/operation and normalized identity input.
 - Reuse cached responses for repeated deterministic prompts within one run.
 - Track basic cache telemetry (hits/misses) for manifest diagnostics.
+- Keep lookups and telemetry consistent across concurrent provider workers.
+- Compute each missing response once even when workers request it concurrently.
+- Optionally persist responses in a SQLite file so later runs skip paid provider calls.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from hashlib import sha256
 import json
+from pathlib import Path
+import sqlite3
+from threading import Lock
 from typing import Any
 
 
@@ -29,13 +36,108 @@ def _normalize_identity_value(value: Any) -> Any:
     return value
 
 
+RESPONSE_CACHE_FILENAME = "responses.sqlite3"
+"""Database file name used inside a configured response cache directory."""
+
+
+class ResponseCacheStore:
+    """SQLite-backed persistent store for cached provider responses.
+
+    The database is opened lazily on first use. Any SQLite failure disables the
+    store for the rest of its lifetime, so a broken or read-only cache file only
+    costs provider calls and never fails a run.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the store for a database file path."""
+
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._disabled = False
+        self._lock = Lock()
+
+    def get(self, cache_key: str) -> str | None:
+        """Return the persisted response for a key, or `None` when absent."""
+
+        with self._lock:
+            connection = self._open()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    "SELECT value FROM responses WHERE key = ?", (cache_key,)
+                ).fetchone()
+            except sqlite3.Error:
+                self._disable()
+                return None
+        return row[0] if row is not None else None
+
+    def set(self, cache_key: str, value: str) -> None:
+        """Persist a response under a key, replacing any previous value."""
+
+        with self._lock:
+            connection = self._open()
+            if connection is None:
+                return
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                        (cache_key, value),
+                    )
+            except sqlite3.Error:
+                self._disable()
+
+    def close(self) -> None:
+        """Close the underlying database connection, if open."""
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _open(self) -> sqlite3.Connection | None:
+        """Return the open connection, creating the database on first use."""
+
+        if self._connection is not None or self._disabled:
+            return self._connection
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+                )
+        except (OSError, sqlite3.Error):
+            self._disabled = True
+            return None
+        self._connection = connection
+        return connection
+
+    def _disable(self) -> None:
+        """Close the connection and stop using the store after a SQLite failure."""
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._disabled = True
+
+
 @dataclass(slots=True)
 class ResponseCache:
-    """In-memory deterministic cache keyed by provider/model/operation/input identity."""
+    """In-memory deterministic cache keyed by provider/model/operation/input identity.
+
+    When a `store` is attached, memory misses fall back to it and new responses
+    are written through, so entries survive across runs.
+    """
 
     entries: dict[str, str] = field(default_factory=dict)
+    store: ResponseCacheStore | None = None
     hits: int = 0
     misses: int = 0
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+    _key_locks: dict[str, Lock] = field(default_factory=dict, repr=False, compare=False)
 
     @staticmethod
     def make_key(
@@ -54,7 +156,9 @@ class ResponseCache:
             ensure_ascii=True,
             separators=(",", ":"),
         )
-        identity_hash = sha256(canonical_identity.encode("utf-8")).hexdigest()
+        identity_hash = sha256(
+            canonical_identity.encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
         normalized_provider = provider.strip().lower()
         normalized_model = model.strip()
         normalized_operation = operation.strip().lower()
@@ -66,16 +170,42 @@ class ResponseCache:
     def get(self, cache_key: str) -> str | None:
         """Return cached response for key and update hit/miss telemetry counters."""
 
-        if cache_key in self.entries:
-            self.hits += 1
-            return self.entries[cache_key]
-        self.misses += 1
-        return None
+        with self._lock:
+            cached = self.entries.get(cache_key)
+            if cached is None and self.store is not None:
+                cached = self.store.get(cache_key)
+                if cached is not None:
+                    self.entries[cache_key] = cached
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+            return None
 
     def set(self, cache_key: str, value: str) -> None:
         """Store a response payload under a cache key."""
 
-        self.entries[cache_key] = value
+        with self._lock:
+            self.entries[cache_key] = value
+            if self.store is not None:
+                self.store.set(cache_key, value)
+
+    def get_or_compute(self, cache_key: str, compute: Callable[[], str]) -> str:
+        """Return cached response for key, computing and storing it on a miss.
+
+        Concurrent callers for the same key wait for the first computation and
+        then count as hits, so provider calls and telemetry match a sequential run.
+        """
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(cache_key, Lock())
+        with key_lock:
+            cached = self.get(cache_key)
+            if cached is not None:
+                return cached
+            value = compute()
+            self.set(cache_key, value)
+            return value
 
     def hit_rate(self) -> float:
         """Return cache hit rate for current cache lifecycle."""
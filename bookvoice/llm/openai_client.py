@@ -4,6 +4,7 @@ Responsibilities:
 - Send minimal chat-completions and speech requests to OpenAI's REST API.
 - Normalize response extraction for deterministic stage integrations.
 - Raise actionable provider exceptions for pipeline-level error mapping.
+- Reuse one pooled HTTP session per client, sized to the stage's provider concurrency.
 """
 
 from __future__ import annotations
@@ -11,10 +12,12 @@ from __future__ import annotations
 import json
 import re
 import socket
+from threading import Lock
 import time
 from typing import Any
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from .rate_limiter import RateLimiter
 
@@ -38,6 +41,21 @@ class OpenAIProviderError(RuntimeError):
         self.provider_code = provider_code
 
 
+def _pooled_http_session(max_connections: int) -> requests.Session:
+    """Return an HTTP session whose connection pool holds `max_connections` per host.
+
+    Stage clients are shared by up to `provider_concurrency` worker threads,
+    so the pool is sized to that concurrency instead of the `requests` default
+    and concurrent requests never have to discard connections.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=max(DEFAULT_POOLSIZE, max_connections))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class _OpenAIBaseClient:
     """Shared OpenAI HTTP settings and helpers used by stage-specific clients."""
 
@@ -53,8 +71,13 @@ class _OpenAIBaseClient:
         max_retries: int = 2,
         retry_backoff_base_seconds: float = 0.5,
         retry_backoff_max_seconds: float = 4.0,
+        max_connections: int = 1,
     ) -> None:
-        """Initialize OpenAI HTTP client settings."""
+        """Initialize OpenAI HTTP client settings.
+
+        `max_connections` sizes the client's connection pool for the number of
+        worker threads that issue requests through it concurrently.
+        """
 
         self.api_key = api_key.strip() if isinstance(api_key, str) else ""
         self.base_url = base_url.rstrip("/")
@@ -67,6 +90,8 @@ class _OpenAIBaseClient:
             float(retry_backoff_max_seconds),
         )
         self._retry_attempt_count = 0
+        self._retry_count_lock = Lock()
+        self._http_session = _pooled_http_session(max_connections)
 
     @property
     def retry_attempt_count(self) -> int:
@@ -74,6 +99,17 @@ class _OpenAIBaseClient:
 
         return self._retry_attempt_count
 
+    def close(self) -> None:
+        """Close the client's HTTP session and its pooled connections."""
+
+        self._http_session.close()
+
+    def _record_retry_attempt(self) -> None:
+        """Count one retry attempt; clients may be shared by provider worker threads."""
+
+        with self._retry_count_lock:
+            self._retry_attempt_count += 1
+
     def _require_api_key(self) -> None:
         """Require API key presence before issuing OpenAI requests."""
 
@@ -104,7 +140,7 @@ class _OpenAIBaseClient:
         while True:
             self.rate_limiter.acquire(request_key)
             try:
-                response = requests.post(
+                response = self._http_session.post(
                     endpoint,
                     headers=headers,
                     json=payload,
@@ -117,7 +153,7 @@ class _OpenAIBaseClient:
                 if not self._should_retry_provider_error(provider_error) or attempt >= self.max_retries:
                     raise provider_error from exc
                 attempt += 1
-                self._retry_attempt_count += 1
+                self._record_retry_attempt()
                 time.sleep(self._retry_delay_seconds(attempt))
                 continue
             except requests.RequestException as exc:
@@ -133,7 +169,7 @@ class _OpenAIBaseClient:
                 if not self._should_retry_provider_error(provider_error) or attempt >= self.max_retries:
                     raise provider_error from exc
                 attempt += 1
-                self._retry_attempt_count += 1
+                self._record_retry_attempt()
                 time.sleep(self._retry_delay_seconds(attempt))
                 continue
             except TimeoutError as exc:
@@ -144,7 +180,7 @@ class _OpenAIBaseClient:
                 if not self._should_retry_provider_error(provider_error) or attempt >= self.max_retries:
                     raise provider_error from exc
                 attempt += 1
-                self._retry_attempt_count += 1
+                self._record_retry_attempt()
                 time.sleep(self._retry_delay_seconds(attempt))
                 continue
             except Exception as exc:
@@ -155,7 +191,7 @@ class _OpenAIBaseClient:
                 if not self._should_retry_provider_error(provider_error) or attempt >= self.max_retries:
                     raise provider_error from exc
                 attempt += 1
-                self._retry_attempt_count += 1
+                self._record_retry_attempt()
                 time.sleep(self._retry_delay_seconds(attempt))
                 continue
 
@@ -3,11 +3,13 @@
 Responsibilities:
 - Provide a single hook to enforce provider request pacing.
 - Keep retry/rate-limit policy independent from provider adapters.
+- Stay safe to share between concurrent provider worker threads.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from threading import Lock
 from time import monotonic, sleep
 from typing import Callable
 
@@ -20,16 +22,21 @@ class RateLimiter:
     clock: Callable[[], float] = monotonic
     sleeper: Callable[[float], None] = sleep
     _next_allowed_at: dict[str, float] = field(default_factory=dict)
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
 
     def acquire(self, key: str) -> None:
-        """Block until request key is allowed under deterministic interval policy."""
+        """Block until request key is allowed under deterministic interval policy.
+
+        The start slot is reserved under a lock and the wait happens outside it,
+        so concurrent callers on one key are spaced by the minimum interval.
+        """
 
         if self.min_interval_seconds <= 0.0:
             return
-        now = self.clock()
-        next_allowed = self._next_allowed_at.get(key, 0.0)
-        wait_seconds = next_allowed - now
+        with self._lock:
+            now = self.clock()
+            start_at = max(now, self._next_allowed_at.get(key, 0.0))
+            self._next_allowed_at[key] = start_at + self.min_interval_seconds
+        wait_seconds = start_at - now
         if wait_seconds > 0.0:
             self.sleeper(wait_seconds)
-            now = self.clock()
-        self._next_allowed_at[key] = now + self.min_interval_seconds
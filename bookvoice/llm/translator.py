@@ -33,39 +33,45 @@ class OpenAITranslator:
         api_key: str | None = None,
         response_cache: ResponseCache | None = None,
         rate_limiter: RateLimiter | None = None,
+        max_connections: int = 1,
     ) -> None:
         """Initialize translator settings and OpenAI client dependencies."""
 
         self.model = model
         self.provider_id = provider_id
         self.cache = response_cache if response_cache is not None else ResponseCache()
-        self.client = OpenAIChatClient(api_key=api_key, rate_limiter=rate_limiter)
+        self.client = OpenAIChatClient(
+            api_key=api_key, rate_limiter=rate_limiter, max_connections=max_connections
+        )
         self.prompts = PromptLibrary()
 
     def translate(self, chunk: Chunk, target_language: str) -> TranslationResult:
-        """Translate one chunk with OpenAI chat-completions and return stage metadata."""
+        """Translate one chunk with OpenAI chat-completions and return stage metadata.
+
+        Cache keys cover the rendered prompts, so prompt changes never reuse
+        responses persisted by earlier versions.
+        """
 
+        system_prompt = self.prompts.translation_system_prompt()
+        user_prompt = self.prompts.translate_prompt(
+            source_text=chunk.text,
+            target_language=target_language,
+        )
         cache_key = self.cache.make_key(
             provider=self.provider_id,
             model=self.model,
             operation="translate",
-            input_identity={
-                "target_language": target_language,
-                "source_text": chunk.text,
-            },
+            input_identity={"system_prompt": system_prompt, "user_prompt": user_prompt},
         )
-        translated_text = self.cache.get(cache_key)
-        if translated_text is None:
-            translated_text = self.client.chat_completion_text(
+        translated_text = self.cache.get_or_compute(
+            cache_key,
+            lambda: self.client.chat_completion_text(
                 model=self.model,
-                system_prompt=self.prompts.translation_system_prompt(),
-                user_prompt=self.prompts.translate_prompt(
-                    source_text=chunk.text,
-                    target_language=target_language,
-                ),
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
                 temperature=0.0,
-            )
-            self.cache.set(cache_key, translated_text)
+            ),
+        )
         return TranslationResult(
             chunk=chunk,
             translated_text=translated_text,
@@ -90,3 +96,8 @@ class OpenAITranslator:
         """Return retry attempt count performed by underlying provider client."""
 
         return self.client.retry_attempt_count
+
+    def close(self) -> None:
+        """Close the underlying provider client's HTTP session."""
+
+        self.client.close()
@@ -4,16 +4,25 @@ Responsibilities:
 - Build deterministic JSON payloads persisted by pipeline stages.
 - Load artifact JSON payloads into typed dataclass structures.
 - Provide manifest payload serialization helpers.
+- Reuse typed artifact lists per process while the artifact file is unchanged.
+- Load chapters, chapter metadata, and normalized structure from one parse.
+- Load chunks together with their chunking metadata from one parse.
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict
+from collections import OrderedDict
+from functools import partial, wraps
 import json
+from operator import attrgetter, itemgetter
+import os
 from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Iterator, Sequence, TypeVar
 
 from ..config import ProviderRuntimeConfig
 from ..errors import PipelineStageError
+from ..io.json_codec import decode_json_artifact
 from ..models.datatypes import (
     AudioPart,
     Chapter,
@@ -27,6 +36,134 @@ from ..models.datatypes import (
     TranslationResult,
 )
 
+# Run-root relative artifact locations shared by pipeline writers and resume.
+RAW_TEXT_REL_PATH = Path("text/raw.txt")
+SOURCE_DIGEST_REL_PATH = Path("text/source_digest.json")
+CLEAN_TEXT_REL_PATH = Path("text/clean.txt")
+CHAPTERS_REL_PATH = Path("text/chapters.json")
+CHUNKS_REL_PATH = Path("text/chunks.json")
+TRANSLATIONS_REL_PATH = Path("text/translations.json")
+TRANSLATED_DOCUMENT_REL_PATH = Path("text/translated_document.json")
+REWRITES_REL_PATH = Path("text/rewrites.json")
+AUDIO_PARTS_REL_PATH = Path("audio/parts.json")
+PACKAGED_AUDIO_REL_PATH = Path("audio/packaged.json")
+AUDIO_CHUNKS_REL_DIR = Path("audio/chunks")
+AUDIO_PACKAGE_REL_DIR = Path("audio/package")
+MERGED_AUDIO_REL_PATH = Path("audio/bookvoice_merged.wav")
+RUN_MANIFEST_REL_PATH = Path("run_manifest.json")
+
+ChunkPayloadMemo = dict[Chunk, dict[str, object]]
+"""Per-run memo of serialized chunk mappings shared by artifact payload builders."""
+
+TranslationPayloadMemo = dict[TranslationResult, dict[str, object]]
+"""Per-run memo of serialized translation mappings shared by translation and rewrite payloads."""
+
+_CHUNK_REQUIRED_FIELDS = itemgetter(
+    "chapter_index", "chunk_index", "text", "char_start", "char_end"
+)
+_CHAPTER_FIELDS = itemgetter("index", "title", "text")
+_STRUCTURE_UNIT_REQUIRED_FIELDS = itemgetter(
+    "order_index", "chapter_index", "chapter_title", "text", "char_start", "char_end", "source"
+)
+_TRANSLATION_ITEM_FIELDS = itemgetter("chunk", "translated_text", "provider", "model")
+_REWRITE_ITEM_FIELDS = itemgetter("translation", "rewritten_text", "provider", "model")
+_AUDIO_PART_ORDER_KEY = attrgetter("chapter_index", "chunk_index")
+_AUDIO_PART_REQUIRED_FIELDS = itemgetter(
+    "chapter_index", "chunk_index", "path", "duration_seconds"
+)
+_MALFORMED_ITEM_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+"""Errors raised while unpacking an artifact item that is not a well-formed mapping."""
+
+_CORRUPTED_ARTIFACT_HINT = "Delete the corrupted artifact and run `bookvoice resume` again."
+_CHAPTERS_HINT = "Delete chapters artifact and rerun `bookvoice resume`."
+_CHUNKS_HINT = "Delete chunks artifact and rerun `bookvoice resume`."
+_TRANSLATIONS_HINT = "Delete translations artifact and rerun `bookvoice resume`."
+_TRANSLATED_DOCUMENT_HINT = (
+    "Regenerate translated-document artifact via `bookvoice translate-only`."
+)
+_REWRITES_HINT = "Delete rewrites artifact and rerun `bookvoice resume`."
+_AUDIO_PARTS_HINT = "Delete audio parts artifact and rerun `bookvoice resume`."
+_PACKAGED_HINT = "Delete packaged artifact and rerun `bookvoice resume`."
+
+
+def _artifact_error(detail: str, hint: str) -> PipelineStageError:
+    """Build a `resume-artifacts` stage error for a malformed persisted artifact."""
+
+    return PipelineStageError(stage="resume-artifacts", detail=detail, hint=hint)
+
+
+def chunk_payload(chunk: Chunk) -> dict[str, object]:
+    """Serialize one chunk into its artifact mapping without `asdict` recursion."""
+
+    return {
+        "chapter_index": chunk.chapter_index,
+        "chunk_index": chunk.chunk_index,
+        "text": chunk.text,
+        "char_start": chunk.char_start,
+        "char_end": chunk.char_end,
+        "part_index": chunk.part_index,
+        "part_title": chunk.part_title,
+        "part_id": chunk.part_id,
+        "source_order_indices": list(chunk.source_order_indices),
+        "boundary_strategy": chunk.boundary_strategy,
+    }
+
+
+def memoized_chunk_payload(
+    chunk: Chunk, memo: ChunkPayloadMemo | None
+) -> dict[str, object]:
+    """Return the serialized chunk mapping, reusing a memoized entry when available."""
+
+    if memo is None:
+        return chunk_payload(chunk)
+    payload = memo.get(chunk)
+    if payload is None:
+        payload = chunk_payload(chunk)
+        memo[chunk] = payload
+    return payload
+
+
+def memoized_translation_payload(
+    translation: TranslationResult,
+    chunk_payloads: ChunkPayloadMemo | None,
+    translation_payloads: TranslationPayloadMemo | None,
+) -> dict[str, object]:
+    """Return the serialized translation mapping, reusing a memoized entry when available."""
+
+    payload = translation_payloads.get(translation) if translation_payloads is not None else None
+    if payload is None:
+        payload = {
+            "chunk": memoized_chunk_payload(translation.chunk, chunk_payloads),
+            "translated_text": translation.translated_text,
+            "provider": translation.provider,
+            "model": translation.model,
+        }
+        if translation_payloads is not None:
+            translation_payloads[translation] = payload
+    return payload
+
+
+def chapter_payload(chapter: Chapter) -> dict[str, object]:
+    """Serialize one chapter into its artifact mapping without `asdict` recursion."""
+
+    return {"index": chapter.index, "title": chapter.title, "text": chapter.text}
+
+
+def structure_unit_payload(unit: ChapterStructureUnit) -> dict[str, object]:
+    """Serialize one normalized structure unit without `asdict` recursion."""
+
+    return {
+        "order_index": unit.order_index,
+        "chapter_index": unit.chapter_index,
+        "chapter_title": unit.chapter_title,
+        "subchapter_index": unit.subchapter_index,
+        "subchapter_title": unit.subchapter_title,
+        "text": unit.text,
+        "char_start": unit.char_start,
+        "char_end": unit.char_end,
+        "source": unit.source,
+    }
+
 
 def chapter_artifact_payload(
     chapters: list[Chapter],
@@ -44,13 +181,15 @@ def chapter_artifact_payload(
         ),
     }
     return {
-        "chapters": [asdict(chapter) for chapter in chapters],
+        "chapters": [chapter_payload(chapter) for chapter in chapters],
         "metadata": {
             "source": source,
             "fallback_reason": fallback_reason,
             "normalization": normalization_metadata,
             "chapter_scope": chapter_scope,
-            "normalized_structure": [asdict(unit) for unit in normalized_structure],
+            "normalized_structure": [
+                structure_unit_payload(unit) for unit in normalized_structure
+            ],
         },
     }
 
@@ -59,11 +198,12 @@ def chunk_artifact_payload(
     chunks: list[Chunk],
     chapter_scope: dict[str, str],
     planner_metadata: dict[str, object],
+    chunk_payloads: ChunkPayloadMemo | None = None,
 ) -> dict[str, object]:
     """Build chunk artifact payload with chapter scope and planner metadata."""
 
     return {
-        "chunks": [asdict(chunk) for chunk in chunks],
+        "chunks": [memoized_chunk_payload(chunk, chunk_payloads) for chunk in chunks],
         "metadata": {
             "chapter_scope": chapter_scope,
             **planner_metadata,
@@ -97,17 +237,14 @@ def translation_artifact_payload(
     translations: list[TranslationResult],
     chapter_scope: dict[str, str],
     runtime_config: ProviderRuntimeConfig,
+    chunk_payloads: ChunkPayloadMemo | None = None,
+    translation_payloads: TranslationPayloadMemo | None = None,
 ) -> dict[str, object]:
     """Build deterministic translation artifact payload with runtime metadata."""
 
     return {
         "translations": [
-            {
-                "chunk": asdict(item.chunk),
-                "translated_text": item.translated_text,
-                "provider": item.provider,
-                "model": item.model,
-            }
+            memoized_translation_payload(item, chunk_payloads, translation_payloads)
             for item in translations
         ],
         "metadata": {
@@ -122,18 +259,21 @@ def rewrite_artifact_payload(
     rewrites: list[RewriteResult],
     chapter_scope: dict[str, str],
     runtime_config: ProviderRuntimeConfig,
+    chunk_payloads: ChunkPayloadMemo | None = None,
+    translation_payloads: TranslationPayloadMemo | None = None,
 ) -> dict[str, object]:
-    """Build deterministic rewrite artifact payload with runtime metadata."""
+    """Build deterministic rewrite artifact payload with runtime metadata.
+
+    Nested translation mappings are shared with the translations artifact
+    payload through `translation_payloads`.
+    """
 
     return {
         "rewrites": [
             {
-                "translation": {
-                    "chunk": asdict(item.translation.chunk),
-                    "translated_text": item.translation.translated_text,
-                    "provider": item.translation.provider,
-                    "model": item.translation.model,
-                },
+                "translation": memoized_translation_payload(
+                    item.translation, chunk_payloads, translation_payloads
+                ),
                 "rewritten_text": item.rewritten_text,
                 "provider": item.provider,
                 "model": item.model,
@@ -194,26 +334,31 @@ def audio_parts_artifact_payload(
     chapter_scope: dict[str, str],
     runtime_config: ProviderRuntimeConfig,
 ) -> dict[str, object]:
-    """Build deterministic audio-parts artifact payload with provider metadata."""
+    """Build deterministic audio-parts artifact payload with provider metadata.
+
+    The chapter/part map reuses values from the already-serialized part entries
+    instead of re-deriving filenames and source-order lists per part.
+    """
 
+    parts_payload: list[dict[str, object]] = [
+        {
+            "chapter_index": item.chapter_index,
+            "chunk_index": item.chunk_index,
+            "part_index": item.part_index,
+            "part_title": item.part_title,
+            "part_id": item.part_id,
+            "source_order_indices": list(item.source_order_indices),
+            "filename": item.path.name,
+            "path": str(item.path),
+            "duration_seconds": item.duration_seconds,
+            "provider": item.provider,
+            "model": item.model,
+            "voice": item.voice,
+        }
+        for item in audio_parts
+    ]
     return {
-        "audio_parts": [
-            {
-                "chapter_index": item.chapter_index,
-                "chunk_index": item.chunk_index,
-                "part_index": item.part_index,
-                "part_title": item.part_title,
-                "part_id": item.part_id,
-                "source_order_indices": list(item.source_order_indices),
-                "filename": item.path.name,
-                "path": str(item.path),
-                "duration_seconds": item.duration_seconds,
-                "provider": item.provider,
-                "model": item.model,
-                "voice": item.voice,
-            }
-            for item in audio_parts
-        ],
+        "audio_parts": parts_payload,
         "metadata": {
             "chapter_scope": chapter_scope,
             "provider": runtime_config.tts_provider,
@@ -221,29 +366,31 @@ def audio_parts_artifact_payload(
             "voice": runtime_config.tts_voice,
             "chapter_part_map": [
                 {
-                    "chapter_index": part.chapter_index,
-                    "part_index": part.part_index,
-                    "part_id": part.part_id,
-                    "source_order_indices": list(part.source_order_indices),
-                    "filename": part.path.name,
+                    "chapter_index": entry["chapter_index"],
+                    "part_index": entry["part_index"],
+                    "part_id": entry["part_id"],
+                    "source_order_indices": entry["source_order_indices"],
+                    "filename": entry["filename"],
                 }
-                for part in audio_parts
+                for entry in parts_payload
             ],
         },
     }
 
 
 def part_mapping_manifest_metadata(audio_parts: list[AudioPart]) -> dict[str, str]:
-    """Build compact manifest metadata for chapter/part and source references."""
-
-    chapter_part_map_entries = [
-        f"{item.chapter_index}:{item.part_index if item.part_index is not None else item.chunk_index + 1}"
-        for item in sorted(audio_parts, key=lambda part: (part.chapter_index, part.chunk_index))
-    ]
-    part_filename_entries = [
-        item.path.name
-        for item in sorted(audio_parts, key=lambda part: (part.chapter_index, part.chunk_index))
-    ]
+    """Build compact manifest metadata for chapter/part and source references.
+
+    Parts are ordered once by chapter and chunk index; both CSV lists come
+    from that single ordered walk.
+    """
+
+    chapter_part_map_entries: list[str] = []
+    part_filename_entries: list[str] = []
+    for item in sorted(audio_parts, key=_AUDIO_PART_ORDER_KEY):
+        part_number = item.part_index if item.part_index is not None else item.chunk_index + 1
+        chapter_part_map_entries.append(f"{item.chapter_index}:{part_number}")
+        part_filename_entries.append(item.path.name)
     referenced_unit_indices: list[int] = sorted(
         {
             index
@@ -290,7 +437,11 @@ def packaged_audio_artifact_payload(
 
 
 def manifest_payload(manifest: RunManifest) -> dict[str, object]:
-    """Serialize a run manifest into a JSON-safe payload."""
+    """Serialize a run manifest into a JSON-safe payload.
+
+    Extra metadata is copied in one pass with keys and values coerced to the
+    declared string types, so the payload never aliases the manifest mapping.
+    """
 
     return {
         "run_id": manifest.run_id,
@@ -307,7 +458,7 @@ def manifest_payload(manifest: RunManifest) -> dict[str, object]:
         "total_llm_cost_usd": manifest.total_llm_cost_usd,
         "total_tts_cost_usd": manifest.total_tts_cost_usd,
         "total_cost_usd": manifest.total_cost_usd,
-        "extra": json.loads(json.dumps(dict(manifest.extra))),
+        "extra": {str(key): str(value) for key, value in manifest.extra.items()},
     }
 
 
@@ -315,55 +466,117 @@ def load_json_object(path: Path) -> dict[str, object]:
     """Load an artifact JSON file and validate object root shape."""
 
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = decode_json_artifact(path.read_bytes())
     except json.JSONDecodeError as exc:
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact JSON is invalid: {path}",
-            hint="Delete the corrupted artifact and run `bookvoice resume` again.",
+        raise _artifact_error(
+            f"Artifact JSON is invalid: {path}", _CORRUPTED_ARTIFACT_HINT
         ) from exc
     if not isinstance(payload, dict):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact JSON must be an object: {path}",
-            hint="Delete the corrupted artifact and run `bookvoice resume` again.",
-        )
+        raise _artifact_error(f"Artifact JSON must be an object: {path}", _CORRUPTED_ARTIFACT_HINT)
     return payload
 
 
+_ItemT = TypeVar("_ItemT")
+_LoadedT = TypeVar("_LoadedT")
+_FrozenT = TypeVar("_FrozenT")
+_ArtifactStatKey = tuple[str, int, int, int]
+_ChapterArtifact = tuple[list[Chapter], dict[str, str], list[ChapterStructureUnit]]
+_FrozenChapterArtifact = tuple[
+    tuple[Chapter, ...], tuple[tuple[str, str], ...], tuple[ChapterStructureUnit, ...]
+]
+
+_LOADED_ARTIFACT_CACHE_SIZE = 32
+"""Per-loader number of artifact files whose typed items stay cached."""
+
+
+def _stat_cached(
+    loader: Callable[[Path], _LoadedT],
+    freeze: Callable[[_LoadedT], _FrozenT],
+    thaw: Callable[[_FrozenT], _LoadedT],
+) -> Callable[[Path], _LoadedT]:
+    """Cache an artifact loader by the file's path, inode, mtime, and size.
+
+    Resume validation and the resume stage helpers load the same artifacts, and
+    long-running processes may resume one run repeatedly. The cache stores the
+    `freeze`d result and every hit returns a fresh `thaw`ed copy, so callers may
+    mutate what they receive. Rewriting an artifact (including the atomic
+    replace used by `ArtifactStore`) changes its stat key and evicts the stale
+    entry.
+    """
+
+    cache: OrderedDict[_ArtifactStatKey, _FrozenT] = OrderedDict()
+    lock = Lock()
+
+    @wraps(loader)
+    def cached_loader(path: Path) -> _LoadedT:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return loader(path)
+        key = (
+            os.path.abspath(path),
+            stat_result.st_ino,
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+        )
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return thaw(cache[key])
+        loaded = loader(path)
+        with lock:
+            for stale_key in [cached_key for cached_key in cache if cached_key[0] == key[0]]:
+                del cache[stale_key]
+            cache[key] = freeze(loaded)
+            while len(cache) > _LOADED_ARTIFACT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return loaded
+
+    return cached_loader
+
+
+def _stat_cached_loader(
+    loader: Callable[[Path], list[_ItemT]],
+) -> Callable[[Path], list[_ItemT]]:
+    """Cache a typed list loader; items are frozen dataclasses shared across hits."""
+
+    return _stat_cached(loader, tuple, list)
+
+
 def load_chapters(path: Path) -> list[Chapter]:
-    """Load chapter artifacts from JSON."""
+    """Load chapter artifacts from JSON via `load_chapter_artifact`."""
+
+    return load_chapter_artifact(path)[0]
+
+
+def _chapters_from_artifact_payload(payload: dict[str, object], path: Path) -> list[Chapter]:
+    """Deserialize the `chapters` list of a parsed chapter artifact."""
 
-    payload = load_json_object(path)
     items = payload.get("chapters")
     if not isinstance(items, list):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact missing `chapters` list: {path}",
-            hint="Delete chapters artifact and rerun `bookvoice resume`.",
-        )
-    chapters: list[Chapter] = []
-    for item in items:
-        if not isinstance(item, dict):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Malformed chapter item in {path}",
-                hint="Delete chapters artifact and rerun `bookvoice resume`.",
-            )
-        chapters.append(
-            Chapter(
-                index=int(item["index"]),
-                title=str(item["title"]),
-                text=str(item["text"]),
-            )
-        )
-    return chapters
+        raise _artifact_error(f"Artifact missing `chapters` list: {path}", _CHAPTERS_HINT)
+    try:
+        return [_chapter_from_payload(item) for item in items]
+    except _MALFORMED_ITEM_ERRORS as exc:
+        raise _artifact_error(f"Malformed chapter item in {path}", _CHAPTERS_HINT) from exc
+
+
+def _chapter_from_payload(payload: dict[str, object]) -> Chapter:
+    """Deserialize a chapter payload from artifact JSON."""
+
+    index, title, text = _CHAPTER_FIELDS(payload)
+    return Chapter(index=_artifact_int(index), title=_artifact_str(title), text=_artifact_str(text))
 
 
 def load_chapter_metadata(path: Path) -> dict[str, str]:
-    """Load chapter extraction metadata from chapter artifacts."""
+    """Load chapter extraction metadata via `load_chapter_artifact`."""
+
+    return load_chapter_artifact(path)[1]
+
+
+def _chapter_metadata_from_payload(payload: dict[str, object]) -> dict[str, str]:
+    """Extract chapter extraction metadata from a parsed chapter artifact."""
 
-    payload = load_json_object(path)
     metadata = payload.get("metadata")
     if not isinstance(metadata, dict):
         return {"source": "", "fallback_reason": ""}
@@ -385,9 +598,16 @@ def load_chapter_metadata(path: Path) -> dict[str, str]:
 
 
 def load_normalized_structure(path: Path) -> list[ChapterStructureUnit]:
-    """Load normalized structure units from chapter artifact metadata."""
+    """Load normalized structure units via `load_chapter_artifact`."""
+
+    return load_chapter_artifact(path)[2]
+
+
+def _normalized_structure_from_payload(
+    payload: dict[str, object],
+) -> list[ChapterStructureUnit]:
+    """Deserialize normalized structure units from a parsed chapter artifact."""
 
-    payload = load_json_object(path)
     metadata = payload.get("metadata")
     if not isinstance(metadata, dict):
         return []
@@ -395,118 +615,176 @@ def load_normalized_structure(path: Path) -> list[ChapterStructureUnit]:
     if not isinstance(raw_units, list):
         return []
 
-    units: list[ChapterStructureUnit] = []
-    for item in raw_units:
-        if not isinstance(item, dict):
-            continue
-        units.append(
-            ChapterStructureUnit(
-                order_index=int(item["order_index"]),
-                chapter_index=int(item["chapter_index"]),
-                chapter_title=str(item["chapter_title"]),
-                subchapter_index=(
-                    int(item["subchapter_index"])
-                    if item.get("subchapter_index") is not None
-                    else None
-                ),
-                subchapter_title=(
-                    str(item["subchapter_title"])
-                    if item.get("subchapter_title") is not None
-                    else None
-                ),
-                text=str(item["text"]),
-                char_start=int(item["char_start"]),
-                char_end=int(item["char_end"]),
-                source=str(item["source"]),
-            )
-        )
-    return units
+    return [
+        _structure_unit_from_payload(item) for item in raw_units if isinstance(item, dict)
+    ]
+
+
+def _freeze_chapter_artifact(loaded: _ChapterArtifact) -> _FrozenChapterArtifact:
+    """Return an immutable cache entry for a loaded chapter artifact."""
+
+    chapters, metadata, normalized_structure = loaded
+    return tuple(chapters), tuple(metadata.items()), tuple(normalized_structure)
+
+
+def _thaw_chapter_artifact(frozen: _FrozenChapterArtifact) -> _ChapterArtifact:
+    """Return fresh containers over a cached chapter artifact entry."""
+
+    chapters, metadata, normalized_structure = frozen
+    return list(chapters), dict(metadata), list(normalized_structure)
+
+
+@partial(_stat_cached, freeze=_freeze_chapter_artifact, thaw=_thaw_chapter_artifact)
+def load_chapter_artifact(path: Path) -> _ChapterArtifact:
+    """Load chapters, extraction metadata, and normalized structure in one parse.
+
+    The single-part loaders `load_chapters`, `load_chapter_metadata`, and
+    `load_normalized_structure` delegate here. Results are cached by file stat
+    like the other typed artifact loaders.
+    """
+
+    payload = load_json_object(path)
+    return (
+        _chapters_from_artifact_payload(payload, path),
+        _chapter_metadata_from_payload(payload),
+        _normalized_structure_from_payload(payload),
+    )
+
+
+def _structure_unit_from_payload(payload: dict[str, object]) -> ChapterStructureUnit:
+    """Deserialize a normalized structure unit payload from chapter metadata."""
+
+    (
+        order_index,
+        chapter_index,
+        chapter_title,
+        text,
+        char_start,
+        char_end,
+        source,
+    ) = _STRUCTURE_UNIT_REQUIRED_FIELDS(payload)
+    subchapter_index = payload.get("subchapter_index")
+    subchapter_title = payload.get("subchapter_title")
+    return ChapterStructureUnit(
+        order_index=_artifact_int(order_index),
+        chapter_index=_artifact_int(chapter_index),
+        chapter_title=_artifact_str(chapter_title),
+        subchapter_index=_artifact_int(subchapter_index) if subchapter_index is not None else None,
+        subchapter_title=_artifact_str(subchapter_title) if subchapter_title is not None else None,
+        text=_artifact_str(text),
+        char_start=_artifact_int(char_start),
+        char_end=_artifact_int(char_end),
+        source=_artifact_str(source),
+    )
+
+
+def _artifact_int(value: object) -> int:
+    """Return a native artifact integer, coercing whole floats and legacy textual values.
+
+    Whole-number floats such as `1.0` and integer strings convert losslessly;
+    fractional floats raise `ValueError`, and booleans and other JSON values
+    raise `TypeError`, so malformed indices are never silently truncated.
+    """
+
+    if type(value) is int:
+        return value
+    if type(value) is float:
+        if not value.is_integer():
+            raise ValueError(f"Expected an integer artifact value, got {value!r}")
+        return int(value)
+    if isinstance(value, str):
+        return int(value)
+    raise TypeError(f"Expected an integer artifact value, got {type(value).__name__}")
+
+
+def _artifact_str(value: object) -> str:
+    """Return a native artifact string, coercing other scalar values."""
+
+    return value if type(value) is str else str(value)
 
 
 def _chunk_from_payload(payload: dict[str, object]) -> Chunk:
     """Deserialize a chunk payload from artifact JSON."""
 
+    chapter_index, chunk_index, text, char_start, char_end = _CHUNK_REQUIRED_FIELDS(payload)
     source_order_indices = payload.get("source_order_indices", [])
     if not isinstance(source_order_indices, list):
         source_order_indices = []
+    part_index = payload.get("part_index")
+    part_title = payload.get("part_title")
+    part_id = payload.get("part_id")
 
     return Chunk(
-        chapter_index=int(str(payload["chapter_index"])),
-        chunk_index=int(str(payload["chunk_index"])),
-        text=str(payload["text"]),
-        char_start=int(str(payload["char_start"])),
-        char_end=int(str(payload["char_end"])),
-        part_index=(
-            int(str(payload["part_index"])) if payload.get("part_index") is not None else None
-        ),
-        part_title=(
-            str(payload["part_title"]) if payload.get("part_title") is not None else None
-        ),
-        part_id=(str(payload["part_id"]) if payload.get("part_id") is not None else None),
-        source_order_indices=tuple(int(str(index)) for index in source_order_indices),
-        boundary_strategy=str(payload.get("boundary_strategy", "sentence_complete")),
+        chapter_index=_artifact_int(chapter_index),
+        chunk_index=_artifact_int(chunk_index),
+        text=_artifact_str(text),
+        char_start=_artifact_int(char_start),
+        char_end=_artifact_int(char_end),
+        part_index=_artifact_int(part_index) if part_index is not None else None,
+        part_title=_artifact_str(part_title) if part_title is not None else None,
+        part_id=_artifact_str(part_id) if part_id is not None else None,
+        source_order_indices=tuple(_artifact_int(index) for index in source_order_indices),
+        boundary_strategy=_artifact_str(payload.get("boundary_strategy", "sentence_complete")),
     )
 
 
+@_stat_cached_loader
 def load_chunks(path: Path) -> list[Chunk]:
     """Load chunk artifacts from JSON."""
 
+    return _chunks_from_artifact_payload(load_json_object(path), path)
+
+
+def load_chunk_artifact(path: Path) -> tuple[list[Chunk], dict[str, object]]:
+    """Load chunks and their chunking metadata from one parse of a chunk artifact."""
+
     payload = load_json_object(path)
+    metadata = payload.get("metadata")
+    return (
+        _chunks_from_artifact_payload(payload, path),
+        metadata if isinstance(metadata, dict) else {},
+    )
+
+
+def _chunks_from_artifact_payload(payload: dict[str, object], path: Path) -> list[Chunk]:
+    """Deserialize the `chunks` list of a parsed chunk artifact."""
+
     items = payload.get("chunks")
     if not isinstance(items, list):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact missing `chunks` list: {path}",
-            hint="Delete chunks artifact and rerun `bookvoice resume`.",
-        )
-    chunks: list[Chunk] = []
-    for item in items:
-        if not isinstance(item, dict):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Malformed chunk item in {path}",
-                hint="Delete chunks artifact and rerun `bookvoice resume`.",
-            )
-        chunks.append(_chunk_from_payload(item))
-    return chunks
+        raise _artifact_error(f"Artifact missing `chunks` list: {path}", _CHUNKS_HINT)
+    try:
+        return [_chunk_from_payload(item) for item in items]
+    except _MALFORMED_ITEM_ERRORS as exc:
+        raise _artifact_error(f"Malformed chunk item in {path}", _CHUNKS_HINT) from exc
 
 
+def _translation_from_payload(payload: dict[str, object]) -> TranslationResult:
+    """Deserialize a translation payload from artifact JSON."""
+
+    chunk_mapping, translated_text, provider, model = _TRANSLATION_ITEM_FIELDS(payload)
+    return TranslationResult(
+        chunk=_chunk_from_payload(chunk_mapping),
+        translated_text=_artifact_str(translated_text),
+        provider=_artifact_str(provider),
+        model=_artifact_str(model),
+    )
+
+
+@_stat_cached_loader
 def load_translations(path: Path) -> list[TranslationResult]:
     """Load translation artifacts from JSON."""
 
     payload = load_json_object(path)
     items = payload.get("translations")
     if not isinstance(items, list):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact missing `translations` list: {path}",
-            hint="Delete translations artifact and rerun `bookvoice resume`.",
-        )
+        raise _artifact_error(f"Artifact missing `translations` list: {path}", _TRANSLATIONS_HINT)
 
-    translations: list[TranslationResult] = []
-    for item in items:
-        if not isinstance(item, dict):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Malformed translation item in {path}",
-                hint="Delete translations artifact and rerun `bookvoice resume`.",
-            )
-        chunk_payload = item.get("chunk")
-        if not isinstance(chunk_payload, dict):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Translation item missing `chunk` object in {path}",
-                hint="Delete translations artifact and rerun `bookvoice resume`.",
-            )
-        translations.append(
-            TranslationResult(
-                chunk=_chunk_from_payload(chunk_payload),
-                translated_text=str(item["translated_text"]),
-                provider=str(item["provider"]),
-                model=str(item["model"]),
-            )
-        )
-    return translations
+    try:
+        return [_translation_from_payload(item) for item in items]
+    except _MALFORMED_ITEM_ERRORS as exc:
+        raise _artifact_error(
+            f"Malformed translation item in {path}", _TRANSLATIONS_HINT
+        ) from exc
 
 
 def load_translated_document(path: Path) -> TranslatedDocument:
@@ -515,18 +793,16 @@ def load_translated_document(path: Path) -> TranslatedDocument:
     payload = load_json_object(path)
     raw_chapters = payload.get("chapters")
     if not isinstance(raw_chapters, list):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact missing `chapters` list: {path}",
-            hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+        raise _artifact_error(
+            f"Artifact missing `chapters` list: {path}",
+            _TRANSLATED_DOCUMENT_HINT,
         )
 
     raw_metadata = payload.get("metadata")
     if not isinstance(raw_metadata, dict):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact missing `metadata` object: {path}",
-            hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+        raise _artifact_error(
+            f"Artifact missing `metadata` object: {path}",
+            _TRANSLATED_DOCUMENT_HINT,
         )
 
     source_format = raw_metadata.get("source_format")
@@ -534,65 +810,56 @@ def load_translated_document(path: Path) -> TranslatedDocument:
     target_language = raw_metadata.get("target_language")
     chapter_scope_payload = raw_metadata.get("chapter_scope")
     if not isinstance(source_format, str) or not source_format.strip():
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact metadata missing `source_format`: {path}",
-            hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+        raise _artifact_error(
+            f"Artifact metadata missing `source_format`: {path}",
+            _TRANSLATED_DOCUMENT_HINT,
         )
     if not isinstance(source_path, str) or not source_path.strip():
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact metadata missing `source_path`: {path}",
-            hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+        raise _artifact_error(
+            f"Artifact metadata missing `source_path`: {path}",
+            _TRANSLATED_DOCUMENT_HINT,
         )
     if not isinstance(target_language, str) or not target_language.strip():
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact metadata missing `target_language`: {path}",
-            hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+        raise _artifact_error(
+            f"Artifact metadata missing `target_language`: {path}",
+            _TRANSLATED_DOCUMENT_HINT,
         )
     if not isinstance(chapter_scope_payload, dict):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact metadata missing `chapter_scope` object: {path}",
-            hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+        raise _artifact_error(
+            f"Artifact metadata missing `chapter_scope` object: {path}",
+            _TRANSLATED_DOCUMENT_HINT,
         )
 
     chapters: list[TranslatedDocumentChapter] = []
     previous_index = 0
     for item in raw_chapters:
         if not isinstance(item, dict):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Malformed translated chapter item in {path}",
-                hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+            raise _artifact_error(
+                f"Malformed translated chapter item in {path}",
+                _TRANSLATED_DOCUMENT_HINT,
             )
         index_raw = item.get("index")
         title = item.get("title")
         body = item.get("body")
         if not isinstance(index_raw, int):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Translated chapter index must be an integer in {path}",
-                hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+            raise _artifact_error(
+                f"Translated chapter index must be an integer in {path}",
+                _TRANSLATED_DOCUMENT_HINT,
             )
         if index_raw <= previous_index:
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Translated chapters must be strictly ordered in {path}",
-                hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+            raise _artifact_error(
+                f"Translated chapters must be strictly ordered in {path}",
+                _TRANSLATED_DOCUMENT_HINT,
             )
         if not isinstance(title, str):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Translated chapter title must be a string in {path}",
-                hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+            raise _artifact_error(
+                f"Translated chapter title must be a string in {path}",
+                _TRANSLATED_DOCUMENT_HINT,
             )
         if not isinstance(body, str):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Translated chapter body must be a string in {path}",
-                hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+            raise _artifact_error(
+                f"Translated chapter body must be a string in {path}",
+                _TRANSLATED_DOCUMENT_HINT,
             )
         previous_index = index_raw
         chapters.append(
@@ -609,13 +876,9 @@ def load_translated_document(path: Path) -> TranslatedDocument:
         if isinstance(key, str) and isinstance(value, str)
     }
     if not chapter_scope.get("chapter_scope_mode"):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=(
-                "Artifact metadata is missing non-empty "
-                "`chapter_scope.chapter_scope_mode`."
-            ),
-            hint="Regenerate translated-document artifact via `bookvoice translate-only`.",
+        raise _artifact_error(
+            "Artifact metadata is missing non-empty `chapter_scope.chapter_scope_mode`.",
+            _TRANSLATED_DOCUMENT_HINT,
         )
 
     return TranslatedDocument(
@@ -627,96 +890,129 @@ def load_translated_document(path: Path) -> TranslatedDocument:
     )
 
 
-def load_rewrites(path: Path) -> list[RewriteResult]:
-    """Load rewrite artifacts from JSON."""
+def _matching_translation(
+    known_translations: dict[tuple[object, object], TranslationResult],
+    translation_payload: dict[str, object],
+    chunk_mapping: dict[str, object],
+) -> TranslationResult | None:
+    """Return a loaded translation identical to a nested rewrite payload, if any."""
+
+    candidate = known_translations.get(
+        (chunk_mapping.get("chapter_index"), chunk_mapping.get("chunk_index"))
+    )
+    if candidate is None:
+        return None
+    if (
+        translation_payload.get("translated_text") != candidate.translated_text
+        or translation_payload.get("provider") != candidate.provider
+        or translation_payload.get("model") != candidate.model
+        or chunk_mapping != chunk_payload(candidate.chunk)
+    ):
+        return None
+    return candidate
+
+
+def load_rewrites(
+    path: Path,
+    translations: Sequence[TranslationResult] = (),
+) -> list[RewriteResult]:
+    """Load rewrite artifacts from JSON.
+
+    When already-loaded `translations` are provided, nested translation payloads
+    that match one of them exactly reuse that `TranslationResult` instead of
+    rebuilding an identical chunk and translation object.
+    """
+
+    return list(iter_rewrites(path, translations))
 
+
+def iter_rewrites(
+    path: Path,
+    translations: Sequence[TranslationResult] = (),
+) -> Iterator[RewriteResult]:
+    """Yield rewrite artifacts from JSON one item at a time.
+
+    Callers that only inspect rewrites (for example resume signature checks)
+    avoid materializing the full `RewriteResult` list; malformed items raise
+    when they are reached.
+    """
+
+    known_translations = {
+        (item.chunk.chapter_index, item.chunk.chunk_index): item for item in translations
+    }
     payload = load_json_object(path)
     items = payload.get("rewrites")
     if not isinstance(items, list):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact missing `rewrites` list: {path}",
-            hint="Delete rewrites artifact and rerun `bookvoice resume`.",
-        )
+        raise _artifact_error(f"Artifact missing `rewrites` list: {path}", _REWRITES_HINT)
 
-    rewrites: list[RewriteResult] = []
     for item in items:
-        if not isinstance(item, dict):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Malformed rewrite item in {path}",
-                hint="Delete rewrites artifact and rerun `bookvoice resume`.",
-            )
-        translation_payload = item.get("translation")
-        if not isinstance(translation_payload, dict):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Rewrite item missing `translation` object in {path}",
-                hint="Delete rewrites artifact and rerun `bookvoice resume`.",
-            )
-        chunk_payload = translation_payload.get("chunk")
-        if not isinstance(chunk_payload, dict):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Rewrite translation missing `chunk` object in {path}",
-                hint="Delete rewrites artifact and rerun `bookvoice resume`.",
-            )
+        try:
+            rewrite = _rewrite_from_payload(item, known_translations)
+        except _MALFORMED_ITEM_ERRORS as exc:
+            raise _artifact_error(f"Malformed rewrite item in {path}", _REWRITES_HINT) from exc
+        yield rewrite
+
+
+def _rewrite_from_payload(
+    payload: dict[str, object],
+    known_translations: dict[tuple[object, object], TranslationResult],
+) -> RewriteResult:
+    """Deserialize a rewrite payload, reusing an identical loaded translation."""
+
+    translation_payload, rewritten_text, provider, model = _REWRITE_ITEM_FIELDS(payload)
+    translation = _matching_translation(
+        known_translations, translation_payload, translation_payload["chunk"]
+    )
+    if translation is None:
+        translation = _translation_from_payload(translation_payload)
+    return RewriteResult(
+        translation=translation,
+        rewritten_text=_artifact_str(rewritten_text),
+        provider=_artifact_str(provider),
+        model=_artifact_str(model),
+    )
 
-        translation = TranslationResult(
-            chunk=_chunk_from_payload(chunk_payload),
-            translated_text=str(translation_payload["translated_text"]),
-            provider=str(translation_payload["provider"]),
-            model=str(translation_payload["model"]),
-        )
-        rewrites.append(
-            RewriteResult(
-                translation=translation,
-                rewritten_text=str(item["rewritten_text"]),
-                provider=str(item["provider"]),
-                model=str(item["model"]),
-            )
-        )
-    return rewrites
+
+def _audio_part_from_payload(payload: dict[str, Any]) -> AudioPart:
+    """Deserialize a synthesized audio part payload from artifact JSON."""
+
+    chapter_index, chunk_index, part_path, duration_seconds = _AUDIO_PART_REQUIRED_FIELDS(
+        payload
+    )
+    return AudioPart(
+        chapter_index=int(chapter_index),
+        chunk_index=int(chunk_index),
+        path=Path(_artifact_str(part_path)),
+        duration_seconds=float(duration_seconds),
+        part_index=(int(payload["part_index"]) if payload.get("part_index") is not None else None),
+        part_title=(
+            str(payload["part_title"]) if payload.get("part_title") is not None else None
+        ),
+        part_id=(str(payload["part_id"]) if payload.get("part_id") is not None else None),
+        source_order_indices=tuple(
+            int(index) for index in payload.get("source_order_indices", [])
+        ),
+        provider=str(payload["provider"]) if isinstance(payload.get("provider"), str) else None,
+        model=str(payload["model"]) if isinstance(payload.get("model"), str) else None,
+        voice=str(payload["voice"]) if isinstance(payload.get("voice"), str) else None,
+    )
 
 
+@_stat_cached_loader
 def load_audio_parts(path: Path) -> list[AudioPart]:
     """Load synthesized audio part artifacts from JSON."""
 
     payload = load_json_object(path)
     items = payload.get("audio_parts")
     if not isinstance(items, list):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact missing `audio_parts` list: {path}",
-            hint="Delete audio parts artifact and rerun `bookvoice resume`.",
-        )
+        raise _artifact_error(f"Artifact missing `audio_parts` list: {path}", _AUDIO_PARTS_HINT)
 
-    audio_parts: list[AudioPart] = []
-    for item in items:
-        if not isinstance(item, dict):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Malformed audio part item in {path}",
-                hint="Delete audio parts artifact and rerun `bookvoice resume`.",
-            )
-        audio_parts.append(
-            AudioPart(
-                chapter_index=int(item["chapter_index"]),
-                chunk_index=int(item["chunk_index"]),
-                path=Path(str(item["path"])),
-                duration_seconds=float(item["duration_seconds"]),
-                part_index=(int(item["part_index"]) if item.get("part_index") is not None else None),
-                part_title=(
-                    str(item["part_title"]) if item.get("part_title") is not None else None
-                ),
-                part_id=(str(item["part_id"]) if item.get("part_id") is not None else None),
-                source_order_indices=tuple(int(index) for index in item.get("source_order_indices", [])),
-                provider=str(item["provider"]) if isinstance(item.get("provider"), str) else None,
-                model=str(item["model"]) if isinstance(item.get("model"), str) else None,
-                voice=str(item["voice"]) if isinstance(item.get("voice"), str) else None,
-            )
-        )
-    return audio_parts
+    try:
+        return [_audio_part_from_payload(item) for item in items]
+    except _MALFORMED_ITEM_ERRORS as exc:
+        raise _artifact_error(
+            f"Malformed audio part item in {path}", _AUDIO_PARTS_HINT
+        ) from exc
 
 
 def load_packaged_audio(path: Path) -> list[PackagedAudio]:
@@ -725,20 +1021,12 @@ def load_packaged_audio(path: Path) -> list[PackagedAudio]:
     payload = load_json_object(path)
     items = payload.get("packaged_audio")
     if not isinstance(items, list):
-        raise PipelineStageError(
-            stage="resume-artifacts",
-            detail=f"Artifact missing `packaged_audio` list: {path}",
-            hint="Delete packaged artifact and rerun `bookvoice resume`.",
-        )
+        raise _artifact_error(f"Artifact missing `packaged_audio` list: {path}", _PACKAGED_HINT)
 
     packaged_outputs: list[PackagedAudio] = []
     for item in items:
         if not isinstance(item, dict):
-            raise PipelineStageError(
-                stage="resume-artifacts",
-                detail=f"Malformed packaged-audio item in {path}",
-                hint="Delete packaged artifact and rerun `bookvoice resume`.",
-            )
+            raise _artifact_error(f"Malformed packaged-audio item in {path}", _PACKAGED_HINT)
         packaged_outputs.append(
             PackagedAudio(
                 output_kind=str(item["output_kind"]),
@@ -4,10 +4,17 @@ Responsibilities:
 - Parse user chapter selection expressions.
 - Reconstruct chapter selection scope from manifest metadata.
 - Build deterministic chapter-scope metadata used across artifacts.
+- Select scoped chapters in one pass, sorting only when input is out of order.
+- Filter scoped chapters against one frozen selected-index set.
+- Reuse already sorted, unique index lists instead of re-sorting them.
+- Coerce manifest scope fields to stripped strings once before parsing.
 """
 
 from __future__ import annotations
 
+from itertools import pairwise
+from operator import attrgetter
+
 from ..errors import PipelineStageError
 from ..models.datatypes import Chapter
 from ..text.chapter_selection import (
@@ -17,6 +24,39 @@ from ..text.chapter_selection import (
 )
 
 
+def _select_chapters(chapters: list[Chapter], selected_set: frozenset[int]) -> list[Chapter]:
+    """Return chapters whose index is in `selected_set`, ordered by chapter index.
+
+    Split and loaded chapters are normally already in index order, so the
+    result is only sorted when a walk finds an out-of-order pair.
+    """
+
+    selected = [chapter for chapter in chapters if chapter.index in selected_set]
+    if any(previous.index > current.index for previous, current in pairwise(selected)):
+        selected.sort(key=attrgetter("index"))
+    return selected
+
+
+def _sorted_unique_indices(indices: list[int]) -> list[int]:
+    """Return `indices` as sorted unique ints, reusing the list when it already is.
+
+    Parsed selections and split chapters are normally strictly ascending ints,
+    so one pairwise walk replaces the set, sort, and `int` conversions.
+    """
+
+    if all(type(index) is int for index in indices) and all(
+        previous < current for previous, current in pairwise(indices)
+    ):
+        return indices
+    return sorted(set(map(int, indices)))
+
+
+def _manifest_scope_text(value: object) -> str:
+    """Return a stripped manifest scope field, or an empty string for non-strings."""
+
+    return value.strip() if isinstance(value, str) else ""
+
+
 class PipelineChapterScopeMixin:
     """Provide chapter-selection and chapter-scope helper methods."""
 
@@ -37,17 +77,13 @@ class PipelineChapterScopeMixin:
                 ),
             ) from exc
 
+        selected_set = frozenset(selected_indices)
         chapter_scope = self._build_chapter_scope_metadata(
             available_indices=available_indices,
             selected_indices=selected_indices,
             selection_input=chapter_selection,
         )
-        selected_set = set(selected_indices)
-        selected_chapters = sorted(
-            (chapter for chapter in chapters if chapter.index in selected_set),
-            key=lambda chapter: chapter.index,
-        )
-        return selected_chapters, chapter_scope
+        return _select_chapters(chapters, selected_set), chapter_scope
 
     def _resolve_resume_chapter_scope(
         self, chapters: list[Chapter], extra: dict[str, object]
@@ -58,8 +94,9 @@ class PipelineChapterScopeMixin:
         selected_indices = available_indices
         selection_input = ""
 
-        raw_indices_csv = extra.get("chapter_scope_indices_csv")
-        if isinstance(raw_indices_csv, str) and raw_indices_csv.strip():
+        raw_indices_csv = _manifest_scope_text(extra.get("chapter_scope_indices_csv"))
+        raw_selection_input = _manifest_scope_text(extra.get("chapter_scope_selection_input"))
+        if raw_indices_csv:
             try:
                 selected_indices = parse_chapter_indices_csv(raw_indices_csv, available_indices)
             except ValueError as exc:
@@ -69,34 +106,24 @@ class PipelineChapterScopeMixin:
                     hint="Regenerate run artifacts or rerun `bookvoice build`.",
                 ) from exc
             selection_input = format_chapter_selection(selected_indices)
-        else:
-            raw_selection_input = extra.get("chapter_scope_selection_input")
-            if (
-                isinstance(raw_selection_input, str)
-                and raw_selection_input.strip()
-                and raw_selection_input.strip().lower() != "all"
-            ):
-                selection_input = raw_selection_input.strip()
-                try:
-                    selected_indices = parse_chapter_selection(selection_input, available_indices)
-                except ValueError as exc:
-                    raise PipelineStageError(
-                        stage="resume-artifacts",
-                        detail=f"Invalid chapter scope metadata in manifest: {exc}",
-                        hint="Regenerate run artifacts or rerun `bookvoice build`.",
-                    ) from exc
+        elif raw_selection_input and raw_selection_input.lower() != "all":
+            selection_input = raw_selection_input
+            try:
+                selected_indices = parse_chapter_selection(selection_input, available_indices)
+            except ValueError as exc:
+                raise PipelineStageError(
+                    stage="resume-artifacts",
+                    detail=f"Invalid chapter scope metadata in manifest: {exc}",
+                    hint="Regenerate run artifacts or rerun `bookvoice build`.",
+                ) from exc
 
+        selected_set = frozenset(selected_indices)
         chapter_scope = self._build_chapter_scope_metadata(
             available_indices=available_indices,
             selected_indices=selected_indices,
             selection_input=selection_input or None,
         )
-        selected_set = set(selected_indices)
-        selected_chapters = sorted(
-            (chapter for chapter in chapters if chapter.index in selected_set),
-            key=lambda chapter: chapter.index,
-        )
-        return selected_chapters, chapter_scope
+        return _select_chapters(chapters, selected_set), chapter_scope
 
     def _build_chapter_scope_metadata(
         self,
@@ -104,11 +131,18 @@ class PipelineChapterScopeMixin:
         selected_indices: list[int],
         selection_input: str | None,
     ) -> dict[str, str]:
-        """Build string metadata describing selected chapter scope for artifacts."""
+        """Build string metadata describing selected chapter scope for artifacts.
 
-        available_unique = sorted(set(int(index) for index in available_indices))
-        selected_unique = sorted(set(int(index) for index in selected_indices))
+        Full-book scopes reuse the available-indices CSV for the selected indices.
+        """
+
+        available_unique = _sorted_unique_indices(available_indices)
+        selected_unique = _sorted_unique_indices(selected_indices)
         is_all_scope = selected_unique == available_unique
+        available_indices_csv = ",".join(map(str, available_unique))
+        selected_indices_csv = (
+            available_indices_csv if is_all_scope else ",".join(map(str, selected_unique))
+        )
         selection_label = "all" if is_all_scope else format_chapter_selection(selected_unique)
         return {
             "chapter_scope_mode": "all" if is_all_scope else "selected",
@@ -118,10 +152,8 @@ class PipelineChapterScopeMixin:
                 if is_all_scope
                 else (selection_input.strip() if isinstance(selection_input, str) else "")
             ),
-            "chapter_scope_indices_csv": ",".join(str(index) for index in selected_unique),
-            "chapter_scope_available_indices_csv": ",".join(
-                str(index) for index in available_unique
-            ),
+            "chapter_scope_indices_csv": selected_indices_csv,
+            "chapter_scope_available_indices_csv": available_indices_csv,
             "chapter_scope_selected_count": str(len(selected_unique)),
             "chapter_scope_available_count": str(len(available_unique)),
         }
@@ -16,34 +16,47 @@ _REWRITE_COST_PER_1K_CHARS_USD = 0.0008
 _TTS_COST_PER_1K_CHARS_USD = 0.0150
 
 
+def _usage_cost(billable_chars: int, cost_per_1k_chars_usd: float) -> float:
+    """Convert an aggregated billable character count into a USD estimate."""
+
+    return (billable_chars / 1000.0) * cost_per_1k_chars_usd
+
+
 def add_translation_costs(
     translations: list[TranslationResult], cost_tracker: CostTracker
 ) -> None:
-    """Accumulate deterministic LLM cost estimate for translation stage."""
+    """Accumulate deterministic LLM cost estimate for translation stage.
+
+    Billable characters are summed as integers and priced once per stage.
+    """
 
-    for item in translations:
-        source_chars = len(item.chunk.text)
-        translated_chars = len(item.translated_text)
-        billable_chars = max(1, source_chars + translated_chars)
-        cost_tracker.add_llm_usage((billable_chars / 1000.0) * _TRANSLATE_COST_PER_1K_CHARS_USD)
+    if not translations:
+        return
+    billable_chars = sum(
+        max(1, len(item.chunk.text) + len(item.translated_text)) for item in translations
+    )
+    cost_tracker.add_llm_usage(_usage_cost(billable_chars, _TRANSLATE_COST_PER_1K_CHARS_USD))
 
 
 def add_rewrite_costs(rewrites: list[RewriteResult], cost_tracker: CostTracker) -> None:
     """Accumulate deterministic LLM cost estimate for rewrite stage."""
 
-    for item in rewrites:
-        input_chars = len(item.translation.translated_text)
-        output_chars = len(item.rewritten_text)
-        billable_chars = max(1, input_chars + output_chars)
-        cost_tracker.add_llm_usage((billable_chars / 1000.0) * _REWRITE_COST_PER_1K_CHARS_USD)
+    if not rewrites:
+        return
+    billable_chars = sum(
+        max(1, len(item.translation.translated_text) + len(item.rewritten_text))
+        for item in rewrites
+    )
+    cost_tracker.add_llm_usage(_usage_cost(billable_chars, _REWRITE_COST_PER_1K_CHARS_USD))
 
 
 def add_tts_costs(rewrites: list[RewriteResult], cost_tracker: CostTracker) -> None:
     """Accumulate deterministic TTS cost estimate for synthesis stage."""
 
-    for item in rewrites:
-        billable_chars = max(1, len(item.rewritten_text))
-        cost_tracker.add_tts_usage((billable_chars / 1000.0) * _TTS_COST_PER_1K_CHARS_USD)
+    if not rewrites:
+        return
+    billable_chars = sum(max(1, len(item.rewritten_text)) for item in rewrites)
+    cost_tracker.add_tts_usage(_usage_cost(billable_chars, _TTS_COST_PER_1K_CHARS_USD))
 
 
 def rounded_cost_summary(cost_tracker: CostTracker) -> dict[str, float]:
@@ -2,19 +2,25 @@
 
 Responsibilities:
 - Execute deterministic extract/clean/split/chunk content stages.
+- Memoize extract/clean results per pipeline for unchanged sources and text.
+- Reuse translate/rewrite responses from an optional persistent response cache.
 - Execute provider-driven translate/rewrite/tts stages.
+- Size provider connection pools to stage concurrency and close them per stage.
 - Execute postprocess/merge audio stages and output-path derivation.
 """
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, wraps
+import hashlib
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Concatenate, ParamSpec, TypeVar
 
-from ..audio.merger import AudioMerger
 from ..audio.packaging import AudioPackager, PackagedTagContext, PackagingOptions
-from ..audio.postprocess import AudioPostProcessor
-from ..audio.tags import AudioTagContext, MetadataWriter
 from ..config import BookvoiceConfig, ProviderRuntimeConfig
 from ..errors import PipelineStageError
 from ..io.chapter_splitter import ChapterSplitter
@@ -22,8 +28,6 @@ from ..io.epub_text_extractor import EpubExtractionError, EpubTextExtractor
 from ..io.pdf_outline_extractor import PdfOutlineChapterExtractor
 from ..io.pdf_text_extractor import PdfTextExtractor
 from ..io.storage import ArtifactStore
-from ..llm.audio_rewriter import DeterministicBypassRewriter
-from ..llm.openai_client import OpenAIProviderError
 from ..models.datatypes import (
     AudioPart,
     Chapter,
@@ -33,13 +37,124 @@ from ..models.datatypes import (
     RewriteResult,
     TranslationResult,
 )
-from ..provider_factory import ProviderFactory
 from ..text.chunking import Chunker, SentenceBoundaryRepairer
 from ..text.cleaners import TextCleaner
 from ..text.segment_planner import TextBudgetSegmentPlanner
 from ..text.slug import slugify_audio_title
 from ..text.structure import ChapterStructureNormalizer
-from ..tts.voices import VoiceProfile
+from .artifacts import AUDIO_CHUNKS_REL_DIR, AUDIO_PACKAGE_REL_DIR, MERGED_AUDIO_REL_PATH
+
+if TYPE_CHECKING:
+    from ..audio.merger import AudioMerger
+    from ..audio.postprocess import AudioPostProcessor
+    from ..audio.tags import MetadataWriter
+    from ..llm.cache import ResponseCache
+    from ..llm.openai_client import OpenAIProviderError
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+_MixinT = TypeVar("_MixinT", bound="PipelineExecutionMixin")
+_MemoKeyT = TypeVar("_MemoKeyT", bound=Hashable)
+
+_STAGE_MEMO_SIZE = 2
+"""Recent extract/clean results kept per pipeline (for example listing, then building)."""
+
+
+def _stage_guard(
+    stage: str,
+    failure: str,
+    hint: str,
+    *,
+    provider_errors: bool = False,
+) -> Callable[
+    [Callable[Concatenate[_MixinT, _P], _R]],
+    Callable[Concatenate[_MixinT, _P], _R],
+]:
+    """Map unexpected stage-method exceptions into one stage-aware pipeline error.
+
+    `PipelineStageError` passes through unchanged. With `provider_errors`, provider
+    failures are translated through `_provider_stage_error` for actionable hints.
+    """
+
+    def decorate(
+        method: Callable[Concatenate[_MixinT, _P], _R],
+    ) -> Callable[Concatenate[_MixinT, _P], _R]:
+        @wraps(method)
+        def guarded(self: _MixinT, /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+            try:
+                return method(self, *args, **kwargs)
+            except PipelineStageError:
+                raise
+            except Exception as exc:
+                if provider_errors:
+                    from ..llm.openai_client import OpenAIProviderError
+
+                    if isinstance(exc, OpenAIProviderError):
+                        raise self._provider_stage_error(stage, exc) from exc
+                raise PipelineStageError(
+                    stage=stage, detail=f"{failure}: {exc}", hint=hint
+                ) from exc
+
+        return guarded
+
+    return decorate
+
+
+def _map_provider_calls(
+    call: Callable[[_T], _R], items: Sequence[_T], concurrency: int
+) -> list[_R]:
+    """Apply a provider call to every item and return results in input order.
+
+    With `concurrency` of 1 calls stay sequential. Higher values overlap network
+    latency on worker threads; the first failure in input order propagates and
+    calls that have not started yet are cancelled.
+    """
+
+    if concurrency <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+    executor = ThreadPoolExecutor(
+        max_workers=min(concurrency, len(items)),
+        thread_name_prefix="bookvoice-provider",
+    )
+    try:
+        return list(executor.map(call, items))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _close_stage_provider(provider: object) -> None:
+    """Close a stage provider's HTTP resources when it exposes `close`."""
+
+    close = getattr(provider, "close", None)
+    if callable(close):
+        close()
+
+
+def _remember(memo: OrderedDict[_MemoKeyT, _T], key: _MemoKeyT, value: _T) -> _T:
+    """Store `value` as the most recent memo entry, evicting the oldest beyond the limit."""
+
+    memo[key] = value
+    memo.move_to_end(key)
+    while len(memo) > _STAGE_MEMO_SIZE:
+        memo.popitem(last=False)
+    return value
+
+
+def _source_file_identity(config: BookvoiceConfig) -> tuple[object, ...] | None:
+    """Return a stat-based identity of the source document, or `None` when unreadable."""
+
+    try:
+        stat_result = config.source_path.stat()
+    except OSError:
+        return None
+    return (
+        config.source_format,
+        os.path.abspath(config.source_path),
+        stat_result.st_ino,
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+    )
 
 
 class PipelineExecutionMixin:
@@ -56,6 +171,96 @@ class PipelineExecutionMixin:
         def _record_provider_cache_stats(self, *, hits: int, misses: int) -> None:
             """Record provider cache telemetry for downstream manifest metadata."""
 
+    @cached_property
+    def _text_cleaner(self) -> TextCleaner:
+        """Return the pipeline's reusable default-rule text cleaner."""
+
+        return TextCleaner()
+
+    @cached_property
+    def _chapter_splitter(self) -> ChapterSplitter:
+        """Return the pipeline's reusable heuristic chapter splitter."""
+
+        return ChapterSplitter()
+
+    @cached_property
+    def _pdf_text_extractor(self) -> PdfTextExtractor:
+        """Return the pipeline's reusable PDF text extractor."""
+
+        return PdfTextExtractor()
+
+    @cached_property
+    def _pdf_outline_extractor(self) -> PdfOutlineChapterExtractor:
+        """Return the pipeline's reusable PDF outline chapter extractor."""
+
+        return PdfOutlineChapterExtractor()
+
+    @cached_property
+    def _epub_text_extractor(self) -> EpubTextExtractor:
+        """Return the pipeline's reusable EPUB text extractor."""
+
+        return EpubTextExtractor()
+
+    @cached_property
+    def _structure_normalizer(self) -> ChapterStructureNormalizer:
+        """Return the pipeline's reusable chapter structure normalizer."""
+
+        return ChapterStructureNormalizer()
+
+    @cached_property
+    def _segment_planner(self) -> TextBudgetSegmentPlanner:
+        """Return the pipeline's reusable text-budget segment planner."""
+
+        return TextBudgetSegmentPlanner()
+
+    @cached_property
+    def _chunker(self) -> Chunker:
+        """Return the pipeline's reusable fallback chunker."""
+
+        return Chunker()
+
+    @cached_property
+    def _extracted_text_memo(self) -> OrderedDict[tuple[object, ...], str]:
+        """Return recent extracted texts keyed by source document identity."""
+
+        return OrderedDict()
+
+    @cached_property
+    def _cleaned_text_memo(self) -> OrderedDict[bytes, tuple[str, int]]:
+        """Return recent clean results keyed by a digest of their raw text."""
+
+        return OrderedDict()
+
+    @cached_property
+    def _audio_merger(self) -> AudioMerger:
+        """Return the pipeline's reusable WAV merger, importing it on first use."""
+
+        from ..audio.merger import AudioMerger
+
+        return AudioMerger()
+
+    @cached_property
+    def _audio_postprocessor(self) -> AudioPostProcessor:
+        """Return the pipeline's reusable merged-output postprocessor."""
+
+        from ..audio.postprocess import AudioPostProcessor
+
+        return AudioPostProcessor()
+
+    @cached_property
+    def _metadata_writer(self) -> MetadataWriter:
+        """Return the pipeline's reusable merged-output tag writer."""
+
+        from ..audio.tags import MetadataWriter
+
+        return MetadataWriter()
+
+    @cached_property
+    def _audio_packager(self) -> AudioPackager:
+        """Return the pipeline's reusable chapter packager."""
+
+        return AudioPackager()
+
     @staticmethod
     def _provider_error_detail(stage: str, exc: OpenAIProviderError) -> str:
         """Build concise stage-scoped detail text for provider-backed failures."""
@@ -127,13 +332,30 @@ class PipelineExecutionMixin:
         )
 
     def _extract(self, config: BookvoiceConfig) -> str:
-        """Extract raw text from the configured source document."""
+        """Extract raw text from the configured source document.
+
+        Extracting an unchanged source file again (same path, inode, mtime, and
+        size) reuses this pipeline's memoized text.
+        """
+
+        identity = _source_file_identity(config)
+        if identity is not None:
+            memoized = self._extracted_text_memo.get(identity)
+            if memoized is not None:
+                return memoized
+        raw_text = self._extract_source_text(config)
+        if identity is None:
+            return raw_text
+        return _remember(self._extracted_text_memo, identity, raw_text)
+
+    def _extract_source_text(self, config: BookvoiceConfig) -> str:
+        """Run the format-specific extractor for the configured source document."""
 
         try:
             if config.source_format == "pdf":
-                return PdfTextExtractor().extract(config.source_path)
+                return self._pdf_text_extractor.extract(config.source_path)
             if config.source_format == "epub":
-                return EpubTextExtractor().extract(config.source_path)
+                return self._epub_text_extractor.extract(config.source_path)
             raise PipelineStageError(
                 stage="extract",
                 detail=f"Unsupported source format `{config.source_format}`.",
@@ -163,24 +385,38 @@ class PipelineExecutionMixin:
         cleaned_text, _ = self._clean_with_metadata(raw_text)
         return cleaned_text
 
+    @_stage_guard(
+        "clean",
+        "Failed to normalize extracted text",
+        "Inspect `text/raw.txt` and verify it contains readable UTF-8 text.",
+    )
     def _clean_with_metadata(self, raw_text: str) -> tuple[str, dict[str, int]]:
-        """Apply deterministic cleanup and return text plus normalization diagnostics."""
-
-        try:
-            cleaner = TextCleaner()
-            report = cleaner.clean_with_report(raw_text)
-            return report.cleaned_text.strip(), {
-                "drop_cap_merges_count": report.drop_cap_merges_count,
-            }
-        except PipelineStageError:
-            raise
-        except Exception as exc:
-            raise PipelineStageError(
-                stage="clean",
-                detail=f"Failed to normalize extracted text: {exc}",
-                hint="Inspect `text/raw.txt` and verify it contains readable UTF-8 text.",
-            ) from exc
-
+        """Apply deterministic cleanup and return text plus normalization diagnostics.
+
+        Cleaning the same raw text again reuses this pipeline's memoized result.
+        The memo is keyed by a SHA-256 digest, so it never keeps raw book text
+        alive or compares it in full on lookup.
+        """
+
+        raw_text_digest = hashlib.sha256(
+            raw_text.encode("utf-8", errors="surrogatepass")
+        ).digest()
+        memoized = self._cleaned_text_memo.get(raw_text_digest)
+        if memoized is None:
+            report = self._text_cleaner.clean_with_report(raw_text)
+            memoized = _remember(
+                self._cleaned_text_memo,
+                raw_text_digest,
+                (report.cleaned_text.strip(), report.drop_cap_merges_count),
+            )
+        cleaned_text, drop_cap_merges_count = memoized
+        return cleaned_text, {"drop_cap_merges_count": drop_cap_merges_count}
+
+    @_stage_guard(
+        "split",
+        "Failed to split chapters",
+        "Inspect cleaned text formatting in `text/clean.txt` and source metadata.",
+    )
     def _split_chapters(
         self, text: str, source_path: Path
     ) -> tuple[list[Chapter], str, str]:
@@ -191,7 +427,7 @@ class PipelineExecutionMixin:
         if source_format == "pdf":
             fallback_reason = "outline_invalid"
             try:
-                outline_result = PdfOutlineChapterExtractor().extract(source_path)
+                outline_result = self._pdf_outline_extractor.extract(source_path)
                 if outline_result.chapters:
                     return outline_result.chapters, "pdf_outline", ""
                 fallback_reason = outline_result.status
@@ -200,25 +436,15 @@ class PipelineExecutionMixin:
         elif source_format == "epub":
             fallback_reason = "nav_invalid"
             try:
-                nav_result = EpubTextExtractor().extract_chapters(source_path)
+                nav_result = self._epub_text_extractor.extract_chapters(source_path)
                 if nav_result.chapters:
                     return nav_result.chapters, "epub_nav", ""
                 fallback_reason = nav_result.status
             except Exception:
                 fallback_reason = "nav_invalid"
 
-        try:
-            splitter = ChapterSplitter()
-            chapters = splitter.split(text)
-            return chapters, "text_heuristic", fallback_reason
-        except PipelineStageError:
-            raise
-        except Exception as exc:
-            raise PipelineStageError(
-                stage="split",
-                detail=f"Failed to split chapters: {exc}",
-                hint="Inspect cleaned text formatting in `text/clean.txt` and source metadata.",
-            ) from exc
+        chapters = self._chapter_splitter.split(text)
+        return chapters, "text_heuristic", fallback_reason
 
     def _extract_normalized_structure(
         self,
@@ -230,15 +456,24 @@ class PipelineExecutionMixin:
 
         if chapter_source == "pdf_outline":
             try:
-                outline_structure = PdfOutlineChapterExtractor().extract_structure(source_pdf)
+                outline_structure = self._pdf_outline_extractor.extract_structure(
+                    source_pdf
+                )
                 if outline_structure.units:
                     return outline_structure.units
             except Exception:
                 pass
 
         fallback_source = chapter_source if chapter_source == "epub_nav" else "text_heuristic"
-        return ChapterStructureNormalizer().from_chapters(chapters=chapters, source=fallback_source)
+        return self._structure_normalizer.from_chapters(
+            chapters=chapters, source=fallback_source
+        )
 
+    @_stage_guard(
+        "chunk",
+        "Failed to chunk chapters",
+        "Verify chapter artifacts are well-formed and chunk size is positive.",
+    )
     def _chunk(
         self,
         chapters: list[Chapter],
@@ -247,62 +482,53 @@ class PipelineExecutionMixin:
     ) -> tuple[list[Chunk], dict[str, object]]:
         """Plan deterministic chapter parts from structure units."""
 
-        try:
-            selected_units = self._selected_structure_units(chapters, normalized_structure)
-            planner = TextBudgetSegmentPlanner()
-
-            if selected_units:
-                plan = planner.plan(selected_units, budget_chars=config.chunk_size_chars)
-                chunks = planner.to_chunks(plan)
-                repair_report = SentenceBoundaryRepairer(
-                    max_extension_chars=max(1, int(config.chunk_size_chars * 0.35))
-                ).repair(chunks=chunks, target_size=config.chunk_size_chars)
-                chunks = repair_report.chunks
-                metadata = {
-                    "sentence_boundary_repairs_count": (
-                        repair_report.sentence_boundary_repairs_count
-                    ),
-                    "planner": {
-                        "strategy": "text_budget_segment_planner",
-                        "budget_chars": plan.budget_chars,
-                        "budget_ceiling_chars": plan.budget_ceiling_chars,
-                        "segment_count": len(plan.segments),
-                        "source_structure_unit_count": len(selected_units),
-                        "source_structure_order_indices": [
-                            unit.order_index for unit in selected_units
-                        ],
-                    }
-                }
-                return chunks, metadata
+        selected_units = self._selected_structure_units(chapters, normalized_structure)
+        planner = self._segment_planner
 
-            fallback_chunks = self._decorate_chunks_with_part_metadata(
-                chunks=Chunker().to_chunks(chapters, target_size=config.chunk_size_chars),
-                chapters=chapters,
-            )
+        if selected_units:
+            plan = planner.plan(selected_units, budget_chars=config.chunk_size_chars)
+            chunks = planner.to_chunks(plan)
             repair_report = SentenceBoundaryRepairer(
                 max_extension_chars=max(1, int(config.chunk_size_chars * 0.35))
-            ).repair(chunks=fallback_chunks, target_size=config.chunk_size_chars)
-            fallback_chunks = repair_report.chunks
-            fallback_metadata = {
-                "sentence_boundary_repairs_count": repair_report.sentence_boundary_repairs_count,
+            ).repair(chunks=chunks, target_size=config.chunk_size_chars)
+            chunks = repair_report.chunks
+            metadata = {
+                "sentence_boundary_repairs_count": (
+                    repair_report.sentence_boundary_repairs_count
+                ),
                 "planner": {
-                    "strategy": "chunker_fallback",
-                    "budget_chars": config.chunk_size_chars,
-                    "budget_ceiling_chars": config.chunk_size_chars,
-                    "segment_count": len(fallback_chunks),
-                    "source_structure_unit_count": 0,
-                    "source_structure_order_indices": [],
+                    "strategy": "text_budget_segment_planner",
+                    "budget_chars": plan.budget_chars,
+                    "budget_ceiling_chars": plan.budget_ceiling_chars,
+                    "segment_count": len(plan.segments),
+                    "source_structure_unit_count": len(selected_units),
+                    "source_structure_order_indices": [
+                        unit.order_index for unit in selected_units
+                    ],
                 }
             }
-            return fallback_chunks, fallback_metadata
-        except PipelineStageError:
-            raise
-        except Exception as exc:
-            raise PipelineStageError(
-                stage="chunk",
-                detail=f"Failed to chunk chapters: {exc}",
-                hint="Verify chapter artifacts are well-formed and chunk size is positive.",
-            ) from exc
+            return chunks, metadata
+
+        fallback_chunks = self._decorate_chunks_with_part_metadata(
+            chunks=self._chunker.to_chunks(chapters, target_size=config.chunk_size_chars),
+            chapters=chapters,
+        )
+        repair_report = SentenceBoundaryRepairer(
+            max_extension_chars=max(1, int(config.chunk_size_chars * 0.35))
+        ).repair(chunks=fallback_chunks, target_size=config.chunk_size_chars)
+        fallback_chunks = repair_report.chunks
+        fallback_metadata = {
+            "sentence_boundary_repairs_count": repair_report.sentence_boundary_repairs_count,
+            "planner": {
+                "strategy": "chunker_fallback",
+                "budget_chars": config.chunk_size_chars,
+                "budget_ceiling_chars": config.chunk_size_chars,
+                "segment_count": len(fallback_chunks),
+                "source_structure_unit_count": 0,
+                "source_structure_order_indices": [],
+            }
+        }
+        return fallback_chunks, fallback_metadata
 
     def _selected_structure_units(
         self,
@@ -344,41 +570,70 @@ class PipelineExecutionMixin:
             )
         return decorated
 
+    def _stage_response_cache(self, config: BookvoiceConfig) -> ResponseCache:
+        """Return a response cache for one provider stage.
+
+        With `response_cache_dir` configured, translate and rewrite responses are
+        read from and written to a SQLite store there, keyed by provider, model,
+        and rendered prompts, so later runs (for example after a voice change that
+        yields a new run ID) skip repeated paid calls.
+        """
+
+        from ..llm.cache import RESPONSE_CACHE_FILENAME, ResponseCache, ResponseCacheStore
+
+        if config.response_cache_dir is None:
+            return ResponseCache()
+        return ResponseCache(
+            store=ResponseCacheStore(config.response_cache_dir / RESPONSE_CACHE_FILENAME)
+        )
+
+    @_stage_guard(
+        "translate",
+        "Failed to translate chunks",
+        "Check translator provider configuration and language settings.",
+        provider_errors=True,
+    )
     def _translate(
         self, chunks: list[Chunk], config: BookvoiceConfig
     ) -> list[TranslationResult]:
         """Translate chunks into target-language text."""
 
+        runtime_config = self._resolve_runtime_config(config)
+        from ..provider_factory import ProviderFactory
+
+        response_cache = self._stage_response_cache(config)
+        translator = ProviderFactory.create_translator(
+            provider_id=runtime_config.translator_provider,
+            model=runtime_config.translate_model,
+            api_key=runtime_config.api_key,
+            response_cache=response_cache,
+            max_connections=config.provider_concurrency,
+        )
         try:
-            runtime_config = self._resolve_runtime_config(config)
-            translator = ProviderFactory.create_translator(
-                provider_id=runtime_config.translator_provider,
-                model=runtime_config.translate_model,
-                api_key=runtime_config.api_key,
+            translations = _map_provider_calls(
+                lambda chunk: translator.translate(chunk, target_language=config.language),
+                chunks,
+                config.provider_concurrency,
             )
-            translations = [
-                translator.translate(chunk, target_language=config.language)
-                for chunk in chunks
-            ]
-            self._record_provider_retry_attempts(
-                getattr(translator, "retry_attempt_count", 0)
-            )
-            self._record_provider_cache_stats(
-                hits=getattr(translator, "cache_hits", 0),
-                misses=getattr(translator, "cache_misses", 0),
-            )
-            return translations
-        except OpenAIProviderError as exc:
-            raise self._provider_stage_error("translate", exc) from exc
-        except PipelineStageError:
-            raise
-        except Exception as exc:
-            raise PipelineStageError(
-                stage="translate",
-                detail=f"Failed to translate chunks: {exc}",
-                hint="Check translator provider configuration and language settings.",
-            ) from exc
-
+        finally:
+            _close_stage_provider(translator)
+            if response_cache.store is not None:
+                response_cache.store.close()
+        self._record_provider_retry_attempts(
+            getattr(translator, "retry_attempt_count", 0)
+        )
+        self._record_provider_cache_stats(
+            hits=getattr(translator, "cache_hits", 0),
+            misses=getattr(translator, "cache_misses", 0),
+        )
+        return translations
+
+    @_stage_guard(
+        "rewrite",
+        "Failed to rewrite translated text for audio",
+        "Check translator outputs and rewrite provider configuration.",
+        provider_errors=True,
+    )
     def _rewrite_for_audio(
         self,
         translations: list[TranslationResult],
@@ -387,40 +642,49 @@ class PipelineExecutionMixin:
     ) -> list[RewriteResult]:
         """Rewrite translated text for natural spoken delivery."""
 
+        resolved_runtime = (
+            runtime_config
+            if runtime_config is not None
+            else self._resolve_runtime_config(config)
+        )
+        if resolved_runtime.rewrite_bypass:
+            from ..llm.audio_rewriter import DeterministicBypassRewriter
+
+            bypass_rewriter = DeterministicBypassRewriter()
+            return [bypass_rewriter.rewrite(translation) for translation in translations]
+        from ..provider_factory import ProviderFactory
+
+        response_cache = self._stage_response_cache(config)
+        rewriter = ProviderFactory.create_rewriter(
+            provider_id=resolved_runtime.rewriter_provider,
+            model=resolved_runtime.rewrite_model,
+            api_key=resolved_runtime.api_key,
+            response_cache=response_cache,
+            max_connections=config.provider_concurrency,
+        )
         try:
-            resolved_runtime = (
-                runtime_config
-                if runtime_config is not None
-                else self._resolve_runtime_config(config)
-            )
-            if resolved_runtime.rewrite_bypass:
-                bypass_rewriter = DeterministicBypassRewriter()
-                return [bypass_rewriter.rewrite(translation) for translation in translations]
-            rewriter = ProviderFactory.create_rewriter(
-                provider_id=resolved_runtime.rewriter_provider,
-                model=resolved_runtime.rewrite_model,
-                api_key=resolved_runtime.api_key,
-            )
-            rewrites = [rewriter.rewrite(translation) for translation in translations]
-            self._record_provider_retry_attempts(
-                getattr(rewriter, "retry_attempt_count", 0)
+            rewrites = _map_provider_calls(
+                rewriter.rewrite, translations, config.provider_concurrency
             )
-            self._record_provider_cache_stats(
-                hits=getattr(rewriter, "cache_hits", 0),
-                misses=getattr(rewriter, "cache_misses", 0),
-            )
-            return rewrites
-        except OpenAIProviderError as exc:
-            raise self._provider_stage_error("rewrite", exc) from exc
-        except PipelineStageError:
-            raise
-        except Exception as exc:
-            raise PipelineStageError(
-                stage="rewrite",
-                detail=f"Failed to rewrite translated text for audio: {exc}",
-                hint="Check translator outputs and rewrite provider configuration.",
-            ) from exc
-
+        finally:
+            _close_stage_provider(rewriter)
+            if response_cache.store is not None:
+                response_cache.store.close()
+        self._record_provider_retry_attempts(
+            getattr(rewriter, "retry_attempt_count", 0)
+        )
+        self._record_provider_cache_stats(
+            hits=getattr(rewriter, "cache_hits", 0),
+            misses=getattr(rewriter, "cache_misses", 0),
+        )
+        return rewrites
+
+    @_stage_guard(
+        "tts",
+        "Failed to synthesize audio parts",
+        "Check TTS provider configuration and output directory permissions.",
+        provider_errors=True,
+    )
     def _tts(
         self,
         rewrites: list[RewriteResult],
@@ -430,57 +694,58 @@ class PipelineExecutionMixin:
     ) -> list[AudioPart]:
         """Synthesize audio parts for rewritten text chunks."""
 
+        resolved_runtime = (
+            runtime_config
+            if runtime_config is not None
+            else self._resolve_runtime_config(config)
+        )
+        from ..provider_factory import ProviderFactory
+        from ..tts.voices import VoiceProfile
+
+        voice = VoiceProfile(
+            name=resolved_runtime.tts_voice,
+            provider_voice_id=resolved_runtime.tts_voice,
+            language=config.language,
+            speaking_rate=1.0,
+        )
+        synthesizer = ProviderFactory.create_tts_synthesizer(
+            provider_id=resolved_runtime.tts_provider,
+            output_root=store.root / AUDIO_CHUNKS_REL_DIR,
+            model=resolved_runtime.tts_model,
+            api_key=resolved_runtime.api_key,
+            max_connections=config.provider_concurrency,
+        )
         try:
-            resolved_runtime = (
-                runtime_config
-                if runtime_config is not None
-                else self._resolve_runtime_config(config)
-            )
-            voice = VoiceProfile(
-                name=resolved_runtime.tts_voice,
-                provider_voice_id=resolved_runtime.tts_voice,
-                language=config.language,
-                speaking_rate=1.0,
-            )
-            synthesizer = ProviderFactory.create_tts_synthesizer(
-                provider_id=resolved_runtime.tts_provider,
-                output_root=store.root / "audio/chunks",
-                model=resolved_runtime.tts_model,
-                api_key=resolved_runtime.api_key,
+            audio_parts = _map_provider_calls(
+                lambda item: synthesizer.synthesize(item, voice),
+                rewrites,
+                config.provider_concurrency,
             )
-            audio_parts = [synthesizer.synthesize(item, voice) for item in rewrites]
-            self._record_provider_retry_attempts(
-                getattr(synthesizer, "retry_attempt_count", 0)
-            )
-            return audio_parts
-        except OpenAIProviderError as exc:
-            raise self._provider_stage_error("tts", exc) from exc
-        except PipelineStageError:
-            raise
-        except Exception as exc:
-            raise PipelineStageError(
-                stage="tts",
-                detail=f"Failed to synthesize audio parts: {exc}",
-                hint="Check TTS provider configuration and output directory permissions.",
-            ) from exc
+        finally:
+            _close_stage_provider(synthesizer)
+        self._record_provider_retry_attempts(
+            getattr(synthesizer, "retry_attempt_count", 0)
+        )
+        return audio_parts
 
+    @_stage_guard(
+        "postprocess",
+        "Failed to postprocess synthesized audio",
+        "Verify generated chunk WAV files are readable.",
+    )
     def _postprocess(
         self, audio_parts: list[AudioPart], config: BookvoiceConfig
     ) -> list[AudioPart]:
         """Return deterministic part metadata before merged-output postprocessing."""
 
-        try:
-            _ = config
-            return list(audio_parts)
-        except PipelineStageError:
-            raise
-        except Exception as exc:
-            raise PipelineStageError(
-                stage="postprocess",
-                detail=f"Failed to postprocess synthesized audio: {exc}",
-                hint="Verify generated chunk WAV files are readable.",
-            ) from exc
+        _ = config
+        return list(audio_parts)
 
+    @_stage_guard(
+        "merge",
+        "Failed to merge audio outputs",
+        "Check synthesized part files and output directory permissions.",
+    )
     def _merge(
         self,
         audio_parts: list[AudioPart],
@@ -490,66 +755,56 @@ class PipelineExecutionMixin:
     ) -> Path:
         """Merge chapter or book-level audio outputs."""
 
-        try:
-            merger = AudioMerger()
-            merged_path = merger.merge(
-                audio_parts,
-                output_path=(
-                    output_path
-                    if output_path is not None
-                    else store.root / "audio/bookvoice_merged.wav"
-                ),
-            )
-            postprocessor = AudioPostProcessor()
-            processed_path = postprocessor.process_merged(merged_path)
+        from ..audio.tags import AudioTagContext
 
-            sorted_parts = sorted(
-                audio_parts,
-                key=lambda item: (item.chapter_index, item.chunk_index),
-            )
-            chapter_indices = sorted({part.chapter_index for part in sorted_parts})
-            chapter_indices_csv = ",".join(str(index) for index in chapter_indices)
-            chapter_scope_label = (
-                "all"
-                if not config.chapter_selection
-                else (
-                    f"{chapter_indices[0]}-{chapter_indices[-1]}"
-                    if chapter_indices
-                    else "selected"
-                )
-            )
-            part_ids_csv = ",".join(
-                part.part_id if part.part_id is not None else str(part.chunk_index)
-                for part in sorted_parts
-            )
-            merged_title = (
-                config.source_path.stem
-                if chapter_scope_label == "all"
-                else f"{config.source_path.stem} (chapters {chapter_scope_label})"
-            )
-            source_identifier = f"{config.source_path.name}#{store.root.name}"
-
-            metadata_writer = MetadataWriter()
-            metadata_writer.write(
-                processed_path,
-                AudioTagContext(
-                    title=merged_title,
-                    chapter_scope_label=chapter_scope_label,
-                    chapter_indices_csv=chapter_indices_csv,
-                    source_identifier=source_identifier,
-                    part_count=len(sorted_parts),
-                    part_ids_csv=part_ids_csv,
-                ),
+        merged_path = self._audio_merger.merge(
+            audio_parts,
+            output_path=(
+                output_path
+                if output_path is not None
+                else store.root / MERGED_AUDIO_REL_PATH
+            ),
+        )
+        processed_path = self._audio_postprocessor.process_merged(merged_path)
+
+        sorted_parts = sorted(
+            audio_parts,
+            key=lambda item: (item.chapter_index, item.chunk_index),
+        )
+        chapter_indices = sorted({part.chapter_index for part in sorted_parts})
+        chapter_indices_csv = ",".join(str(index) for index in chapter_indices)
+        chapter_scope_label = (
+            "all"
+            if not config.chapter_selection
+            else (
+                f"{chapter_indices[0]}-{chapter_indices[-1]}"
+                if chapter_indices
+                else "selected"
             )
-            return processed_path
-        except PipelineStageError:
-            raise
-        except Exception as exc:
-            raise PipelineStageError(
-                stage="merge",
-                detail=f"Failed to merge audio outputs: {exc}",
-                hint="Check synthesized part files and output directory permissions.",
-            ) from exc
+        )
+        part_ids_csv = ",".join(
+            part.part_id if part.part_id is not None else str(part.chunk_index)
+            for part in sorted_parts
+        )
+        merged_title = (
+            config.source_path.stem
+            if chapter_scope_label == "all"
+            else f"{config.source_path.stem} (chapters {chapter_scope_label})"
+        )
+        source_identifier = f"{config.source_path.name}#{store.root.name}"
+
+        self._metadata_writer.write(
+            processed_path,
+            AudioTagContext(
+                title=merged_title,
+                chapter_scope_label=chapter_scope_label,
+                chapter_indices_csv=chapter_indices_csv,
+                source_identifier=source_identifier,
+                part_count=len(sorted_parts),
+                part_ids_csv=part_ids_csv,
+            ),
+        )
+        return processed_path
 
     def _merged_output_path_for_scope(
         self, store: ArtifactStore, chapter_scope: dict[str, str]
@@ -558,7 +813,7 @@ class PipelineExecutionMixin:
 
         scope_mode = chapter_scope.get("chapter_scope_mode", "all")
         if scope_mode == "all":
-            return store.root / "audio/bookvoice_merged.wav"
+            return store.root / MERGED_AUDIO_REL_PATH
         indices_csv = chapter_scope.get("chapter_scope_indices_csv", "")
         suffix = (
             indices_csv.replace(",", "_")
@@ -651,6 +906,11 @@ class PipelineExecutionMixin:
             "packaging_tags_chapter_count": str(chapter_count),
         }
 
+    @_stage_guard(
+        "package",
+        "Failed to package chapter outputs",
+        "Check packaging settings, source WAV artifacts, and ffmpeg installation.",
+    )
     def _package(
         self,
         *,
@@ -662,25 +922,15 @@ class PipelineExecutionMixin:
     ) -> list[PackagedAudio]:
         """Export chapter-split packaged outputs as an additive stage after merge."""
 
-        try:
-            resolved_options = options if options is not None else self._packaging_options(config)
-            packager = AudioPackager()
-            return packager.package(
+        resolved_options = options if options is not None else self._packaging_options(config)
+        return self._audio_packager.package(
+            audio_parts=audio_parts,
+            merged_path=merged_path,
+            output_root=store.root / AUDIO_PACKAGE_REL_DIR,
+            options=resolved_options,
+            tag_context=self._packaging_tag_context(
                 audio_parts=audio_parts,
-                merged_path=merged_path,
-                output_root=store.root / "audio/package",
-                options=resolved_options,
-                tag_context=self._packaging_tag_context(
-                    audio_parts=audio_parts,
-                    config=config,
-                    store=store,
-                ),
-            )
-        except PipelineStageError:
-            raise
-        except Exception as exc:
-            raise PipelineStageError(
-                stage="package",
-                detail=f"Failed to package chapter outputs: {exc}",
-                hint="Check packaging settings, source WAV artifacts, and ffmpeg installation.",
-            ) from exc
+                config=config,
+                store=store,
+            ),
+        )
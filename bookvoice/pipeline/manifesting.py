@@ -3,6 +3,7 @@
 Responsibilities:
 - Build the typed `RunManifest` record for a completed run.
 - Persist manifest payload to deterministic artifact path.
+- Record an artifact fingerprint so unchanged completed runs can skip resume replay.
 - Map unexpected failures to stage-aware manifest errors.
 """
 
@@ -15,7 +16,8 @@ from ..errors import PipelineStageError
 from ..io.epub_text_extractor import EpubExtractionError, EpubTextExtractor
 from ..io.storage import ArtifactStore
 from ..models.datatypes import BookMeta, RunManifest
-from .artifacts import manifest_payload
+from .artifacts import RUN_MANIFEST_REL_PATH, manifest_payload
+from .resume import ARTIFACT_DIGEST_KEYS, artifacts_digest
 
 
 class PipelineManifestMixin:
@@ -41,6 +43,20 @@ class PipelineManifestMixin:
             pass
         return title, author
 
+    @staticmethod
+    def _manifest_extra(
+        config: BookvoiceConfig, merged_audio_path: Path, artifact_paths: dict[str, str]
+    ) -> dict[str, str]:
+        """Return manifest extras, fingerprinting artifacts when every path is recorded."""
+
+        extra = {**artifact_paths, "output_language": config.language}
+        digest_paths = [artifact_paths.get(key) for key in ARTIFACT_DIGEST_KEYS]
+        if all(digest_paths):
+            extra["artifacts_digest"] = artifacts_digest(
+                [*(Path(str(path)) for path in digest_paths), merged_audio_path]
+            )
+        return extra
+
     def _write_manifest(
         self,
         config: BookvoiceConfig,
@@ -70,9 +86,9 @@ class PipelineManifestMixin:
                 total_llm_cost_usd=cost_summary["llm_cost_usd"],
                 total_tts_cost_usd=cost_summary["tts_cost_usd"],
                 total_cost_usd=cost_summary["total_cost_usd"],
-                extra={**artifact_paths, "output_language": config.language},
+                extra=self._manifest_extra(config, merged_audio_path, artifact_paths),
             )
-            manifest_path = store.save_json(Path("run_manifest.json"), manifest_payload(manifest))
+            manifest_path = store.save_json(RUN_MANIFEST_REL_PATH, manifest_payload(manifest))
             return RunManifest(
                 run_id=manifest.run_id,
                 config_hash=manifest.config_hash,
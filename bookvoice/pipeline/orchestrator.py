@@ -11,7 +11,7 @@ Key types:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from collections.abc import Callable
 from pathlib import Path
 
@@ -19,7 +19,7 @@ from ..config import BookvoiceConfig, ProviderRuntimeConfig
 from ..errors import PipelineStageError
 from ..io.epub_exporter import EpubExportRequest, EpubExporter
 from ..io.pdf_exporter import PdfExportRequest, PdfExporter
-from ..io.storage import ArtifactStore
+from ..io.storage import ArtifactStore, DeferredArtifactWriter
 from ..models.datatypes import (
     AudioPart,
     Chapter,
@@ -33,15 +33,27 @@ from ..models.datatypes import (
 from ..telemetry.cost_tracker import CostTracker
 from ..telemetry.logger import RunLogger
 from .artifacts import (
+    AUDIO_PARTS_REL_PATH,
+    CHAPTERS_REL_PATH,
+    CHUNKS_REL_PATH,
+    CLEAN_TEXT_REL_PATH,
+    PACKAGED_AUDIO_REL_PATH,
+    RAW_TEXT_REL_PATH,
+    REWRITES_REL_PATH,
+    RUN_MANIFEST_REL_PATH,
+    SOURCE_DIGEST_REL_PATH,
+    TRANSLATED_DOCUMENT_REL_PATH,
+    TRANSLATIONS_REL_PATH,
     audio_parts_artifact_payload,
     chapter_artifact_payload,
+    ChunkPayloadMemo,
+    TranslationPayloadMemo,
     chunk_artifact_payload,
     load_json_object,
     load_audio_parts,
-    load_chapter_metadata,
-    load_chapters,
+    load_chapter_artifact,
+    load_chunk_artifact,
     load_chunks,
-    load_normalized_structure,
     load_packaged_audio,
     load_rewrites,
     load_translated_document,
@@ -67,8 +79,12 @@ from .reader_exports import (
     resolve_reader_export_formats,
 )
 from .resume import (
+    all_paths_exist,
+    artifacts_digest,
     ensure_recoverable_resume_state,
+    existing_artifact_paths,
     load_manifest_payload,
+    manifest_anchored_paths,
     manifest_bool,
     manifest_string,
     require_manifest_field,
@@ -76,12 +92,23 @@ from .resume import (
     resolve_merged_path,
     resolve_run_root,
     ResumeArtifactConsistencyReport,
+    run_manifest_from_payload,
     validate_resume_artifact_consistency,
 )
 from .runtime import PipelineRuntimeMixin
 from .telemetry import PipelineTelemetryMixin
 
 
+_REUSABLE_RUN_ARTIFACTS = (
+    RAW_TEXT_REL_PATH,
+    CLEAN_TEXT_REL_PATH,
+    CHAPTERS_REL_PATH,
+    CHUNKS_REL_PATH,
+    TRANSLATIONS_REL_PATH,
+    REWRITES_REL_PATH,
+)
+
+
 @dataclass(slots=True)
 class ResumeArtifactPaths:
     """Resolved artifact paths used by the resume flow."""
@@ -111,6 +138,7 @@ class ResumeState:
     paths: ResumeArtifactPaths
     next_stage: str
     validation_report: ResumeArtifactConsistencyReport
+    existing_paths: frozenset[Path] = field(default_factory=frozenset)
     cost_tracker: CostTracker = field(default_factory=CostTracker)
     chapter_source: str = "unknown"
     chapter_fallback_reason: str = ""
@@ -123,6 +151,8 @@ class ResumeState:
     normalized_structure: list[ChapterStructureUnit] = field(default_factory=list)
     selected_chapters: list[Chapter] = field(default_factory=list)
     chunks: list[Chunk] = field(default_factory=list)
+    chunk_payloads: ChunkPayloadMemo = field(default_factory=dict)
+    translation_payloads: TranslationPayloadMemo = field(default_factory=dict)
     translations: list[TranslationResult] = field(default_factory=list)
     rewrites: list[RewriteResult] = field(default_factory=list)
     audio_parts: list[AudioPart] = field(default_factory=list)
@@ -130,6 +160,21 @@ class ResumeState:
     final_merged_path: Path | None = None
     packaged_outputs: list[PackagedAudio] = field(default_factory=list)
     reuse_packaged_outputs: bool = False
+    artifact_writer: DeferredArtifactWriter | None = None
+
+    def save_text(self, relative_path: Path, content: str) -> Path:
+        """Persist a text artifact, through the deferred writer when one is active."""
+
+        if self.artifact_writer is not None:
+            return self.artifact_writer.save_text(relative_path, content)
+        return self.store.save_text(relative_path, content)
+
+    def save_json(self, relative_path: Path, payload: dict[str, object]) -> Path:
+        """Persist a JSON artifact, through the deferred writer when one is active."""
+
+        if self.artifact_writer is not None:
+            return self.artifact_writer.save_json(relative_path, payload)
+        return self.store.save_json(relative_path, payload)
 
 
 class BookvoicePipeline(
@@ -219,8 +264,7 @@ class BookvoicePipeline(
             )
 
         try:
-            chapters = load_chapters(chapters_artifact)
-            metadata = load_chapter_metadata(chapters_artifact)
+            chapters, metadata, _ = load_chapter_artifact(chapters_artifact)
         except PipelineStageError as exc:
             raise PipelineStageError(
                 stage="chapters-artifact",
@@ -250,147 +294,268 @@ class BookvoicePipeline(
         runtime_config = self._resolve_runtime_config(config)
         cost_tracker = CostTracker()
 
-        raw_text = self._run_stage("extract", lambda: self._extract(config))
-        raw_text_path = store.save_text(Path("text/raw.txt"), raw_text)
+        source_digest = artifacts_digest((config.source_path,))
+        reusable, previous_extra = self._reusable_run_artifacts(config, store, source_digest)
+
+        with DeferredArtifactWriter(store) as artifact_writer:
+            raw_text_path = store.root / RAW_TEXT_REL_PATH
+            if RAW_TEXT_REL_PATH not in reusable:
+                raw_text = self._run_stage("extract", lambda: self._extract(config))
+                raw_text_path = artifact_writer.save_text(RAW_TEXT_REL_PATH, raw_text)
+                artifact_writer.save_json(SOURCE_DIGEST_REL_PATH, {"source_digest": source_digest})
+            elif CLEAN_TEXT_REL_PATH not in reusable:
+                raw_text = raw_text_path.read_text(encoding="utf-8")
+
+            clean_text_path = store.root / CLEAN_TEXT_REL_PATH
+            if CLEAN_TEXT_REL_PATH not in reusable:
+                clean_text, clean_metadata = self._run_stage(
+                    "clean",
+                    lambda: self._clean_with_metadata(raw_text),
+                )
+                clean_text_path = artifact_writer.save_text(CLEAN_TEXT_REL_PATH, clean_text)
+            else:
+                clean_metadata = {
+                    "drop_cap_merges_count": self._manifest_int(
+                        previous_extra, "drop_cap_merges_count", 0
+                    )
+                }
+                if CHAPTERS_REL_PATH not in reusable:
+                    clean_text = clean_text_path.read_text(encoding="utf-8")
+
+            chapters_path = store.root / CHAPTERS_REL_PATH
+            if CHAPTERS_REL_PATH in reusable:
+                chapters, chapter_metadata, normalized_structure = load_chapter_artifact(
+                    chapters_path
+                )
+                chapter_source = chapter_metadata["source"] or "unknown"
+                chapter_fallback_reason = chapter_metadata["fallback_reason"]
+                clean_metadata = {
+                    "drop_cap_merges_count": int(chapter_metadata["drop_cap_merges_count"])
+                }
+                if not normalized_structure:
+                    normalized_structure = self._extract_normalized_structure(
+                        chapters, chapter_source, config.source_path
+                    )
+            else:
+                chapters, chapter_source, chapter_fallback_reason = self._run_stage(
+                    "split",
+                    lambda: self._split_chapters(clean_text, config.source_path),
+                )
+                normalized_structure = self._extract_normalized_structure(
+                    chapters, chapter_source, config.source_path
+                )
+            selected_chapters, chapter_scope = self._resolve_chapter_scope(
+                chapters, config.chapter_selection
+            )
+            if CHAPTERS_REL_PATH not in reusable:
+                chapters_path = artifact_writer.save_json(
+                    CHAPTERS_REL_PATH,
+                    chapter_artifact_payload(
+                        chapters,
+                        chapter_source,
+                        chapter_fallback_reason,
+                        chapter_scope,
+                        normalized_structure,
+                        clean_metadata=clean_metadata,
+                    ),
+                )
 
-        clean_text, clean_metadata = self._run_stage(
-            "clean",
-            lambda: self._clean_with_metadata(raw_text),
-        )
-        clean_text_path = store.save_text(Path("text/clean.txt"), clean_text)
+            chunks_path = store.root / CHUNKS_REL_PATH
+            chunk_payloads: ChunkPayloadMemo = {}
+            translation_payloads: TranslationPayloadMemo = {}
+            if CHUNKS_REL_PATH in reusable:
+                chunks, chunk_metadata = load_chunk_artifact(chunks_path)
+            else:
+                chunks, chunk_metadata = self._run_stage(
+                    "chunk",
+                    lambda: self._chunk(selected_chapters, normalized_structure, config),
+                )
+                chunks_path = artifact_writer.save_json(
+                    CHUNKS_REL_PATH,
+                    chunk_artifact_payload(
+                        chunks, chapter_scope, chunk_metadata, chunk_payloads
+                    ),
+                )
 
-        chapters, chapter_source, chapter_fallback_reason = self._run_stage(
-            "split",
-            lambda: self._split_chapters(clean_text, config.source_path),
-        )
-        normalized_structure = self._extract_normalized_structure(
-            chapters, chapter_source, config.source_path
-        )
-        selected_chapters, chapter_scope = self._resolve_chapter_scope(
-            chapters, config.chapter_selection
-        )
-        chapters_path = store.save_json(
-            Path("text/chapters.json"),
-            chapter_artifact_payload(
-                chapters,
-                chapter_source,
-                chapter_fallback_reason,
-                chapter_scope,
-                normalized_structure,
-                clean_metadata=clean_metadata,
-            ),
-        )
+            translations_path = store.root / TRANSLATIONS_REL_PATH
+            if TRANSLATIONS_REL_PATH in reusable:
+                translations = load_translations(translations_path)
+            else:
+                translations = self._run_stage(
+                    "translate", lambda: self._translate(chunks, config)
+                )
+                translations_path = artifact_writer.save_json(
+                    TRANSLATIONS_REL_PATH,
+                    translation_artifact_payload(
+                        translations,
+                        chapter_scope,
+                        runtime_config,
+                        chunk_payloads,
+                        translation_payloads,
+                    ),
+                )
+            add_translation_costs(translations, cost_tracker)
 
-        chunks, chunk_metadata = self._run_stage(
-            "chunk",
-            lambda: self._chunk(selected_chapters, normalized_structure, config),
-        )
-        chunks_path = store.save_json(
-            Path("text/chunks.json"),
-            chunk_artifact_payload(chunks, chapter_scope, chunk_metadata),
-        )
+            rewrites_path = store.root / REWRITES_REL_PATH
+            if REWRITES_REL_PATH in reusable:
+                rewrites = load_rewrites(rewrites_path, translations)
+            else:
+                rewrites = self._run_stage(
+                    "rewrite",
+                    lambda: self._rewrite_for_audio(translations, config, runtime_config),
+                )
+                rewrites_path = artifact_writer.save_json(
+                    REWRITES_REL_PATH,
+                    rewrite_artifact_payload(
+                        rewrites,
+                        chapter_scope,
+                        runtime_config,
+                        chunk_payloads,
+                        translation_payloads,
+                    ),
+                )
+            add_rewrite_costs(rewrites, cost_tracker)
 
-        translations = self._run_stage("translate", lambda: self._translate(chunks, config))
-        add_translation_costs(translations, cost_tracker)
-        translations_path = store.save_json(
-            Path("text/translations.json"),
-            translation_artifact_payload(translations, chapter_scope, runtime_config),
-        )
+            audio_parts = self._run_stage(
+                "tts",
+                lambda: self._tts(rewrites, config, store, runtime_config),
+            )
+            add_tts_costs(rewrites, cost_tracker)
+            audio_parts_path = artifact_writer.save_json(
+                AUDIO_PARTS_REL_PATH,
+                audio_parts_artifact_payload(audio_parts, chapter_scope, runtime_config),
+            )
+            part_mapping_metadata = part_mapping_manifest_metadata(audio_parts)
+
+            merged_path = self._run_stage(
+                "merge",
+                lambda: self._merge(
+                    self._postprocess(audio_parts, config),
+                    config,
+                    store,
+                    output_path=self._merged_output_path_for_scope(store, chapter_scope),
+                ),
+            )
+            packaging_options = self._packaging_options(config)
+            packaged_outputs = self._run_stage(
+                "package",
+                lambda: self._package(
+                    audio_parts=audio_parts,
+                    merged_path=merged_path,
+                    config=config,
+                    store=store,
+                    options=packaging_options,
+                ),
+            )
+            packaging_metadata = {
+                **self._packaging_manifest_metadata(packaging_options),
+                **self._packaging_tag_manifest_metadata(
+                    audio_parts=audio_parts,
+                    config=config,
+                    store=store,
+                    options=packaging_options,
+                ),
+            }
+            packaged_output_metadata = self._packaged_output_manifest_metadata(packaged_outputs)
+            packaged_path = artifact_writer.save_json(
+                PACKAGED_AUDIO_REL_PATH,
+                packaged_audio_artifact_payload(
+                    packaged_outputs, chapter_scope, packaging_metadata
+                ),
+            )
 
-        rewrites = self._run_stage(
-            "rewrite",
-            lambda: self._rewrite_for_audio(translations, config, runtime_config),
-        )
-        add_rewrite_costs(rewrites, cost_tracker)
-        rewrites_path = store.save_json(
-            Path("text/rewrites.json"),
-            rewrite_artifact_payload(rewrites, chapter_scope, runtime_config),
+            artifact_writer.flush()
+            manifest = self._run_stage(
+                "manifest",
+                lambda: self._write_manifest(
+                    config=config,
+                    run_id=run_id,
+                    config_hash=config_hash,
+                    merged_audio_path=merged_path,
+                    artifact_paths={
+                        "run_root": str(store.root),
+                        "raw_text": str(raw_text_path),
+                        "clean_text": str(clean_text_path),
+                        "chapters": str(chapters_path),
+                        "chunks": str(chunks_path),
+                        "translations": str(translations_path),
+                        "rewrites": str(rewrites_path),
+                        "audio_parts": str(audio_parts_path),
+                        "merged_audio_filename": merged_path.name,
+                        "packaged_audio": str(packaged_path),
+                        "source_digest": source_digest,
+                        "chapter_source": chapter_source,
+                        "chapter_fallback_reason": chapter_fallback_reason,
+                        "drop_cap_merges_count": str(
+                            int(clean_metadata.get("drop_cap_merges_count", 0))
+                        ),
+                        "sentence_boundary_repairs_count": str(
+                            self._manifest_int(chunk_metadata, "sentence_boundary_repairs_count", 0)
+                        ),
+                        **part_mapping_metadata,
+                        **packaging_metadata,
+                        **packaged_output_metadata,
+                        **self._provider_call_manifest_metadata(),
+                        **runtime_config.as_manifest_metadata(),
+                        **chapter_scope,
+                    },
+                    cost_summary=rounded_cost_summary(cost_tracker),
+                    store=store,
+                ),
+            )
+            return manifest
+
+    def _reusable_run_artifacts(
+        self, config: BookvoiceConfig, store: ArtifactStore, source_digest: str
+    ) -> tuple[frozenset[Path], dict[str, object]]:
+        """Return stage artifacts a resume-enabled build can load instead of recompute.
+
+        Only the contiguous prefix of existing text/chunk/LLM artifacts is reused,
+        so a stage is never loaded on top of an upstream artifact that is missing.
+        Reuse also requires `text/source_digest.json`, written next to the raw
+        text, to match `source_digest`, so artifacts extracted from an edited
+        source at the same path are rebuilt, and interrupted builds still reuse
+        their finished stages. The previous manifest extras are returned for
+        values reused stages no longer recompute; without a manifest, clean text
+        is only reused together with the chapters that record its metadata.
+        """
+
+        if not config.resume:
+            return frozenset(), {}
+        if self._recorded_source_digest(store) != source_digest:
+            return frozenset(), {}
+        previous_extra = self._previous_run_manifest_extra(store)
+        existing_paths = existing_artifact_paths(
+            store.root / relative_path for relative_path in _REUSABLE_RUN_ARTIFACTS
         )
+        reusable: list[Path] = []
+        for relative_path in _REUSABLE_RUN_ARTIFACTS:
+            if store.root / relative_path not in existing_paths:
+                break
+            reusable.append(relative_path)
+        if reusable[-1:] == [CLEAN_TEXT_REL_PATH] and "drop_cap_merges_count" not in previous_extra:
+            reusable.pop()
+        return frozenset(reusable), previous_extra
 
-        audio_parts = self._run_stage(
-            "tts",
-            lambda: self._tts(rewrites, config, store, runtime_config),
-        )
-        add_tts_costs(rewrites, cost_tracker)
-        audio_parts_path = store.save_json(
-            Path("audio/parts.json"),
-            audio_parts_artifact_payload(audio_parts, chapter_scope, runtime_config),
-        )
-        part_mapping_metadata = part_mapping_manifest_metadata(audio_parts)
+    @staticmethod
+    def _recorded_source_digest(store: ArtifactStore) -> object:
+        """Return the source digest recorded with the raw text, or `None` when unreadable."""
 
-        merged_path = self._run_stage(
-            "merge",
-            lambda: self._merge(
-                self._postprocess(audio_parts, config),
-                config,
-                store,
-                output_path=self._merged_output_path_for_scope(store, chapter_scope),
-            ),
-        )
-        packaging_options = self._packaging_options(config)
-        packaged_outputs = self._run_stage(
-            "package",
-            lambda: self._package(
-                audio_parts=audio_parts,
-                merged_path=merged_path,
-                config=config,
-                store=store,
-                options=packaging_options,
-            ),
-        )
-        packaging_metadata = {
-            **self._packaging_manifest_metadata(packaging_options),
-            **self._packaging_tag_manifest_metadata(
-                audio_parts=audio_parts,
-                config=config,
-                store=store,
-                options=packaging_options,
-            ),
-        }
-        packaged_output_metadata = self._packaged_output_manifest_metadata(packaged_outputs)
-        packaged_path = store.save_json(
-            Path("audio/packaged.json"),
-            packaged_audio_artifact_payload(packaged_outputs, chapter_scope, packaging_metadata),
-        )
+        try:
+            return load_json_object(store.root / SOURCE_DIGEST_REL_PATH).get("source_digest")
+        except (OSError, PipelineStageError):
+            return None
 
-        manifest = self._run_stage(
-            "manifest",
-            lambda: self._write_manifest(
-                config=config,
-                run_id=run_id,
-                config_hash=config_hash,
-                merged_audio_path=merged_path,
-                artifact_paths={
-                    "run_root": str(store.root),
-                    "raw_text": str(raw_text_path),
-                    "clean_text": str(clean_text_path),
-                    "chapters": str(chapters_path),
-                    "chunks": str(chunks_path),
-                    "translations": str(translations_path),
-                    "rewrites": str(rewrites_path),
-                    "audio_parts": str(audio_parts_path),
-                    "merged_audio_filename": merged_path.name,
-                    "packaged_audio": str(packaged_path),
-                    "chapter_source": chapter_source,
-                    "chapter_fallback_reason": chapter_fallback_reason,
-                    "drop_cap_merges_count": str(
-                        int(clean_metadata.get("drop_cap_merges_count", 0))
-                    ),
-                    "sentence_boundary_repairs_count": str(
-                        self._manifest_int(chunk_metadata, "sentence_boundary_repairs_count", 0)
-                    ),
-                    **part_mapping_metadata,
-                    **packaging_metadata,
-                    **packaged_output_metadata,
-                    **self._provider_call_manifest_metadata(),
-                    **runtime_config.as_manifest_metadata(),
-                    **chapter_scope,
-                },
-                cost_summary=rounded_cost_summary(cost_tracker),
-                store=store,
-            ),
-        )
-        return manifest
+    @staticmethod
+    def _previous_run_manifest_extra(store: ArtifactStore) -> dict[str, object]:
+        """Return manifest extras persisted by a previous run, or `{}` when unreadable."""
+
+        try:
+            payload = load_manifest_payload(store.root / RUN_MANIFEST_REL_PATH)
+        except PipelineStageError:
+            return {}
+        extra = payload.get("extra")
+        return extra if isinstance(extra, dict) else {}
 
     def run_chapters_only(self, config: BookvoiceConfig) -> RunManifest:
         """Run only extract/clean/split stages and persist chapter artifacts."""
@@ -399,18 +564,20 @@ class BookvoicePipeline(
         run_id, config_hash, store = self._prepare_run(config)
         runtime_config = self._resolve_runtime_config(config)
 
+        source_digest = artifacts_digest((config.source_path,))
         raw_text = self._extract(config)
-        raw_text_path = store.save_text(Path("text/raw.txt"), raw_text)
+        raw_text_path = store.save_text(RAW_TEXT_REL_PATH, raw_text)
+        store.save_json(SOURCE_DIGEST_REL_PATH, {"source_digest": source_digest})
 
         clean_text, clean_metadata = self._clean_with_metadata(raw_text)
-        clean_text_path = store.save_text(Path("text/clean.txt"), clean_text)
+        clean_text_path = store.save_text(CLEAN_TEXT_REL_PATH, clean_text)
 
         chapters, chapter_source, chapter_fallback_reason = self._split_chapters(
             clean_text, config.source_path
         )
         _, chapter_scope = self._resolve_chapter_scope(chapters, config.chapter_selection)
         chapters_path = store.save_json(
-            Path("text/chapters.json"),
+            CHAPTERS_REL_PATH,
             chapter_artifact_payload(
                 chapters,
                 chapter_source,
@@ -431,6 +598,7 @@ class BookvoicePipeline(
                 "raw_text": str(raw_text_path),
                 "clean_text": str(clean_text_path),
                 "chapters": str(chapters_path),
+                "source_digest": source_digest,
                 "chapter_source": chapter_source,
                 "chapter_fallback_reason": chapter_fallback_reason,
                 "drop_cap_merges_count": str(int(clean_metadata.get("drop_cap_merges_count", 0))),
@@ -452,54 +620,61 @@ class BookvoicePipeline(
         runtime_config = self._resolve_runtime_config(config)
         cost_tracker = CostTracker()
 
-        raw_text = self._run_stage("extract", lambda: self._extract(config))
-        raw_text_path = store.save_text(Path("text/raw.txt"), raw_text)
+        source_digest = artifacts_digest((config.source_path,))
+        with DeferredArtifactWriter(store) as artifact_writer:
+            raw_text = self._run_stage("extract", lambda: self._extract(config))
+            raw_text_path = artifact_writer.save_text(RAW_TEXT_REL_PATH, raw_text)
+            artifact_writer.save_json(SOURCE_DIGEST_REL_PATH, {"source_digest": source_digest})
 
-        clean_text, clean_metadata = self._run_stage(
-            "clean",
-            lambda: self._clean_with_metadata(raw_text),
-        )
-        clean_text_path = store.save_text(Path("text/clean.txt"), clean_text)
+            clean_text, clean_metadata = self._run_stage(
+                "clean",
+                lambda: self._clean_with_metadata(raw_text),
+            )
+            clean_text_path = artifact_writer.save_text(CLEAN_TEXT_REL_PATH, clean_text)
 
-        chapters, chapter_source, chapter_fallback_reason = self._run_stage(
-            "split",
-            lambda: self._split_chapters(clean_text, config.source_path),
-        )
-        normalized_structure = self._extract_normalized_structure(
-            chapters, chapter_source, config.source_path
-        )
-        selected_chapters, chapter_scope = self._resolve_chapter_scope(
-            chapters, config.chapter_selection
-        )
-        chapters_path = store.save_json(
-            Path("text/chapters.json"),
-            chapter_artifact_payload(
-                chapters,
-                chapter_source,
-                chapter_fallback_reason,
-                chapter_scope,
-                normalized_structure,
-                clean_metadata=clean_metadata,
-            ),
-        )
+            chapters, chapter_source, chapter_fallback_reason = self._run_stage(
+                "split",
+                lambda: self._split_chapters(clean_text, config.source_path),
+            )
+            normalized_structure = self._extract_normalized_structure(
+                chapters, chapter_source, config.source_path
+            )
+            selected_chapters, chapter_scope = self._resolve_chapter_scope(
+                chapters, config.chapter_selection
+            )
+            chapters_path = artifact_writer.save_json(
+                CHAPTERS_REL_PATH,
+                chapter_artifact_payload(
+                    chapters,
+                    chapter_source,
+                    chapter_fallback_reason,
+                    chapter_scope,
+                    normalized_structure,
+                    clean_metadata=clean_metadata,
+                ),
+            )
 
-        chunks, chunk_metadata = self._run_stage(
-            "chunk",
-            lambda: self._chunk(selected_chapters, normalized_structure, config),
-        )
-        chunks_path = store.save_json(
-            Path("text/chunks.json"),
-            chunk_artifact_payload(chunks, chapter_scope, chunk_metadata),
-        )
+            chunks, chunk_metadata = self._run_stage(
+                "chunk",
+                lambda: self._chunk(selected_chapters, normalized_structure, config),
+            )
+            chunk_payloads: ChunkPayloadMemo = {}
+            chunks_path = artifact_writer.save_json(
+                CHUNKS_REL_PATH,
+                chunk_artifact_payload(chunks, chapter_scope, chunk_metadata, chunk_payloads),
+            )
+
+            translations = self._run_stage("translate", lambda: self._translate(chunks, config))
+            add_translation_costs(translations, cost_tracker)
+            translations_path = artifact_writer.save_json(
+                TRANSLATIONS_REL_PATH,
+                translation_artifact_payload(
+                    translations, chapter_scope, runtime_config, chunk_payloads
+                ),
+            )
 
-        translations = self._run_stage("translate", lambda: self._translate(chunks, config))
-        add_translation_costs(translations, cost_tracker)
-        translations_path = store.save_json(
-            Path("text/translations.json"),
-            translation_artifact_payload(translations, chapter_scope, runtime_config),
-        )
         translated_document_path = store.save_json(
-            Path("text/translated_document.json"),
+            TRANSLATED_DOCUMENT_REL_PATH,
             translated_document_artifact_payload(
                 chapters=selected_chapters,
                 translations=translations,
@@ -593,6 +768,7 @@ class BookvoicePipeline(
                     "chunks": str(chunks_path),
                     "translations": str(translations_path),
                     "translated_document": str(translated_document_path),
+                    "source_digest": source_digest,
                     "chapter_source": chapter_source,
                     "chapter_fallback_reason": chapter_fallback_reason,
                     "drop_cap_merges_count": str(
@@ -631,7 +807,7 @@ class BookvoicePipeline(
         )
         add_tts_costs(state.rewrites, state.cost_tracker)
         state.paths.audio_parts = state.store.save_json(
-            Path("audio/parts.json"),
+            AUDIO_PARTS_REL_PATH,
             audio_parts_artifact_payload(
                 state.audio_parts,
                 state.chapter_scope,
@@ -671,7 +847,7 @@ class BookvoicePipeline(
         }
         packaged_output_metadata = self._packaged_output_manifest_metadata(packaged_outputs)
         state.paths.packaged = state.store.save_json(
-            Path("audio/packaged.json"),
+            PACKAGED_AUDIO_REL_PATH,
             packaged_audio_artifact_payload(
                 packaged_outputs,
                 state.chapter_scope,
@@ -750,7 +926,7 @@ class BookvoicePipeline(
     ) -> tuple[list[RewriteResult], dict[str, str]]:
         """Load and validate prerequisite artifacts for `tts-only` execution."""
 
-        if not state.paths.rewrites.exists():
+        if state.paths.rewrites not in state.existing_paths:
             raise PipelineStageError(
                 stage="tts-only-prerequisites",
                 detail=f"Required rewrites artifact is missing: {state.paths.rewrites}",
@@ -759,7 +935,7 @@ class BookvoicePipeline(
                     "before running `bookvoice tts-only`."
                 ),
             )
-        if not state.paths.chunks.exists():
+        if state.paths.chunks not in state.existing_paths:
             raise PipelineStageError(
                 stage="tts-only-prerequisites",
                 detail=f"Required chunks artifact is missing: {state.paths.chunks}",
@@ -861,17 +1037,70 @@ class BookvoicePipeline(
 
         self._reset_provider_call_telemetry()
         state = self._build_resume_state(manifest_path)
-        self._load_or_extract_resume_text(state)
-        self._load_or_clean_resume_text(state)
-        self._load_or_split_resume_chapters(state)
-        self._load_or_chunk_resume_artifact(state)
-        self._load_or_translate_resume_artifact(state)
-        self._load_or_rewrite_resume_artifact(state)
-        self._load_or_tts_resume_artifact(state)
-        self._load_or_merge_resume_artifact(state)
-        self._load_or_package_resume_artifact(state)
+        unchanged_manifest = self._unchanged_resume_manifest(state)
+        if unchanged_manifest is not None:
+            return unchanged_manifest
+        with DeferredArtifactWriter(state.store) as artifact_writer:
+            state.artifact_writer = artifact_writer
+            self._load_or_extract_resume_text(state)
+            self._load_or_clean_resume_text(state)
+            self._load_or_split_resume_chapters(state)
+            self._load_or_chunk_resume_artifact(state)
+            self._load_or_translate_resume_artifact(state)
+            self._load_or_rewrite_resume_artifact(state)
+            self._load_or_tts_resume_artifact(state)
+            self._load_or_merge_resume_artifact(state)
+            self._load_or_package_resume_artifact(state)
+        state.artifact_writer = None
         return self._write_resume_manifest(state)
 
+    def _unchanged_resume_manifest(self, state: ResumeState) -> RunManifest | None:
+        """Return the stored manifest when a completed run's artifacts are untouched.
+
+        Manifests record an `artifacts_digest` stat fingerprint. When every stage
+        is complete and the fingerprint still matches, postprocess/merge and the
+        manifest rewrite are skipped; chunk audio and packaged output files must
+        still exist. The returned manifest carries this resume's validation
+        metadata in memory only.
+        """
+
+        stored_digest = state.extra.get("artifacts_digest")
+        if state.next_stage != "done" or not isinstance(stored_digest, str):
+            return None
+        paths = state.paths
+        current_digest = artifacts_digest(
+            (
+                paths.raw_text,
+                paths.clean_text,
+                paths.chapters,
+                paths.chunks,
+                paths.translations,
+                paths.rewrites,
+                paths.audio_parts,
+                paths.packaged,
+                paths.merged,
+            )
+        )
+        if current_digest != stored_digest:
+            return None
+        if not all_paths_exist(part.path for part in load_audio_parts(paths.audio_parts)):
+            return None
+        if paths.packaged in state.existing_paths and not all_paths_exist(
+            item.path for item in load_packaged_audio(paths.packaged)
+        ):
+            return None
+        manifest = run_manifest_from_payload(
+            load_manifest_payload(state.manifest_path), state.manifest_path
+        )
+        return replace(
+            manifest,
+            extra={
+                **manifest.extra,
+                "resume_next_stage": state.next_stage,
+                **state.validation_report.as_manifest_metadata(),
+            },
+        )
+
     def _build_resume_state(self, manifest_path: Path) -> ResumeState:
         """Create typed resume context with resolved paths and runtime settings."""
 
@@ -908,7 +1137,10 @@ class BookvoicePipeline(
             else ""
         )
 
-        run_root = resolve_run_root(manifest_path, normalized_extra)
+        anchored_paths = manifest_anchored_paths(manifest_path, payload, normalized_extra)
+        run_root = resolve_run_root(
+            manifest_path, normalized_extra, existing_paths=anchored_paths
+        )
         store = ArtifactStore(run_root)
         config = BookvoiceConfig(
             input_pdf=source_path,
@@ -969,40 +1201,43 @@ class BookvoicePipeline(
         )
         runtime_config = self._resolve_runtime_config(config)
 
-        paths = ResumeArtifactPaths(
-            raw_text=resolve_artifact_path(
-                manifest_path, run_root, normalized_extra, "raw_text", Path("text/raw.txt")
-            ),
-            clean_text=resolve_artifact_path(
-                manifest_path, run_root, normalized_extra, "clean_text", Path("text/clean.txt")
-            ),
-            chapters=resolve_artifact_path(
-                manifest_path, run_root, normalized_extra, "chapters", Path("text/chapters.json")
-            ),
-            chunks=resolve_artifact_path(
-                manifest_path, run_root, normalized_extra, "chunks", Path("text/chunks.json")
-            ),
-            translations=resolve_artifact_path(
-                manifest_path,
-                run_root,
-                normalized_extra,
-                "translations",
-                Path("text/translations.json"),
-            ),
-            rewrites=resolve_artifact_path(
-                manifest_path, run_root, normalized_extra, "rewrites", Path("text/rewrites.json")
-            ),
-            audio_parts=resolve_artifact_path(
-                manifest_path, run_root, normalized_extra, "audio_parts", Path("audio/parts.json")
-            ),
-            merged=resolve_merged_path(manifest_path, run_root, payload),
-            packaged=resolve_artifact_path(
+        def _artifact_path(key: str, default_relative: Path) -> Path:
+            """Resolve one manifest artifact path against the anchored-path snapshot."""
+
+            return resolve_artifact_path(
                 manifest_path,
                 run_root,
                 normalized_extra,
-                "packaged_audio",
-                Path("audio/packaged.json"),
+                key,
+                default_relative,
+                existing_paths=anchored_paths,
+            )
+
+        paths = ResumeArtifactPaths(
+            raw_text=_artifact_path("raw_text", RAW_TEXT_REL_PATH),
+            clean_text=_artifact_path("clean_text", CLEAN_TEXT_REL_PATH),
+            chapters=_artifact_path("chapters", CHAPTERS_REL_PATH),
+            chunks=_artifact_path("chunks", CHUNKS_REL_PATH),
+            translations=_artifact_path("translations", TRANSLATIONS_REL_PATH),
+            rewrites=_artifact_path("rewrites", REWRITES_REL_PATH),
+            audio_parts=_artifact_path("audio_parts", AUDIO_PARTS_REL_PATH),
+            merged=resolve_merged_path(
+                manifest_path, run_root, payload, existing_paths=anchored_paths
             ),
+            packaged=_artifact_path("packaged_audio", PACKAGED_AUDIO_REL_PATH),
+        )
+        existing_paths = existing_artifact_paths(
+            (
+                paths.raw_text,
+                paths.clean_text,
+                paths.chapters,
+                paths.chunks,
+                paths.translations,
+                paths.rewrites,
+                paths.audio_parts,
+                paths.merged,
+                paths.packaged,
+            )
         )
         validation_report = validate_resume_artifact_consistency(
             raw_text_path=paths.raw_text,
@@ -1015,6 +1250,7 @@ class BookvoicePipeline(
             merged_path=paths.merged,
             packaged_path=paths.packaged,
             packaging_enabled=self._packaging_options(config).formats != tuple(),
+            existing_paths=existing_paths,
         )
         ensure_recoverable_resume_state(validation_report)
 
@@ -1029,15 +1265,20 @@ class BookvoicePipeline(
             paths=paths,
             next_stage=validation_report.next_stage,
             validation_report=validation_report,
+            existing_paths=existing_paths,
             chapter_source=chapter_source,
             chapter_fallback_reason=chapter_fallback_reason,
         )
 
     def _load_or_extract_resume_text(self, state: ResumeState) -> None:
-        """Load existing raw text artifact or rerun extract stage."""
+        """Load existing raw text artifact or rerun extract stage.
+
+        Existing raw text is decoded only when the clean stage must be replayed.
+        """
 
-        if state.paths.raw_text.exists():
-            state.raw_text = state.paths.raw_text.read_text(encoding="utf-8")
+        if state.paths.raw_text in state.existing_paths:
+            if state.paths.clean_text not in state.existing_paths:
+                state.raw_text = state.paths.raw_text.read_text(encoding="utf-8")
             return
 
         if not state.config.source_path.exists():
@@ -1046,32 +1287,40 @@ class BookvoicePipeline(
                 f"{state.config.source_path}"
             )
         state.raw_text = self._extract(state.config)
-        state.paths.raw_text = state.store.save_text(Path("text/raw.txt"), state.raw_text)
+        state.paths.raw_text = state.save_text(RAW_TEXT_REL_PATH, state.raw_text)
+        state.save_json(
+            SOURCE_DIGEST_REL_PATH,
+            {"source_digest": artifacts_digest((state.config.source_path,))},
+        )
 
     def _load_or_clean_resume_text(self, state: ResumeState) -> None:
-        """Load existing clean text artifact or rerun clean stage."""
+        """Load existing clean text artifact or rerun clean stage.
 
-        if state.paths.clean_text.exists():
-            state.clean_text = state.paths.clean_text.read_text(encoding="utf-8")
+        Existing clean text is decoded only when chapter splitting must be replayed.
+        """
+
+        if state.paths.clean_text in state.existing_paths:
+            if state.paths.chapters not in state.existing_paths:
+                state.clean_text = state.paths.clean_text.read_text(encoding="utf-8")
             return
 
         state.clean_text, clean_metadata = self._clean_with_metadata(state.raw_text)
         state.drop_cap_merges_count = int(clean_metadata.get("drop_cap_merges_count", 0))
-        state.paths.clean_text = state.store.save_text(Path("text/clean.txt"), state.clean_text)
+        state.paths.clean_text = state.save_text(CLEAN_TEXT_REL_PATH, state.clean_text)
 
     def _load_or_split_resume_chapters(self, state: ResumeState) -> None:
         """Load chapter artifacts/metadata or rerun split stage and recover scope."""
 
-        if state.paths.chapters.exists():
-            state.chapters = load_chapters(state.paths.chapters)
-            chapter_metadata = load_chapter_metadata(state.paths.chapters)
+        if state.paths.chapters in state.existing_paths:
+            state.chapters, chapter_metadata, state.normalized_structure = (
+                load_chapter_artifact(state.paths.chapters)
+            )
             if chapter_metadata["source"]:
                 state.chapter_source = chapter_metadata["source"]
             state.chapter_fallback_reason = chapter_metadata["fallback_reason"]
             state.drop_cap_merges_count = int(
                 chapter_metadata.get("drop_cap_merges_count", "0")
             )
-            state.normalized_structure = load_normalized_structure(state.paths.chapters)
         else:
             (
                 state.chapters,
@@ -1086,8 +1335,8 @@ class BookvoicePipeline(
             _, state.chapter_scope = self._resolve_resume_chapter_scope(
                 state.chapters, state.extra
             )
-            state.paths.chapters = state.store.save_json(
-                Path("text/chapters.json"),
+            state.paths.chapters = state.save_json(
+                CHAPTERS_REL_PATH,
                 chapter_artifact_payload(
                     state.chapters,
                     state.chapter_source,
@@ -1112,7 +1361,7 @@ class BookvoicePipeline(
     def _load_or_chunk_resume_artifact(self, state: ResumeState) -> None:
         """Load existing chunk artifact or rerun deterministic chunk planning."""
 
-        if state.paths.chunks.exists():
+        if state.paths.chunks in state.existing_paths:
             state.chunks = load_chunks(state.paths.chunks)
             chunk_payload = load_json_object(state.paths.chunks)
             chunk_metadata = chunk_payload.get("metadata")
@@ -1130,24 +1379,31 @@ class BookvoicePipeline(
             "sentence_boundary_repairs_count",
             0,
         )
-        state.paths.chunks = state.store.save_json(
-            Path("text/chunks.json"),
-            chunk_artifact_payload(state.chunks, state.chapter_scope, chunk_metadata),
+        state.paths.chunks = state.save_json(
+            CHUNKS_REL_PATH,
+            chunk_artifact_payload(
+                state.chunks,
+                state.chapter_scope,
+                chunk_metadata,
+                state.chunk_payloads,
+            ),
         )
 
     def _load_or_translate_resume_artifact(self, state: ResumeState) -> None:
         """Load existing translations or rerun translation stage."""
 
-        if state.paths.translations.exists():
+        if state.paths.translations in state.existing_paths:
             state.translations = load_translations(state.paths.translations)
         else:
             state.translations = self._translate(state.chunks, state.config)
-            state.paths.translations = state.store.save_json(
-                Path("text/translations.json"),
+            state.paths.translations = state.save_json(
+                TRANSLATIONS_REL_PATH,
                 translation_artifact_payload(
                     state.translations,
                     state.chapter_scope,
                     state.runtime_config,
+                    state.chunk_payloads,
+                    state.translation_payloads,
                 ),
             )
         add_translation_costs(state.translations, state.cost_tracker)
@@ -1155,20 +1411,22 @@ class BookvoicePipeline(
     def _load_or_rewrite_resume_artifact(self, state: ResumeState) -> None:
         """Load existing rewrites or rerun rewrite stage."""
 
-        if state.paths.rewrites.exists():
-            state.rewrites = load_rewrites(state.paths.rewrites)
+        if state.paths.rewrites in state.existing_paths:
+            state.rewrites = load_rewrites(state.paths.rewrites, state.translations)
         else:
             state.rewrites = self._rewrite_for_audio(
                 state.translations,
                 state.config,
                 state.runtime_config,
             )
-            state.paths.rewrites = state.store.save_json(
-                Path("text/rewrites.json"),
+            state.paths.rewrites = state.save_json(
+                REWRITES_REL_PATH,
                 rewrite_artifact_payload(
                     state.rewrites,
                     state.chapter_scope,
                     state.runtime_config,
+                    state.chunk_payloads,
+                    state.translation_payloads,
                 ),
             )
         add_rewrite_costs(state.rewrites, state.cost_tracker)
@@ -1176,9 +1434,9 @@ class BookvoicePipeline(
     def _load_or_tts_resume_artifact(self, state: ResumeState) -> None:
         """Load reusable audio parts or rerun TTS when parts/artifacts are missing."""
 
-        if state.paths.audio_parts.exists():
+        if state.paths.audio_parts in state.existing_paths:
             loaded_parts = load_audio_parts(state.paths.audio_parts)
-            if all(part.path.exists() for part in loaded_parts):
+            if all_paths_exist(part.path for part in loaded_parts):
                 state.audio_parts = loaded_parts
                 state.reuse_audio_parts = True
             else:
@@ -1188,8 +1446,8 @@ class BookvoicePipeline(
                     state.store,
                     state.runtime_config,
                 )
-                state.paths.audio_parts = state.store.save_json(
-                    Path("audio/parts.json"),
+                state.paths.audio_parts = state.save_json(
+                    AUDIO_PARTS_REL_PATH,
                     audio_parts_artifact_payload(
                         state.audio_parts,
                         state.chapter_scope,
@@ -1203,8 +1461,8 @@ class BookvoicePipeline(
                 state.store,
                 state.runtime_config,
             )
-            state.paths.audio_parts = state.store.save_json(
-                Path("audio/parts.json"),
+            state.paths.audio_parts = state.save_json(
+                AUDIO_PARTS_REL_PATH,
                 audio_parts_artifact_payload(
                     state.audio_parts,
                     state.chapter_scope,
@@ -1240,7 +1498,7 @@ class BookvoicePipeline(
             and state.final_merged_path == state.paths.merged
         ):
             loaded_outputs = load_packaged_audio(state.paths.packaged)
-            if all(item.path.exists() for item in loaded_outputs):
+            if all_paths_exist(item.path for item in loaded_outputs):
                 state.packaged_outputs = loaded_outputs
                 state.reuse_packaged_outputs = True
                 return
@@ -1267,8 +1525,8 @@ class BookvoicePipeline(
                 options=packaging_options,
             ),
         }
-        state.paths.packaged = state.store.save_json(
-            Path("audio/packaged.json"),
+        state.paths.packaged = state.save_json(
+            PACKAGED_AUDIO_REL_PATH,
             packaged_audio_artifact_payload(
                 state.packaged_outputs,
                 state.chapter_scope,
@@ -1303,7 +1561,7 @@ class BookvoicePipeline(
         )
         if not state.paths.packaged.exists():
             state.paths.packaged = state.store.save_json(
-                Path("audio/packaged.json"),
+                PACKAGED_AUDIO_REL_PATH,
                 packaged_audio_artifact_payload(
                     state.packaged_outputs,
                     state.chapter_scope,
@@ -4,16 +4,29 @@ Responsibilities:
 - Parse and validate run-manifest payloads.
 - Resolve artifact paths for resume mode.
 - Detect the next missing stage from persisted artifacts.
+- Check artifact and audio-part existence with one directory listing per parent.
+- Fingerprint persisted artifacts so unchanged completed runs can skip replay.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+import hashlib
 import json
+import os
 from pathlib import Path
 
 from ..errors import PipelineStageError
-from .artifacts import load_audio_parts, load_chunks, load_rewrites, load_translations
+from ..io.json_codec import decode_json_artifact
+from ..models.datatypes import BookMeta, RunManifest
+from .artifacts import (
+    MERGED_AUDIO_REL_PATH,
+    load_audio_parts,
+    iter_rewrites,
+    load_chunks,
+    load_translations,
+)
 from ..parsing import normalize_optional_string, parse_permissive_boolean
 
 
@@ -71,7 +84,7 @@ def load_manifest_payload(manifest_path: Path) -> dict[str, object]:
             hint="Run `bookvoice build` first or pass a valid run manifest path.",
         )
     try:
-        payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+        payload = decode_json_artifact(manifest_path.read_bytes())
     except json.JSONDecodeError as exc:
         raise PipelineStageError(
             stage="resume-manifest",
@@ -87,13 +100,23 @@ def load_manifest_payload(manifest_path: Path) -> dict[str, object]:
     return payload
 
 
+def _blank_manifest_string(value: str) -> bool:
+    """Return whether a manifest string is empty or whitespace-only.
+
+    `isspace` stops at the first visible character instead of building a
+    stripped copy of the value.
+    """
+
+    return not value or value.isspace()
+
+
 def require_manifest_field(
     payload: dict[str, object], key: str, scope: str = "manifest"
 ) -> str:
     """Require a non-empty string field from a manifest object."""
 
     value = payload.get(key)
-    if not isinstance(value, str) or not value.strip():
+    if not isinstance(value, str) or _blank_manifest_string(value):
         raise PipelineStageError(
             stage="resume-manifest",
             detail=f"Manifest is missing required `{scope}.{key}` field.",
@@ -102,36 +125,162 @@ def require_manifest_field(
     return value
 
 
-def resolve_run_root(manifest_path: Path, extra: dict[str, object]) -> Path:
+def _manifest_float(payload: dict[str, object], key: str) -> float:
+    """Read a numeric manifest field, defaulting to zero when absent or malformed."""
+
+    value = payload.get(key)
+    return float(value) if isinstance(value, int | float) else 0.0
+
+
+def run_manifest_from_payload(payload: dict[str, object], manifest_path: Path) -> RunManifest:
+    """Rebuild the typed run manifest persisted at `manifest_path`."""
+
+    book_payload = payload.get("book")
+    if not isinstance(book_payload, dict):
+        raise PipelineStageError(
+            stage="resume-manifest",
+            detail="Manifest is missing required object `book`.",
+            hint="Regenerate the manifest by running `bookvoice build`.",
+        )
+    source_pdf = Path(require_manifest_field(book_payload, "source_pdf", scope="book"))
+    author = book_payload.get("author")
+    extra = payload.get("extra")
+    return RunManifest(
+        run_id=require_manifest_field(payload, "run_id"),
+        config_hash=require_manifest_field(payload, "config_hash"),
+        book=BookMeta(
+            source_pdf=source_pdf,
+            source_format=manifest_string(book_payload, "source_format", "pdf"),
+            title=manifest_string(book_payload, "title", source_pdf.stem),
+            author=author if isinstance(author, str) else None,
+            language=require_manifest_field(book_payload, "language", scope="book"),
+        ),
+        merged_audio_path=Path(require_manifest_field(payload, "merged_audio_path")),
+        total_llm_cost_usd=_manifest_float(payload, "total_llm_cost_usd"),
+        total_tts_cost_usd=_manifest_float(payload, "total_tts_cost_usd"),
+        total_cost_usd=_manifest_float(payload, "total_cost_usd"),
+        extra={
+            **(
+                {str(key): str(value) for key, value in extra.items()}
+                if isinstance(extra, dict)
+                else {}
+            ),
+            "manifest_path": str(manifest_path),
+        },
+    )
+
+
+ARTIFACT_DIGEST_KEYS = (
+    "raw_text",
+    "clean_text",
+    "chapters",
+    "chunks",
+    "translations",
+    "rewrites",
+    "audio_parts",
+    "packaged_audio",
+)
+"""Manifest artifact keys fingerprinted, in order, ahead of the merged audio file."""
+
+
+def artifacts_digest(paths: Iterable[Path]) -> str:
+    """Return a stat fingerprint of artifact files in the given order.
+
+    Each file contributes its modification time and size, and missing files a
+    fixed marker, so rewriting, deleting, or creating any artifact changes the
+    digest without reading file contents. Path spelling is not hashed, so
+    relative and anchored forms of one file fingerprint identically.
+    """
+
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            digest.update(b"missing\n")
+        else:
+            digest.update(f"{stat_result.st_mtime_ns}:{stat_result.st_size}\n".encode("ascii"))
+    return digest.hexdigest()
+
+
+_MANIFEST_PATH_KEYS = (
+    "run_root",
+    "raw_text",
+    "clean_text",
+    "chapters",
+    "chunks",
+    "translations",
+    "rewrites",
+    "audio_parts",
+    "packaged_audio",
+)
+
+
+def manifest_anchored_paths(
+    manifest_path: Path, payload: dict[str, object], extra: dict[str, object]
+) -> frozenset[Path]:
+    """Return which relative manifest paths exist when anchored at the manifest directory.
+
+    The snapshot lets the `resolve_*` helpers test membership instead of issuing
+    one `stat` call per relative artifact path.
+    """
+
+    raw_values = [payload.get("merged_audio_path"), *(extra.get(key) for key in _MANIFEST_PATH_KEYS)]
+    manifest_dir = manifest_path.parent
+    return existing_artifact_paths(
+        manifest_dir / raw
+        for raw in raw_values
+        if isinstance(raw, str) and not _blank_manifest_string(raw) and not os.path.isabs(raw)
+    )
+
+
+def _resolve_manifest_path(
+    manifest_path: Path, raw: object, existing_paths: frozenset[Path] | None
+) -> Path | None:
+    """Resolve a raw manifest path string, or return `None` when it is unset.
+
+    Absolute paths are returned as-is. Relative paths prefer the location
+    anchored at the manifest directory when it exists. Checks run on the raw
+    string, so only the returned path (and the anchored probe) is built as a `Path`.
+    """
+
+    if not isinstance(raw, str) or _blank_manifest_string(raw):
+        return None
+    if os.path.isabs(raw):
+        return Path(raw)
+    anchored = manifest_path.parent / raw
+    if existing_paths is None:
+        exists = anchored.exists()
+    else:
+        exists = anchored in existing_paths
+    return anchored if exists else Path(raw)
+
+
+def resolve_run_root(
+    manifest_path: Path,
+    extra: dict[str, object],
+    *,
+    existing_paths: frozenset[Path] | None = None,
+) -> Path:
     """Resolve run root directory from manifest metadata."""
 
-    raw = extra.get("run_root")
-    if isinstance(raw, str) and raw.strip():
-        candidate = Path(raw)
-        if candidate.is_absolute():
-            return candidate
-        anchored = manifest_path.parent / candidate
-        if anchored.exists():
-            return anchored
-        return candidate
-    return manifest_path.parent
+    resolved = _resolve_manifest_path(manifest_path, extra.get("run_root"), existing_paths)
+    return resolved if resolved is not None else manifest_path.parent
 
 
 def resolve_merged_path(
-    manifest_path: Path, run_root: Path, payload: dict[str, object]
+    manifest_path: Path,
+    run_root: Path,
+    payload: dict[str, object],
+    *,
+    existing_paths: frozenset[Path] | None = None,
 ) -> Path:
     """Resolve merged audio path from manifest payload."""
 
-    raw = payload.get("merged_audio_path")
-    if isinstance(raw, str) and raw.strip():
-        path = Path(raw)
-        if path.is_absolute():
-            return path
-        anchored = manifest_path.parent / path
-        if anchored.exists():
-            return anchored
-        return path
-    return run_root / "audio/bookvoice_merged.wav"
+    resolved = _resolve_manifest_path(
+        manifest_path, payload.get("merged_audio_path"), existing_paths
+    )
+    return resolved if resolved is not None else run_root / MERGED_AUDIO_REL_PATH
 
 
 def resolve_artifact_path(
@@ -140,19 +289,64 @@ def resolve_artifact_path(
     extra: dict[str, object],
     key: str,
     default_relative: Path,
+    *,
+    existing_paths: frozenset[Path] | None = None,
 ) -> Path:
     """Resolve an artifact path from resume metadata with fallback."""
 
-    raw = extra.get(key)
-    if isinstance(raw, str) and raw.strip():
-        path = Path(raw)
-        if path.is_absolute():
-            return path
-        anchored = manifest_path.parent / path
-        if anchored.exists():
-            return anchored
-        return path
-    return run_root / default_relative
+    resolved = _resolve_manifest_path(manifest_path, extra.get(key), existing_paths)
+    return resolved if resolved is not None else run_root / default_relative
+
+
+def existing_artifact_paths(paths: Iterable[Path]) -> frozenset[Path]:
+    """Return which of the given paths exist, listing each parent directory once.
+
+    Resume checks probe several artifacts that share `text/` and `audio/`
+    directories, so one `os.scandir` per distinct parent replaces a `stat`
+    call per artifact.
+    """
+
+    listings: dict[Path, frozenset[str]] = {}
+    existing: set[Path] = set()
+    for path in paths:
+        parent = path.parent
+        listing = listings.get(parent)
+        if listing is None:
+            try:
+                with os.scandir(parent) as entries:
+                    listing = frozenset(entry.name for entry in entries)
+            except (FileNotFoundError, NotADirectoryError):
+                listing = frozenset()
+            listings[parent] = listing
+        if path.name in listing:
+            existing.add(path)
+    return frozenset(existing)
+
+
+def all_paths_exist(paths: Iterable[Path]) -> bool:
+    """Return whether every path exists, listing each parent directory once.
+
+    Chunk audio and packaged outputs share a few directories, so checking
+    hundreds of parts costs one `os.scandir` per directory instead of one
+    `stat` per file.
+    """
+
+    path_list = list(paths)
+    return len(existing_artifact_paths(path_list)) == len(set(path_list))
+
+
+_ARTIFACT_STAGE_ORDER = (
+    "extract",
+    "clean",
+    "split",
+    "chunk",
+    "translate",
+    "rewrite",
+    "tts",
+    "merge",
+    "package",
+)
+"""Resume stages in pipeline order, each keyed by its first persisted artifact."""
 
 
 def detect_next_stage(
@@ -167,28 +361,36 @@ def detect_next_stage(
     merged_path: Path,
     packaged_path: Path,
     packaging_enabled: bool,
+    existing_paths: frozenset[Path] | None = None,
 ) -> str:
-    """Detect the first missing artifact stage for resume messaging."""
-
-    if not raw_text_path.exists():
-        return "extract"
-    if not clean_text_path.exists():
-        return "clean"
-    if not chapters_path.exists():
-        return "split"
-    if not chunks_path.exists():
-        return "chunk"
-    if not translations_path.exists():
-        return "translate"
-    if not rewrites_path.exists():
-        return "rewrite"
-    if not audio_parts_path.exists():
-        return "tts"
-    if not merged_path.exists():
-        return "merge"
-    if packaging_enabled and not packaged_path.exists():
-        return "package"
-    return "done"
+    """Detect the first missing artifact stage for resume messaging.
+
+    `existing_paths` may carry a presence snapshot from
+    `existing_artifact_paths`; it is computed here when omitted.
+    """
+
+    stage_paths = tuple(
+        zip(
+            _ARTIFACT_STAGE_ORDER if packaging_enabled else _ARTIFACT_STAGE_ORDER[:-1],
+            (
+                raw_text_path,
+                clean_text_path,
+                chapters_path,
+                chunks_path,
+                translations_path,
+                rewrites_path,
+                audio_parts_path,
+                merged_path,
+                packaged_path,
+            ),
+        )
+    )
+    if existing_paths is None:
+        existing_paths = existing_artifact_paths(path for _, path in stage_paths)
+    return next(
+        (stage for stage, path in stage_paths if path not in existing_paths),
+        "done",
+    )
 
 
 def _chunk_signature(chapter_index: int, chunk_index: int, part_id: str | None) -> str:
@@ -205,6 +407,7 @@ def _critical_artifact_statuses(
     translations_path: Path,
     rewrites_path: Path,
     audio_parts_path: Path,
+    existing_paths: frozenset[Path],
 ) -> list[ResumeArtifactStatus]:
     """Build deterministic status rows for critical resume artifact chain."""
 
@@ -212,31 +415,31 @@ def _critical_artifact_statuses(
         ResumeArtifactStatus(
             key="chapters",
             path=chapters_path,
-            exists=chapters_path.exists(),
+            exists=chapters_path in existing_paths,
             stage="split",
         ),
         ResumeArtifactStatus(
             key="chunks",
             path=chunks_path,
-            exists=chunks_path.exists(),
+            exists=chunks_path in existing_paths,
             stage="chunk",
         ),
         ResumeArtifactStatus(
             key="translations",
             path=translations_path,
-            exists=translations_path.exists(),
+            exists=translations_path in existing_paths,
             stage="translate",
         ),
         ResumeArtifactStatus(
             key="rewrites",
             path=rewrites_path,
-            exists=rewrites_path.exists(),
+            exists=rewrites_path in existing_paths,
             stage="rewrite",
         ),
         ResumeArtifactStatus(
             key="audio_parts",
             path=audio_parts_path,
-            exists=audio_parts_path.exists(),
+            exists=audio_parts_path in existing_paths,
             stage="tts",
         ),
     ]
@@ -280,25 +483,27 @@ def _validate_payload_alignment(
     translations_path: Path,
     rewrites_path: Path,
     audio_parts_path: Path,
+    existing_paths: frozenset[Path],
 ) -> tuple[str, ...]:
     """Detect non-recoverable cross-artifact payload mismatches."""
 
     diagnostics: list[str] = []
+    has_translations = translations_path in existing_paths
+    has_rewrites = rewrites_path in existing_paths
+    translations = load_translations(translations_path) if has_translations else []
+    translation_signatures = [
+        _chunk_signature(
+            item.chunk.chapter_index,
+            item.chunk.chunk_index,
+            item.chunk.part_id,
+        )
+        for item in translations
+    ]
 
-    if chunks_path.exists() and translations_path.exists():
-        chunks = load_chunks(chunks_path)
-        translations = load_translations(translations_path)
+    if chunks_path in existing_paths and has_translations:
         chunk_signatures = [
             _chunk_signature(item.chapter_index, item.chunk_index, item.part_id)
-            for item in chunks
-        ]
-        translation_signatures = [
-            _chunk_signature(
-                item.chunk.chapter_index,
-                item.chunk.chunk_index,
-                item.chunk.part_id,
-            )
-            for item in translations
+            for item in load_chunks(chunks_path)
         ]
         if chunk_signatures != translation_signatures:
             diagnostics.append(
@@ -306,45 +511,28 @@ def _validate_payload_alignment(
                 f"`{chunks_path}` and `{translations_path}` (count/order mismatch)."
             )
 
-    if translations_path.exists() and rewrites_path.exists():
-        translations = load_translations(translations_path)
-        rewrites = load_rewrites(rewrites_path)
-        translation_signatures = [
-            _chunk_signature(
-                item.chunk.chapter_index,
-                item.chunk.chunk_index,
-                item.chunk.part_id,
-            )
-            for item in translations
-        ]
+    rewrite_signatures: list[str] = []
+    if has_rewrites and (has_translations or audio_parts_path in existing_paths):
         rewrite_signatures = [
             _chunk_signature(
                 item.translation.chunk.chapter_index,
                 item.translation.chunk.chunk_index,
                 item.translation.chunk.part_id,
             )
-            for item in rewrites
+            for item in iter_rewrites(rewrites_path, translations)
         ]
+
+    if has_translations and has_rewrites:
         if translation_signatures != rewrite_signatures:
             diagnostics.append(
                 "Translation/rewrite mismatch between "
                 f"`{translations_path}` and `{rewrites_path}` (count/order mismatch)."
             )
 
-    if rewrites_path.exists() and audio_parts_path.exists():
-        rewrites = load_rewrites(rewrites_path)
-        audio_parts = load_audio_parts(audio_parts_path)
-        rewrite_signatures = [
-            _chunk_signature(
-                item.translation.chunk.chapter_index,
-                item.translation.chunk.chunk_index,
-                item.translation.chunk.part_id,
-            )
-            for item in rewrites
-        ]
+    if has_rewrites and audio_parts_path in existing_paths:
         audio_signatures = [
             _chunk_signature(item.chapter_index, item.chunk_index, item.part_id)
-            for item in audio_parts
+            for item in load_audio_parts(audio_parts_path)
         ]
         if rewrite_signatures != audio_signatures:
             diagnostics.append(
@@ -372,9 +560,28 @@ def validate_resume_artifact_consistency(
     merged_path: Path,
     packaged_path: Path,
     packaging_enabled: bool,
+    existing_paths: frozenset[Path] | None = None,
 ) -> ResumeArtifactConsistencyReport:
-    """Validate resume-critical artifact consistency before replay begins."""
-
+    """Validate resume-critical artifact consistency before replay begins.
+
+    `existing_paths` may carry a presence snapshot from `existing_artifact_paths`
+    that the caller reuses while replaying stages; it is computed when omitted.
+    """
+
+    if existing_paths is None:
+        existing_paths = existing_artifact_paths(
+            (
+                raw_text_path,
+                clean_text_path,
+                chapters_path,
+                chunks_path,
+                translations_path,
+                rewrites_path,
+                audio_parts_path,
+                merged_path,
+                packaged_path,
+            )
+        )
     next_stage = detect_next_stage(
         raw_text_path=raw_text_path,
         clean_text_path=clean_text_path,
@@ -386,6 +593,7 @@ def validate_resume_artifact_consistency(
         merged_path=merged_path,
         packaged_path=packaged_path,
         packaging_enabled=packaging_enabled,
+        existing_paths=existing_paths,
     )
 
     statuses = _critical_artifact_statuses(
@@ -394,6 +602,7 @@ def validate_resume_artifact_consistency(
         translations_path=translations_path,
         rewrites_path=rewrites_path,
         audio_parts_path=audio_parts_path,
+        existing_paths=existing_paths,
     )
     chain_diagnostics = _validate_chain_topology(statuses)
     alignment_diagnostics = _validate_payload_alignment(
@@ -401,6 +610,7 @@ def validate_resume_artifact_consistency(
         translations_path=translations_path,
         rewrites_path=rewrites_path,
         audio_parts_path=audio_parts_path,
+        existing_paths=existing_paths,
     )
     diagnostics = chain_diagnostics + alignment_diagnostics
     if diagnostics:
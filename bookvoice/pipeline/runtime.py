@@ -8,6 +8,7 @@ Responsibilities:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from hashlib import sha256
 import json
 import os
@@ -63,26 +64,44 @@ class PipelineRuntimeMixin:
             ) from exc
 
     def _config_hash(self, config: BookvoiceConfig) -> str:
-        """Compute deterministic hash for run-defining configuration fields."""
-
-        payload = {
-            "input_path": str(config.source_path),
-            "source_format": config.source_format,
-            "input_pdf": str(config.input_pdf),
-            "output_dir": str(config.output_dir),
-            "language": config.language,
-            "provider_translator": config.provider_translator,
-            "provider_rewriter": config.provider_rewriter,
-            "provider_tts": config.provider_tts,
-            "model_translate": config.model_translate,
-            "model_rewrite": config.model_rewrite,
-            "model_tts": config.model_tts,
-            "tts_voice": config.tts_voice,
-            "rewrite_bypass": config.rewrite_bypass,
-            "chunk_size_chars": config.chunk_size_chars,
-            "chapter_selection": config.chapter_selection,
-            "resume": config.resume,
-            "extra": dict(config.extra),
-        }
-        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-        return sha256(canonical.encode("utf-8")).hexdigest()
+        """Compute deterministic hash for run-defining configuration fields.
+
+        The digest only derives run identifiers, so SHA-256 is requested as a
+        non-security hash; the algorithm stays fixed to keep run IDs stable.
+        Digests are memoized by field values rather than config identity, since
+        `BookvoiceConfig` instances are mutable.
+        """
+
+        return _config_digest(
+            (
+                ("input_path", str(config.source_path)),
+                ("source_format", config.source_format),
+                ("input_pdf", str(config.input_pdf)),
+                ("output_dir", str(config.output_dir)),
+                ("language", config.language),
+                ("provider_translator", config.provider_translator),
+                ("provider_rewriter", config.provider_rewriter),
+                ("provider_tts", config.provider_tts),
+                ("model_translate", config.model_translate),
+                ("model_rewrite", config.model_rewrite),
+                ("model_tts", config.model_tts),
+                ("tts_voice", config.tts_voice),
+                ("rewrite_bypass", config.rewrite_bypass),
+                ("chunk_size_chars", config.chunk_size_chars),
+                ("chapter_selection", config.chapter_selection),
+                ("resume", config.resume),
+            ),
+            tuple(config.extra.items()),
+        )
+
+
+@lru_cache(maxsize=32)
+def _config_digest(
+    fields: tuple[tuple[str, object], ...],
+    extra: tuple[tuple[str, str], ...],
+) -> str:
+    """Hash canonical JSON of run-defining fields and extra metadata."""
+
+    payload = {**dict(fields), "extra": dict(extra)}
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return sha256(canonical.encode("utf-8"), usedforsecurity=False).hexdigest()
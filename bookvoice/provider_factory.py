@@ -14,6 +14,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from .llm.audio_rewriter import AudioRewriter, Rewriter
+from .llm.cache import ResponseCache
 from .llm.translator import OpenAITranslator, Translator
 from .tts.synthesizer import OpenAITTSSynthesizer, TTSSynthesizer
 
@@ -26,11 +27,19 @@ class ProviderFactory:
         provider_id: str,
         model: str,
         api_key: str | None = None,
+        response_cache: ResponseCache | None = None,
+        max_connections: int = 1,
     ) -> Translator:
         """Create a translator client for a configured provider identifier."""
 
         if provider_id == "openai":
-            return OpenAITranslator(model=model, provider_id=provider_id, api_key=api_key)
+            return OpenAITranslator(
+                model=model,
+                provider_id=provider_id,
+                api_key=api_key,
+                response_cache=response_cache,
+                max_connections=max_connections,
+            )
         raise ValueError(f"Unsupported translator provider `{provider_id}`.")
 
     @staticmethod
@@ -38,11 +47,19 @@ class ProviderFactory:
         provider_id: str,
         model: str,
         api_key: str | None = None,
+        response_cache: ResponseCache | None = None,
+        max_connections: int = 1,
     ) -> Rewriter:
         """Create a rewrite client for a configured provider identifier."""
 
         if provider_id == "openai":
-            return AudioRewriter(model=model, provider_id=provider_id, api_key=api_key)
+            return AudioRewriter(
+                model=model,
+                provider_id=provider_id,
+                api_key=api_key,
+                response_cache=response_cache,
+                max_connections=max_connections,
+            )
         raise ValueError(f"Unsupported rewriter provider `{provider_id}`.")
 
     @staticmethod
@@ -51,6 +68,7 @@ class ProviderFactory:
         output_root: Path,
         model: str,
         api_key: str | None = None,
+        max_connections: int = 1,
     ) -> TTSSynthesizer:
         """Create a TTS synthesizer client for a configured provider identifier."""
 
@@ -60,5 +78,6 @@ class ProviderFactory:
                 model=model,
                 provider_id=provider_id,
                 api_key=api_key,
+                max_connections=max_connections,
             )
         raise ValueError(f"Unsupported TTS provider `{provider_id}`.")
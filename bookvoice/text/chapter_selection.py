@@ -104,7 +104,7 @@ def parse_chapter_indices_csv(
 def format_chapter_selection(indices: Iterable[int]) -> str:
     """Format selected chapter indices into normalized compact range syntax."""
 
-    ordered = sorted(set(int(index) for index in indices))
+    ordered = sorted(set(map(int, indices)))
     if not ordered:
         return ""
 
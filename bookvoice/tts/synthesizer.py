@@ -36,13 +36,16 @@ class OpenAITTSSynthesizer:
         provider_id: str = "openai",
         api_key: str | None = None,
         rate_limiter: RateLimiter | None = None,
+        max_connections: int = 1,
     ) -> None:
         """Initialize OpenAI-backed TTS synthesizer settings."""
 
         self.output_root = output_root
         self.model = model
         self.provider_id = provider_id
-        self.client = OpenAISpeechClient(api_key=api_key, rate_limiter=rate_limiter)
+        self.client = OpenAISpeechClient(
+            api_key=api_key, rate_limiter=rate_limiter, max_connections=max_connections
+        )
 
     def synthesize(self, rewrite: RewriteResult, voice: VoiceProfile) -> AudioPart:
         """Synthesize one OpenAI WAV file and return deterministic chunk metadata."""
@@ -101,3 +104,8 @@ class OpenAITTSSynthesizer:
         """Return retry attempt count performed by underlying provider client."""
 
         return self.client.retry_attempt_count
+
+    def close(self) -> None:
+        """Close the underlying provider client's HTTP session."""
+
+        self.client.close()
@@ -1,6 +1,7 @@
 """Resume command integration tests for artifact recovery and run metadata."""
 
 import json
+import os
 from pathlib import Path
 
 from tests.fixture_paths import canonical_content_pdf_fixture_path
@@ -72,6 +73,31 @@ def test_resume_command_recovers_from_interrupted_run(tmp_path: Path) -> None:
     assert "Cost Total (USD):" in resume_result.output
 
 
+def test_resume_skips_decoding_text_artifacts_when_chapters_exist(tmp_path: Path) -> None:
+    """Resume should not decode raw/clean text when chapter artifacts are already present."""
+
+    runner = CliRunner()
+    out_dir = tmp_path / "out"
+    fixture_pdf = canonical_content_pdf_fixture_path()
+
+    build_result = runner.invoke(app, ["build", str(fixture_pdf), "--out", str(out_dir)])
+    assert build_result.exit_code == 0, build_result.output
+
+    manifest_path = next(out_dir.glob("run-*/run_manifest.json"))
+    manifest_payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    Path(manifest_payload["extra"]["raw_text"]).write_bytes(b"\xff\xfe invalid utf-8")
+    Path(manifest_payload["extra"]["clean_text"]).write_bytes(b"\xff\xfe invalid utf-8")
+    Path(manifest_payload["extra"]["translations"]).unlink()
+    Path(manifest_payload["extra"]["rewrites"]).unlink()
+    Path(manifest_payload["extra"]["audio_parts"]).unlink()
+    Path(manifest_payload["merged_audio_path"]).unlink()
+
+    resume_result = runner.invoke(app, ["resume", str(manifest_path)])
+    assert resume_result.exit_code == 0, resume_result.output
+    assert "Resumed from stage: translate" in resume_result.output
+
+
 def test_resume_preserves_translation_and_rewrite_payload_schema(tmp_path: Path) -> None:
     """Resume should regenerate translation/rewrite artifacts with identical payload schema."""
 
@@ -157,6 +183,34 @@ def test_resume_command_fully_reuses_existing_audio_outputs(
     assert "Resumed from stage: done" in resume_result.output
 
 
+def test_resume_skips_manifest_rewrite_when_artifacts_are_unchanged(tmp_path: Path) -> None:
+    """Resume should keep an up-to-date manifest and rewrite it once artifacts change."""
+
+    runner = CliRunner()
+    out_dir = tmp_path / "out"
+    fixture_pdf = canonical_content_pdf_fixture_path()
+
+    build_result = runner.invoke(app, ["build", str(fixture_pdf), "--out", str(out_dir)])
+    assert build_result.exit_code == 0, build_result.output
+
+    manifest_path = next(out_dir.glob("run-*/run_manifest.json"))
+    manifest_bytes = manifest_path.read_bytes()
+    assert "artifacts_digest" in json.loads(manifest_bytes)["extra"]
+
+    resume_result = runner.invoke(app, ["resume", str(manifest_path)])
+    assert resume_result.exit_code == 0, resume_result.output
+    assert "Resumed from stage: done" in resume_result.output
+    assert manifest_path.read_bytes() == manifest_bytes
+
+    chunks_path = Path(json.loads(manifest_bytes)["extra"]["chunks"])
+    chunks_stat = chunks_path.stat()
+    os.utime(chunks_path, ns=(chunks_stat.st_atime_ns, chunks_stat.st_mtime_ns + 1_000_000))
+
+    resume_result = runner.invoke(app, ["resume", str(manifest_path)])
+    assert resume_result.exit_code == 0, resume_result.output
+    assert manifest_path.read_bytes() != manifest_bytes
+
+
 def test_resume_replays_tts_and_merge_when_audio_files_are_missing(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -264,3 +318,157 @@ def test_resume_fails_for_cross_artifact_payload_mismatch(tmp_path: Path) -> Non
     assert str(Path(manifest_payload["extra"]["chunks"])) in resume_result.output
     assert str(translations_path) in resume_result.output
     assert "count/order mismatch" in resume_result.output
+
+
+def test_resume_enabled_build_reuses_existing_stage_artifacts(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Resume-enabled builds should load existing text and LLM artifacts instead of recomputing."""
+
+    config = BookvoiceConfig(
+        input_pdf=canonical_content_pdf_fixture_path(),
+        output_dir=tmp_path / "out",
+        resume=True,
+    )
+    first_manifest = BookvoicePipeline().run(config)
+
+    def _unexpected_stage(*_: object, **__: object) -> object:
+        """Fail test when a reusable stage is recomputed."""
+
+        raise AssertionError("Stage should be loaded from existing artifacts.")
+
+    for stage_method in ("_extract", "_clean_with_metadata", "_split_chapters", "_chunk"):
+        monkeypatch.setattr(
+            f"bookvoice.pipeline.BookvoicePipeline.{stage_method}", _unexpected_stage
+        )
+    monkeypatch.setattr("bookvoice.pipeline.BookvoicePipeline._translate", _unexpected_stage)
+    monkeypatch.setattr(
+        "bookvoice.pipeline.BookvoicePipeline._rewrite_for_audio", _unexpected_stage
+    )
+
+    second_manifest = BookvoicePipeline().run(config)
+
+    assert second_manifest.run_id == first_manifest.run_id
+    assert second_manifest.total_cost_usd == first_manifest.total_cost_usd
+    for key in ("chapters", "chunks", "translations", "rewrites", "chapter_source"):
+        assert second_manifest.extra[key] == first_manifest.extra[key]
+
+
+def test_resume_enabled_build_carries_drop_cap_count_when_rebuilding_chapters(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Rebuilt chapters on top of a reused clean text should keep the cleaning metadata."""
+
+    config = BookvoiceConfig(
+        input_pdf=canonical_content_pdf_fixture_path(),
+        output_dir=tmp_path / "out",
+        resume=True,
+    )
+    original_clean = BookvoicePipeline._clean_with_metadata
+
+    def _clean_with_drop_caps(
+        self: BookvoicePipeline, raw_text: str
+    ) -> tuple[str, dict[str, int]]:
+        """Report a fixed drop-cap merge count for the first build."""
+
+        clean_text, _ = original_clean(self, raw_text)
+        return clean_text, {"drop_cap_merges_count": 3}
+
+    monkeypatch.setattr(
+        "bookvoice.pipeline.BookvoicePipeline._clean_with_metadata", _clean_with_drop_caps
+    )
+    first_manifest = BookvoicePipeline().run(config)
+    chapters_path = Path(first_manifest.extra["chapters"])
+    chapters_path.unlink()
+
+    def _unexpected_stage(*_: object, **__: object) -> object:
+        """Fail test when a reusable text stage is recomputed."""
+
+        raise AssertionError("Stage should be loaded from existing artifacts.")
+
+    for stage_method in ("_extract", "_clean_with_metadata"):
+        monkeypatch.setattr(
+            f"bookvoice.pipeline.BookvoicePipeline.{stage_method}", _unexpected_stage
+        )
+
+    second_manifest = BookvoicePipeline().run(config)
+
+    chapters_payload = json.loads(chapters_path.read_text(encoding="utf-8"))
+    assert chapters_payload["metadata"]["normalization"]["drop_cap_merges_count"] == 3
+    assert second_manifest.extra["drop_cap_merges_count"] == "3"
+
+
+def test_resume_enabled_build_reextracts_edited_source(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A source file changed since the previous build should not reuse its text artifacts."""
+
+    source_pdf = tmp_path / "book.pdf"
+    source_pdf.write_bytes(canonical_content_pdf_fixture_path().read_bytes())
+    config = BookvoiceConfig(input_pdf=source_pdf, output_dir=tmp_path / "out", resume=True)
+    BookvoicePipeline().run(config)
+
+    extracted: list[Path] = []
+    original_extract = BookvoicePipeline._extract
+
+    def _recording_extract(self: BookvoicePipeline, stage_config: BookvoiceConfig) -> str:
+        """Record extraction calls before delegating to the real stage."""
+
+        extracted.append(stage_config.source_path)
+        return original_extract(self, stage_config)
+
+    monkeypatch.setattr("bookvoice.pipeline.BookvoicePipeline._extract", _recording_extract)
+    source_stat = source_pdf.stat()
+    os.utime(source_pdf, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns + 10**9))
+
+    BookvoicePipeline().run(config)
+
+    assert extracted == [source_pdf]
+
+
+def test_resume_enabled_build_reuses_artifacts_of_interrupted_build(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A build interrupted before its manifest should still reuse finished text stages."""
+
+    config = BookvoiceConfig(
+        input_pdf=canonical_content_pdf_fixture_path(),
+        output_dir=tmp_path / "out",
+        resume=True,
+    )
+
+    def _interrupted_tts(*_: object, **__: object) -> object:
+        """Interrupt the first build after the rewrite artifacts are queued."""
+
+        raise RuntimeError("interrupted")
+
+    with monkeypatch.context() as interrupted:
+        interrupted.setattr("bookvoice.pipeline.BookvoicePipeline._tts", _interrupted_tts)
+        with pytest.raises(Exception, match="interrupted"):
+            BookvoicePipeline().run(config)
+
+    run_roots = list((tmp_path / "out").glob("run-*"))
+    assert len(run_roots) == 1
+    assert not (run_roots[0] / "run_manifest.json").exists()
+    assert (run_roots[0] / "text" / "source_digest.json").exists()
+
+    def _unexpected_stage(*_: object, **__: object) -> object:
+        """Fail test when a stage finished by the interrupted build is recomputed."""
+
+        raise AssertionError("Stage should be loaded from existing artifacts.")
+
+    for stage_method in (
+        "_extract",
+        "_clean_with_metadata",
+        "_split_chapters",
+        "_chunk",
+        "_translate",
+        "_rewrite_for_audio",
+    ):
+        monkeypatch.setattr(
+            f"bookvoice.pipeline.BookvoicePipeline.{stage_method}", _unexpected_stage
+        )
+
+    manifest = BookvoicePipeline().run(config)
+
+    assert Path(manifest.extra["rewrites"]).exists()
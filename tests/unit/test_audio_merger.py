@@ -0,0 +1,155 @@
+"""Unit tests for deterministic streamed WAV merging."""
+
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+import wave
+
+import pytest
+
+from bookvoice.audio import merger as merger_module
+from bookvoice.audio.merger import AudioMerger
+from bookvoice.models.datatypes import AudioPart
+
+
+def _write_wav(path: Path, samples: list[int], sample_rate: int = 24000) -> AudioPart:
+    """Write a mono PCM16 WAV part and return its audio-part descriptor."""
+
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(array("h", samples).tobytes())
+    index = int(path.stem)
+    return AudioPart(
+        chapter_index=1,
+        chunk_index=index,
+        path=path,
+        duration_seconds=len(samples) / sample_rate,
+    )
+
+
+def _expected_wav_bytes(tmp_path: Path, samples: list[int]) -> bytes:
+    """Render the byte-exact WAV that stdlib `wave` writes for the given samples."""
+
+    expected_path = tmp_path / "expected.wav"
+    with wave.open(str(expected_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(24000)
+        wav_file.writeframes(array("h", samples).tobytes())
+    return expected_path.read_bytes()
+
+
+@pytest.mark.parametrize(
+    ("use_copy_file_range", "use_sendfile"),
+    [(True, False), (False, True), (False, False)],
+)
+def test_merge_streams_parts_in_order_with_wave_compatible_header(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    use_copy_file_range: bool,
+    use_sendfile: bool,
+) -> None:
+    """Merged output should match a stdlib `wave` render for every copy strategy."""
+
+    monkeypatch.setattr(
+        merger_module,
+        "_COPY_FILE_RANGE_SUPPORTED",
+        use_copy_file_range and merger_module._COPY_FILE_RANGE_SUPPORTED,
+    )
+    monkeypatch.setattr(
+        merger_module,
+        "_SENDFILE_SUPPORTED",
+        use_sendfile and merger_module._SENDFILE_SUPPORTED,
+    )
+    second = _write_wav(tmp_path / "1.wav", [4, 5, 6])
+    first = _write_wav(tmp_path / "0.wav", [1, -2, 3])
+
+    merged_path = AudioMerger().merge([second, first], tmp_path / "out" / "merged.wav")
+
+    assert merged_path.read_bytes() == _expected_wav_bytes(tmp_path, [1, -2, 3, 4, 5, 6])
+
+
+def test_merge_clamps_oversized_streamed_data_chunk(tmp_path: Path) -> None:
+    """Parts with a declared data size beyond EOF should contribute only present frames."""
+
+    part = _write_wav(tmp_path / "0.wav", [7, 8])
+    payload = bytearray(part.path.read_bytes())
+    payload[40:44] = (0xFFFFFFFF).to_bytes(4, "little")
+    part.path.write_bytes(bytes(payload))
+
+    merged_path = AudioMerger().merge([part], tmp_path / "merged.wav")
+
+    assert merged_path.read_bytes() == _expected_wav_bytes(tmp_path, [7, 8])
+
+
+def test_merge_rejects_incompatible_part_parameters(tmp_path: Path) -> None:
+    """Parts with different sample rates should fail fast."""
+
+    first = _write_wav(tmp_path / "0.wav", [1], sample_rate=24000)
+    second = _write_wav(tmp_path / "1.wav", [2], sample_rate=16000)
+
+    with pytest.raises(ValueError, match="Incompatible WAV parameters"):
+        AudioMerger().merge([first, second], tmp_path / "merged.wav")
+
+
+def test_merge_pads_odd_length_payload(tmp_path: Path) -> None:
+    """Odd-length 8-bit payloads should end with a RIFF pad byte counted in the RIFF size."""
+
+    part_path = tmp_path / "0.wav"
+    with wave.open(str(part_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(1)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(bytes([120, 130, 140]))
+    part = AudioPart(chapter_index=1, chunk_index=0, path=part_path, duration_seconds=0.0)
+
+    merged_path = AudioMerger().merge([part], tmp_path / "merged.wav")
+
+    merged = merged_path.read_bytes()
+    assert merged[44:] == bytes([120, 130, 140, 0])
+    assert int.from_bytes(merged[4:8], "little") == len(merged) - 8
+    assert int.from_bytes(merged[40:44], "little") == 3
+    with wave.open(str(merged_path), "rb") as wav_file:
+        assert wav_file.readframes(wav_file.getnframes()) == bytes([120, 130, 140])
+
+
+@pytest.mark.parametrize(
+    ("use_copy_file_range", "use_sendfile"),
+    [(True, False), (False, True), (False, False)],
+)
+def test_merge_rejects_short_part_copy_and_removes_output(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    use_copy_file_range: bool,
+    use_sendfile: bool,
+) -> None:
+    """A part that ends before its data span should fail instead of leaving a bad header."""
+
+    monkeypatch.setattr(
+        merger_module,
+        "_COPY_FILE_RANGE_SUPPORTED",
+        use_copy_file_range and merger_module._COPY_FILE_RANGE_SUPPORTED,
+    )
+    monkeypatch.setattr(
+        merger_module,
+        "_SENDFILE_SUPPORTED",
+        use_sendfile and merger_module._SENDFILE_SUPPORTED,
+    )
+    original_span = merger_module._wav_data_span
+
+    def _overstated_span(path: Path, frame_size: int) -> tuple[int, int]:
+        """Report two more bytes than the part holds, as if it shrank after probing."""
+
+        offset, length = original_span(path, frame_size)
+        return offset, length + 2
+
+    monkeypatch.setattr(merger_module, "_wav_data_span", _overstated_span)
+    part = _write_wav(tmp_path / "0.wav", [1, 2])
+    output_path = tmp_path / "merged.wav"
+
+    with pytest.raises(ValueError, match="ended after 4 of 6 PCM bytes"):
+        AudioMerger().merge([part], output_path)
+    assert not output_path.exists()
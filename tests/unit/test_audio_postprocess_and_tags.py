@@ -6,6 +6,8 @@ from array import array
 from pathlib import Path
 import wave
 
+import pytest
+
 from bookvoice.audio.postprocess import AudioPostProcessor
 from bookvoice.audio.tags import AudioTagContext, MetadataWriter
 
@@ -95,6 +97,86 @@ def test_postprocess_trim_and_normalize_are_deterministic(tmp_path: Path) -> Non
     assert abs(peak - expected_peak) <= 1
 
 
+def test_postprocess_merged_pass_matches_sequential_trim_then_normalize(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Fused merged postprocessing should match separate passes and write once."""
+
+    samples = array("h", [3] * 50 + [-1200, 800, 2000, -400] * 200 + [5] * 40)
+    fused_path = tmp_path / "fused.wav"
+    sequential_path = tmp_path / "sequential.wav"
+    _write_wav(fused_path, samples)
+    _write_wav(sequential_path, samples)
+
+    processor = AudioPostProcessor()
+    processor.normalize(processor.trim_silence(sequential_path))
+
+    writes: list[Path] = []
+    original_write = AudioPostProcessor._write_wav_frames
+
+    def recording_write(
+        self: AudioPostProcessor,
+        audio_path: Path,
+        params: wave._wave_params,
+        frames: bytes,
+    ) -> None:
+        """Record rewritten paths before delegating to the real writer."""
+
+        writes.append(audio_path)
+        original_write(self, audio_path, params, frames)
+
+    monkeypatch.setattr(AudioPostProcessor, "_write_wav_frames", recording_write)
+    processor.process_merged(fused_path)
+
+    assert writes == [fused_path]
+    assert fused_path.read_bytes() == sequential_path.read_bytes()
+
+
+@pytest.mark.parametrize("sample_width", [1, 2, 3, 4])
+def test_postprocess_trims_stereo_frames_for_every_sample_width(
+    tmp_path: Path, sample_width: int
+) -> None:
+    """Trim should keep whole stereo frames around the loud region for all PCM widths."""
+
+    loud = 1 << (sample_width * 8 - 2)
+    frames_samples = [(0, 0)] * 5 + [(0, loud), (-loud, 0), (loud, loud)] + [(0, 0)] * 4
+    if sample_width == 1:
+        payload = bytes(sample + 128 for frame in frames_samples for sample in frame)
+    else:
+        payload = b"".join(
+            sample.to_bytes(sample_width, "little", signed=True)
+            for frame in frames_samples
+            for sample in frame
+        )
+    path = tmp_path / "stereo.wav"
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(sample_width)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(payload)
+
+    AudioPostProcessor().trim_silence(path)
+
+    params, frames = _read_wav_frames(path)
+    frame_width = 2 * sample_width
+    assert params.nframes == 3
+    assert frames == payload[5 * frame_width : 8 * frame_width]
+
+
+@pytest.mark.parametrize("sample_width", [2, 4])
+def test_postprocess_decodes_wide_pcm_sample_views(sample_width: int) -> None:
+    """Wide PCM samples should decode to the same values whether or not they are views."""
+
+    values = [0, 1, -1, (1 << (sample_width * 8 - 1)) - 1, -(1 << (sample_width * 8 - 1))]
+    payload = b"".join(
+        value.to_bytes(sample_width, "little", signed=True) for value in values
+    )
+
+    samples = AudioPostProcessor()._iter_samples(payload + b"\x00", sample_width)
+
+    assert list(samples) == values
+
+
 def test_metadata_writer_writes_stable_wav_info_tags(tmp_path: Path) -> None:
     """Tagging should write deterministic RIFF INFO fields and remain idempotent."""
 
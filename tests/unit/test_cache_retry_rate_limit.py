@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import json
 from pathlib import Path
+import threading
 
 import pytest
 
 from bookvoice.config import BookvoiceConfig
 from bookvoice.llm import openai_client as openai_http
-from bookvoice.llm.cache import ResponseCache
+from bookvoice.llm.cache import ResponseCache, ResponseCacheStore
 from bookvoice.llm.openai_client import OpenAIChatClient, OpenAIProviderError, OpenAISpeechClient
 from bookvoice.llm.rate_limiter import RateLimiter
 from bookvoice.models.datatypes import Chunk
@@ -80,6 +82,61 @@ def test_response_cache_tracks_hits_and_misses() -> None:
     assert cache.hit_rate() == 0.5
 
 
+def test_response_cache_computes_concurrent_misses_once() -> None:
+    """Concurrent lookups of one missing key should share a single computation."""
+
+    cache = ResponseCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def _compute() -> str:
+        """Record the call and block until every worker has queued on the key."""
+
+        calls.append("computed")
+        started.set()
+        release.wait(timeout=5)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(cache.get_or_compute, "key", _compute) for _ in range(4)]
+        started.wait(timeout=5)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == ["value"] * 4
+    assert calls == ["computed"]
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_response_cache_store_persists_entries_across_cache_instances(tmp_path: Path) -> None:
+    """A stored response should be a hit for a fresh cache backed by the same file."""
+
+    path = tmp_path / "cache/responses.sqlite3"
+    first_store = ResponseCacheStore(path)
+    ResponseCache(store=first_store).set("known-key", "value")
+    first_store.close()
+
+    cache = ResponseCache(store=ResponseCacheStore(path))
+
+    assert cache.get("known-key") == "value"
+    assert cache.get("missing-key") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_response_cache_store_degrades_to_memory_when_unusable(tmp_path: Path) -> None:
+    """An unusable cache path should leave the in-memory cache working."""
+
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a directory", encoding="utf-8")
+    cache = ResponseCache(store=ResponseCacheStore(blocker / "responses.sqlite3"))
+
+    cache.set("known-key", "value")
+
+    assert cache.get("known-key") == "value"
+    assert cache.store is not None and cache.store.get("known-key") is None
+
+
 def test_rate_limiter_enforces_minimum_interval_per_key() -> None:
     """Rate limiter should sleep before repeated calls for the same key."""
 
@@ -104,6 +161,18 @@ def test_rate_limiter_enforces_minimum_interval_per_key() -> None:
     assert waits == [0.5]
 
 
+def test_rate_limiter_reserves_consecutive_slots_for_overlapping_callers() -> None:
+    """Callers acquiring before earlier waits finish should queue behind reserved slots."""
+
+    waits: list[float] = []
+    limiter = RateLimiter(min_interval_seconds=0.5, clock=lambda: 0.0, sleeper=waits.append)
+
+    for _ in range(3):
+        limiter.acquire("openai:tts:gpt-4o-mini-tts")
+
+    assert waits == [0.5, 1.0]
+
+
 def test_openai_client_retries_transient_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     """OpenAI client should retry timeout failures within bounded retry budget."""
 
@@ -125,7 +194,9 @@ def test_openai_client_retries_transient_timeout(monkeypatch: pytest.MonkeyPatch
 
         sleeps.append(delay)
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
     monkeypatch.setattr("bookvoice.llm.openai_client.time.sleep", _fake_sleep)
 
     client = OpenAIChatClient(
@@ -164,7 +235,9 @@ def test_openai_client_does_not_retry_permanent_failures(
             payload=b'{"error":{"message":"invalid api key"}}',
         )
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
 
     client = OpenAIChatClient(api_key="key", max_retries=3, rate_limiter=RateLimiter(0.0))
     with pytest.raises(OpenAIProviderError, match="authentication failed"):
@@ -194,7 +267,9 @@ def test_openai_clients_enforce_rate_limiter_on_chat_and_tts_paths(
             )
         return _MockRequestsResponse(payload=b"RIFF")
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
 
     chat_client = OpenAIChatClient(api_key="key", rate_limiter=limiter)
     speech_client = OpenAISpeechClient(api_key="key", rate_limiter=limiter)
@@ -245,3 +320,75 @@ def test_pipeline_records_cache_telemetry_for_translate_stage(
     assert metadata["provider_cache_hits"] == "1"
     assert metadata["provider_cache_misses"] == "1"
     assert metadata["provider_cache_hit_rate"] == "0.5000"
+
+
+def test_pipeline_translate_stage_preserves_order_with_provider_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Concurrent translate calls should still return results in chunk order."""
+
+    def _mock_chat_completion(self, **kwargs: object) -> str:
+        """Echo the prompt tail so each result identifies its source chunk."""
+
+        _ = self
+        return str(kwargs["user_prompt"]).split()[-1]
+
+    monkeypatch.setattr(OpenAIChatClient, "chat_completion_text", _mock_chat_completion)
+
+    pipeline = BookvoicePipeline()
+    config = BookvoiceConfig(
+        input_pdf=Path("in.pdf"),
+        output_dir=Path("out"),
+        api_key="key",
+        provider_concurrency=4,
+    )
+    chunks = [
+        Chunk(
+            chapter_index=1,
+            chunk_index=index,
+            text=f"chunk-{index}",
+            char_start=index * 8,
+            char_end=index * 8 + 7,
+        )
+        for index in range(12)
+    ]
+
+    translations = pipeline._translate(chunks, config)
+
+    assert [item.chunk.chunk_index for item in translations] == list(range(12))
+    assert [item.translated_text for item in translations] == [
+        f"chunk-{index}" for index in range(12)
+    ]
+
+
+def test_pipeline_reuses_persisted_responses_across_pipelines(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A configured response cache directory should skip provider calls on later runs."""
+
+    calls = {"count": 0}
+
+    def _mock_chat_completion(self, **kwargs: object) -> str:
+        """Count provider calls and return deterministic text."""
+
+        _ = self
+        _ = kwargs
+        calls["count"] += 1
+        return "Ahoj"
+
+    monkeypatch.setattr(OpenAIChatClient, "chat_completion_text", _mock_chat_completion)
+    config = BookvoiceConfig(
+        input_pdf=Path("in.pdf"),
+        output_dir=tmp_path / "out",
+        api_key="key",
+        response_cache_dir=tmp_path / "cache",
+    )
+    chunk = Chunk(chapter_index=1, chunk_index=0, text="Hello.", char_start=0, char_end=6)
+
+    first = BookvoicePipeline()._translate([chunk], config)
+    second_pipeline = BookvoicePipeline()
+    second = second_pipeline._translate([chunk], config)
+
+    assert first == second
+    assert calls["count"] == 1
+    assert second_pipeline._provider_call_manifest_metadata()["provider_cache_hits"] == "1"
@@ -33,6 +33,8 @@ api_key: " test-key "
 chunk_size_chars: " 2400 "
 chapter_selection: " 1,3-4 "
 resume: false
+provider_concurrency: 4
+response_cache_dir: " cache/responses "
 extra:
   profile: " nightly "
 reader_output_format: " pdf,epub "
@@ -59,6 +61,8 @@ reader_output_format: " pdf,epub "
     assert config.chunk_size_chars == 2400
     assert config.chapter_selection == "1,3-4"
     assert config.resume is False
+    assert config.provider_concurrency == 4
+    assert config.response_cache_dir == Path("cache/responses")
     assert config.extra == {"profile": "nightly", "reader_output_format": "pdf,epub"}
 
 
@@ -133,6 +137,8 @@ def test_config_loader_from_env_loads_runtime_values_and_normalizes_blanks() ->
         "BOOKVOICE_CHAPTER_SELECTION": "   ",
         "OPENAI_API_KEY": " env-api-key ",
         "BOOKVOICE_READER_OUTPUT_FORMAT": " pdf ",
+        "BOOKVOICE_PROVIDER_CONCURRENCY": " 3 ",
+        "BOOKVOICE_RESPONSE_CACHE_DIR": " cache ",
     }
 
     config = ConfigLoader.from_env(env)
@@ -149,6 +155,8 @@ def test_config_loader_from_env_loads_runtime_values_and_normalizes_blanks() ->
     assert config.rewrite_bypass is True
     assert config.chapter_selection is None
     assert config.api_key == "env-api-key"
+    assert config.provider_concurrency == 3
+    assert config.response_cache_dir == Path("cache")
     assert config.extra["reader_output_format"] == "pdf"
 
 
@@ -0,0 +1,115 @@
+"""Unit tests for artifact JSON encoding/decoding helpers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bookvoice.io import json_codec
+from bookvoice.io.json_codec import (
+    decode_json_artifact,
+    encode_json_artifact,
+    iter_json_artifact_chunks,
+)
+
+
+@pytest.fixture(params=["accelerated", "stdlib"])
+def codec_mode(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run codec tests with the optional accelerator and with the stdlib fallback."""
+
+    mode = str(request.param)
+    if mode == "stdlib":
+        monkeypatch.setattr(json_codec, "_orjson", None)
+    return mode
+
+
+def test_encode_json_artifact_matches_stdlib_layout(codec_mode: str) -> None:
+    """Encoded artifacts should use indented, key-sorted UTF-8 JSON in every mode."""
+
+    payload = {"b": [1, {"z": None, "a": True}], "a": "Žluťoučký", "c": {}}
+
+    assert encode_json_artifact(payload) == json.dumps(
+        payload, ensure_ascii=False, indent=2, sort_keys=True
+    ).encode("utf-8")
+
+
+def test_encode_json_artifact_roundtrips_float_values(codec_mode: str) -> None:
+    """Floats may be spelled per encoder but should decode to the same values."""
+
+    payload = {
+        "costs": [0.000015, 1e16, 1.5e-7, -2.5e-05, 0.1, 1.0, 12, -3],
+        "digest": "3e5f0a",
+        "text": "1e16 costs 0.000015 \" 2e3",
+    }
+
+    assert decode_json_artifact(encode_json_artifact(payload)) == payload
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_encode_json_artifact_writes_non_finite_floats_like_stdlib(
+    codec_mode: str, value: float
+) -> None:
+    """NaN and infinity should keep stdlib `json` output instead of becoming `null`."""
+
+    payload = {"missing": None, "values": [{"duration_seconds": value}]}
+
+    assert encode_json_artifact(payload) == json.dumps(
+        payload, ensure_ascii=False, indent=2, sort_keys=True
+    ).encode("utf-8")
+
+
+def test_encode_json_artifact_falls_back_for_non_string_keys(codec_mode: str) -> None:
+    """Payloads outside the accelerator type domain should still encode."""
+
+    assert encode_json_artifact({1: "one"}) == b'{\n  "1": "one"\n}'
+
+
+def test_encode_json_artifact_writes_paths_as_strings(codec_mode: str) -> None:
+    """Path values should encode as strings and unsupported objects should still fail."""
+
+    assert encode_json_artifact({"path": Path("audio/part.wav")}) == (
+        b'{\n  "path": "audio/part.wav"\n}'
+    )
+    with pytest.raises(TypeError):
+        encode_json_artifact({"value": object()})
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {},
+        {"items": []},
+        {"metadata": {"scope": "all"}, "items": [{"text": "a\nb", "nested": [1, {}]}, 2]},
+        [{"a": 1}],
+        {1: "one"},
+        {"parts": [{"duration_seconds": 1e-05}, {"duration_seconds": 2.5}]},
+    ],
+)
+def test_iter_json_artifact_chunks_matches_encoded_bytes(
+    codec_mode: str, payload: object
+) -> None:
+    """Streamed artifact chunks should concatenate to the one-shot encoding."""
+
+    chunks = list(iter_json_artifact_chunks(payload))
+
+    assert b"".join(chunks) == encode_json_artifact(payload)
+
+
+def test_decode_json_artifact_roundtrips_utf8_bytes(codec_mode: str) -> None:
+    """Decoding should read UTF-8 JSON bytes directly."""
+
+    assert decode_json_artifact('{"title": "Kniha č. 1"}'.encode("utf-8")) == {
+        "title": "Kniha č. 1"
+    }
+
+
+@pytest.mark.parametrize("payload", [b"{not json", b'{"title": "\xff"}'])
+def test_decode_json_artifact_raises_json_decode_error(
+    codec_mode: str, payload: bytes
+) -> None:
+    """Malformed JSON and invalid UTF-8 should both raise `json.JSONDecodeError`."""
+
+    with pytest.raises(json.JSONDecodeError):
+        decode_json_artifact(payload)
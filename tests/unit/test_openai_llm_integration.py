@@ -96,7 +96,9 @@ def test_openai_translator_happy_path(monkeypatch: pytest.MonkeyPatch) -> None:
             ).encode("utf-8")
         )
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
 
     translator = OpenAITranslator(model="gpt-4.1-mini", provider_id="openai", api_key="key")
     chunk = Chunk(chapter_index=1, chunk_index=0, text="Hello world.", char_start=0, char_end=12)
@@ -108,6 +110,62 @@ def test_openai_translator_happy_path(monkeypatch: pytest.MonkeyPatch) -> None:
     assert result.model == "gpt-4.1-mini"
 
 
+def test_openai_clients_reuse_one_http_session_per_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Consecutive calls should share a client's session; separate clients should not."""
+
+    sessions: list[object] = []
+
+    def _mock_post(session: object, _url: str, **_kwargs: object) -> _MockRequestsResponse:
+        """Record the session issuing the request and return a chat response."""
+
+        sessions.append(session)
+        return _MockRequestsResponse(
+            payload=json.dumps({"choices": [{"message": {"content": "Ahoj."}}]}).encode("utf-8")
+        )
+
+    monkeypatch.setattr("bookvoice.llm.openai_client.requests.Session.post", _mock_post)
+
+    translator = OpenAITranslator(model="gpt-4.1-mini", provider_id="openai", api_key="key")
+    for chunk_index, text in enumerate(("Hello.", "World.")):
+        chunk = Chunk(
+            chapter_index=1, chunk_index=chunk_index, text=text, char_start=0, char_end=6
+        )
+        translator.translate(chunk, target_language="cs")
+
+    AudioRewriter(model="gpt-4.1-mini", provider_id="openai", api_key="other-key").rewrite(
+        TranslationResult(
+            chunk=chunk, translated_text="Ahoj.", provider="openai", model="gpt-4.1-mini"
+        )
+    )
+
+    assert len(sessions) == 3
+    assert sessions[0] is sessions[1]
+    assert sessions[2] is not sessions[0]
+
+
+def test_openai_client_pool_matches_concurrency_and_closes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Client connection pools should fit the stage concurrency and close with the client."""
+
+    closed: list[object] = []
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.close",
+        lambda session: closed.append(session),
+    )
+
+    translator = OpenAITranslator(
+        model="gpt-4.1-mini", provider_id="openai", api_key="key", max_connections=32
+    )
+    session = translator.client._http_session
+
+    assert session.get_adapter("https://api.openai.com/v1")._pool_maxsize == 32
+    translator.close()
+    assert closed == [session]
+
+
 def test_openai_translator_provider_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     """Translator should raise provider error when OpenAI request fails."""
 
@@ -116,7 +174,9 @@ def test_openai_translator_provider_failure(monkeypatch: pytest.MonkeyPatch) ->
 
         raise openai_http.requests.ConnectionError("network down")
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
 
     translator = OpenAITranslator(model="gpt-4.1-mini", provider_id="openai", api_key="key")
     chunk = Chunk(chapter_index=1, chunk_index=0, text="Hello world.", char_start=0, char_end=12)
@@ -141,7 +201,9 @@ def test_openai_rewriter_happy_path(monkeypatch: pytest.MonkeyPatch) -> None:
             ).encode("utf-8")
         )
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
 
     chunk = Chunk(chapter_index=1, chunk_index=0, text="Hello world.", char_start=0, char_end=12)
     translation = TranslationResult(
@@ -170,7 +232,9 @@ def test_openai_rewriter_provider_failure(monkeypatch: pytest.MonkeyPatch) -> No
             payload=b'{"error":{"message":"invalid api key"}}',
         )
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
 
     chunk = Chunk(chapter_index=1, chunk_index=0, text="Hello world.", char_start=0, char_end=12)
     translation = TranslationResult(
@@ -194,7 +258,9 @@ def test_openai_tts_happy_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch)
 
         return _MockBinaryHTTPResponse(_mock_wav_bytes())
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
 
     chunk = Chunk(chapter_index=2, chunk_index=3, text="Hello world.", char_start=0, char_end=12)
     rewrite = RewriteResult(
@@ -247,7 +313,9 @@ def test_openai_tts_slugifies_non_ascii_part_titles(
 
         return _MockBinaryHTTPResponse(_mock_wav_bytes())
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
 
     chunk = Chunk(
         chapter_index=1,
@@ -301,7 +369,9 @@ def test_openai_tts_provider_failure(monkeypatch: pytest.MonkeyPatch) -> None:
             payload=b'{"error":{"message":"invalid api key"}}',
         )
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
 
     with pytest.raises(OpenAIProviderError, match="authentication failed") as exc_info:
         OpenAISpeechClient(api_key="key").synthesize_speech(
@@ -328,7 +398,9 @@ def test_openai_client_classifies_quota_failures(
             ),
         )
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
     client = OpenAIChatClient(api_key="key")
 
     with pytest.raises(OpenAIProviderError, match="quota is insufficient") as exc_info:
@@ -353,7 +425,9 @@ def test_openai_client_handles_http_error_with_undecodable_body(
             payload=b"\xff\xfe\xfd",
         )
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
     client = OpenAIChatClient(api_key="key")
 
     with pytest.raises(
@@ -379,7 +453,9 @@ def test_openai_client_classifies_transport_error_as_timeout(
 
         raise openai_http.requests.Timeout("socket timed out")
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
     client = OpenAIChatClient(api_key="key")
 
     with pytest.raises(OpenAIProviderError, match="timed out") as exc_info:
@@ -401,7 +477,9 @@ def test_openai_client_classifies_transport_error_as_transport(
 
         raise openai_http.requests.ConnectionError("temporary DNS failure")
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
     client = OpenAISpeechClient(api_key="key")
 
     with pytest.raises(OpenAIProviderError, match="transport error") as exc_info:
@@ -423,7 +501,9 @@ def test_openai_speech_rejects_empty_response_payload(
 
         return _MockBinaryHTTPResponse(b"")
 
-    monkeypatch.setattr("bookvoice.llm.openai_client.requests.post", _mock_post)
+    monkeypatch.setattr(
+        "bookvoice.llm.openai_client.requests.Session.post", staticmethod(_mock_post)
+    )
     client = OpenAISpeechClient(api_key="key")
 
     with pytest.raises(OpenAIProviderError, match="OpenAI speech response is empty."):
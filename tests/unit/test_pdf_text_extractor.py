@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import subprocess
+from typing import cast
 
 from pytest import MonkeyPatch
 
@@ -48,3 +49,28 @@ def test_extract_pages_falls_back_to_pypdf_when_pdfinfo_is_missing(
 
     assert len(pages) >= 2
     assert any("Chapter 1: Orchard Ledger" in page for page in pages)
+
+
+def test_extract_pages_runs_one_pdftotext_per_page_range(monkeypatch: MonkeyPatch) -> None:
+    """Page-wise extraction should split pages into ranges and keep page order."""
+
+    pdftotext_ranges: list[tuple[int, int]] = []
+
+    def _run_fake_poppler(*args: object, **kwargs: object) -> subprocess.CompletedProcess[str]:
+        _ = kwargs
+        command = [str(part) for part in cast(list[object], args[0])]
+        if "pdfinfo" in command[0]:
+            return subprocess.CompletedProcess(command, 0, stdout="Pages:          7\n", stderr="")
+        first = int(command[command.index("-f") + 1])
+        last = int(command[command.index("-l") + 1])
+        pdftotext_ranges.append((first, last))
+        stdout = "".join(f" Page {page} \f" for page in range(first, last + 1))
+        return subprocess.CompletedProcess(command, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", _run_fake_poppler)
+    monkeypatch.setattr("bookvoice.io.pdf_text_extractor.os.cpu_count", lambda: 3)
+
+    pages = PdfTextExtractor().extract_pages(canonical_content_pdf_fixture_path())
+
+    assert pages == [f"Page {page}" for page in range(1, 8)]
+    assert sorted(pdftotext_ranges) == [(1, 3), (4, 5), (6, 7)]
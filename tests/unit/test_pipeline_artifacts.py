@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 import json
 from pathlib import Path
 from typing import Any, cast
@@ -10,9 +11,35 @@ import pytest
 
 from bookvoice.config import ProviderRuntimeConfig
 from bookvoice.errors import PipelineStageError
-from bookvoice.models.datatypes import Chapter, Chunk, RewriteResult, TranslationResult
+from bookvoice.models.datatypes import (
+    AudioPart,
+    BookMeta,
+    Chapter,
+    ChapterStructureUnit,
+    Chunk,
+    RewriteResult,
+    RunManifest,
+    TranslationResult,
+)
+from bookvoice.pipeline import artifacts as artifacts_module
 from bookvoice.pipeline.artifacts import (
+    ChunkPayloadMemo,
+    TranslationPayloadMemo,
+    chapter_artifact_payload,
+    chunk_artifact_payload,
+    chunk_payload,
+    iter_rewrites,
+    load_audio_parts,
+    load_chapter_artifact,
+    load_chapter_metadata,
+    load_chapters,
+    load_chunks,
+    load_normalized_structure,
+    load_rewrites,
     load_translated_document,
+    load_translations,
+    manifest_payload,
+    part_mapping_manifest_metadata,
     rewrite_artifact_payload,
     translated_document_artifact_payload,
     translation_artifact_payload,
@@ -107,6 +134,340 @@ def test_translation_and_rewrite_payload_builders_share_expected_schema() -> Non
     }
 
 
+def test_chunk_payload_matches_dataclass_serialization() -> None:
+    """Explicit chunk builder should persist the same JSON document as `asdict`."""
+
+    chunk = Chunk(
+        chapter_index=2,
+        chunk_index=3,
+        text="Chunk text.",
+        char_start=10,
+        char_end=21,
+        part_index=4,
+        part_title="Part title",
+        part_id="002_04_part-title",
+        source_order_indices=(5, 6),
+        boundary_strategy="chapter_end",
+    )
+
+    assert json.dumps(chunk_payload(chunk), sort_keys=True) == json.dumps(
+        asdict(chunk), sort_keys=True
+    )
+
+
+def test_chapter_artifact_payload_matches_dataclass_serialization() -> None:
+    """Explicit chapter and structure builders should match `asdict` output."""
+
+    chapter = Chapter(index=1, title="Kapitola 1", text="Text kapitoly.")
+    unit = ChapterStructureUnit(
+        order_index=1,
+        chapter_index=1,
+        chapter_title="Kapitola 1",
+        subchapter_index=None,
+        subchapter_title=None,
+        text="Text kapitoly.",
+        char_start=0,
+        char_end=14,
+        source="text_heuristic",
+    )
+
+    payload = chapter_artifact_payload(
+        [chapter], "text_heuristic", "", {"chapter_scope_mode": "all"}, [unit]
+    )
+    metadata = cast(dict[str, Any], payload["metadata"])
+
+    assert payload["chapters"] == [asdict(chapter)]
+    assert metadata["normalized_structure"] == [asdict(unit)]
+
+
+def test_chapter_loaders_round_trip_artifact_payload(tmp_path: Path) -> None:
+    """Chapter and structure loaders should rebuild the serialized dataclasses.
+
+    The combined loader should return the same values as the individual loaders.
+    """
+
+    chapter = Chapter(index=2, title="Kapitola 2", text="Text.")
+    unit = ChapterStructureUnit(
+        order_index=1,
+        chapter_index=2,
+        chapter_title="Kapitola 2",
+        subchapter_index=1,
+        subchapter_title="Oddil",
+        text="Text.",
+        char_start=0,
+        char_end=5,
+        source="pdf_outline",
+    )
+    path = tmp_path / "chapters.json"
+    payload = chapter_artifact_payload(
+        [chapter], "pdf_outline", "", {"chapter_scope_mode": "all"}, [unit]
+    )
+    cast(dict[str, Any], payload["metadata"])["normalized_structure"].append("ignored")
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    assert load_chapters(path) == [chapter]
+    assert load_normalized_structure(path) == [unit]
+    assert load_chapter_artifact(path) == (
+        [chapter],
+        load_chapter_metadata(path),
+        [unit],
+    )
+
+
+def test_payload_builders_reuse_memoized_chunk_mappings() -> None:
+    """Chunk, translation, and rewrite payloads should share one mapping per chunk."""
+
+    runtime_config = ProviderRuntimeConfig(
+        translator_provider="openai",
+        rewriter_provider="openai",
+        tts_provider="openai",
+        translate_model="gpt-4.1-mini",
+        rewrite_model="gpt-4.1-mini",
+        tts_model="gpt-4o-mini-tts",
+        tts_voice="echo",
+    )
+    chunk = Chunk(chapter_index=1, chunk_index=0, text="Text.", char_start=0, char_end=5)
+    translation = TranslationResult(
+        chunk=chunk, translated_text="Text.", provider="openai", model="gpt-4.1-mini"
+    )
+    rewrite = RewriteResult(
+        translation=translation,
+        rewritten_text="Text.",
+        provider="openai",
+        model="gpt-4.1-mini",
+    )
+    memo: ChunkPayloadMemo = {}
+
+    chunks_payload = cast(
+        dict[str, Any], chunk_artifact_payload([chunk], {}, {}, memo)
+    )
+    translations_payload = cast(
+        dict[str, Any], translation_artifact_payload([translation], {}, runtime_config, memo)
+    )
+    rewrites_payload = cast(
+        dict[str, Any], rewrite_artifact_payload([rewrite], {}, runtime_config, memo)
+    )
+
+    assert list(memo) == [chunk]
+    assert chunks_payload["chunks"][0] is memo[chunk]
+    assert translations_payload["translations"][0]["chunk"] is memo[chunk]
+    assert rewrites_payload["rewrites"][0]["translation"]["chunk"] is memo[chunk]
+
+
+def test_rewrite_payload_reuses_memoized_translation_mappings() -> None:
+    """Rewrite payloads should share translation mappings built for translations."""
+
+    runtime_config = ProviderRuntimeConfig(
+        translator_provider="openai",
+        rewriter_provider="openai",
+        tts_provider="openai",
+        translate_model="gpt-4.1-mini",
+        rewrite_model="gpt-4.1-mini",
+        tts_model="gpt-4o-mini-tts",
+        tts_voice="echo",
+    )
+    chunk = Chunk(chapter_index=1, chunk_index=0, text="Text.", char_start=0, char_end=5)
+    translation = TranslationResult(
+        chunk=chunk, translated_text="Text.", provider="openai", model="gpt-4.1-mini"
+    )
+    rewrite = RewriteResult(
+        translation=translation,
+        rewritten_text="Text.",
+        provider="openai",
+        model="gpt-4.1-mini",
+    )
+    chunk_memo: ChunkPayloadMemo = {}
+    translation_memo: TranslationPayloadMemo = {}
+
+    translations_payload = cast(
+        dict[str, Any],
+        translation_artifact_payload(
+            [translation], {}, runtime_config, chunk_memo, translation_memo
+        ),
+    )
+    rewrites_payload = cast(
+        dict[str, Any],
+        rewrite_artifact_payload([rewrite], {}, runtime_config, chunk_memo, translation_memo),
+    )
+
+    assert list(translation_memo) == [translation]
+    assert translations_payload["translations"][0] is translation_memo[translation]
+    assert rewrites_payload["rewrites"][0]["translation"] is translation_memo[translation]
+    assert translation_memo[translation]["chunk"] is chunk_memo[chunk]
+
+
+def test_load_rewrites_reuses_matching_loaded_translations(tmp_path: Path) -> None:
+    """Rewrite loading should share identical translations and rebuild divergent ones."""
+
+    runtime_config = ProviderRuntimeConfig(
+        translator_provider="openai",
+        rewriter_provider="openai",
+        tts_provider="openai",
+        translate_model="gpt-4.1-mini",
+        rewrite_model="gpt-4.1-mini",
+        tts_model="gpt-4o-mini-tts",
+        tts_voice="echo",
+    )
+    translations = [
+        TranslationResult(
+            chunk=Chunk(
+                chapter_index=1,
+                chunk_index=index,
+                text=f"Text {index}.",
+                char_start=0,
+                char_end=7,
+                source_order_indices=(index,),
+            ),
+            translated_text=f"Preklad {index}.",
+            provider="openai",
+            model="gpt-4.1-mini",
+        )
+        for index in range(2)
+    ]
+    rewrites = [
+        RewriteResult(
+            translation=item,
+            rewritten_text=item.translated_text,
+            provider="openai",
+            model="gpt-4.1-mini",
+        )
+        for item in translations
+    ]
+    translations_path = tmp_path / "translations.json"
+    rewrites_path = tmp_path / "rewrites.json"
+    translations_path.write_text(
+        json.dumps(translation_artifact_payload(translations, {}, runtime_config)),
+        encoding="utf-8",
+    )
+    rewrites_payload = cast(
+        dict[str, Any], rewrite_artifact_payload(rewrites, {}, runtime_config)
+    )
+    rewrites_payload["rewrites"][1]["translation"]["translated_text"] = "Jiny preklad."
+    rewrites_path.write_text(json.dumps(rewrites_payload), encoding="utf-8")
+
+    loaded_translations = load_translations(translations_path)
+    loaded_rewrites = load_rewrites(rewrites_path, loaded_translations)
+
+    assert loaded_rewrites[0].translation is loaded_translations[0]
+    assert loaded_rewrites[1].translation is not loaded_translations[1]
+    assert loaded_rewrites[1].translation.translated_text == "Jiny preklad."
+    assert loaded_rewrites == load_rewrites(rewrites_path)
+
+
+
+def test_iter_rewrites_yields_items_lazily(tmp_path: Path) -> None:
+    """Rewrite iteration should yield valid items before reaching a malformed one."""
+
+    runtime_config = ProviderRuntimeConfig(
+        translator_provider="openai",
+        rewriter_provider="openai",
+        tts_provider="openai",
+        translate_model="gpt-4.1-mini",
+        rewrite_model="gpt-4.1-mini",
+        tts_model="gpt-4o-mini-tts",
+        tts_voice="echo",
+    )
+    translation = TranslationResult(
+        chunk=Chunk(
+            chapter_index=1,
+            chunk_index=0,
+            text="Text.",
+            char_start=0,
+            char_end=5,
+            source_order_indices=(0,),
+        ),
+        translated_text="Preklad.",
+        provider="openai",
+        model="gpt-4.1-mini",
+    )
+    rewrite = RewriteResult(
+        translation=translation,
+        rewritten_text="Prepis.",
+        provider="openai",
+        model="gpt-4.1-mini",
+    )
+    rewrites_payload = cast(
+        dict[str, Any], rewrite_artifact_payload([rewrite], {}, runtime_config)
+    )
+    rewrites_payload["rewrites"].append("not-an-object")
+    rewrites_path = tmp_path / "rewrites.json"
+    rewrites_path.write_text(json.dumps(rewrites_payload), encoding="utf-8")
+
+    iterator = iter_rewrites(rewrites_path)
+
+    assert next(iterator) == rewrite
+    with pytest.raises(PipelineStageError, match="Malformed rewrite item"):
+        next(iterator)
+
+def test_part_mapping_metadata_orders_parts_by_chapter_and_chunk() -> None:
+    """Part mapping CSVs should follow chapter/chunk order regardless of input order."""
+
+    parts = [
+        AudioPart(
+            chapter_index=2,
+            chunk_index=0,
+            path=Path("audio/chunks/002_01.wav"),
+            duration_seconds=1.0,
+            source_order_indices=(3,),
+        ),
+        AudioPart(
+            chapter_index=1,
+            chunk_index=1,
+            path=Path("audio/chunks/001_02.wav"),
+            duration_seconds=1.0,
+            part_index=2,
+            source_order_indices=(1, 2),
+        ),
+    ]
+
+    assert part_mapping_manifest_metadata(parts) == {
+        "part_count": "2",
+        "chapter_part_map_csv": "1:2,2:1",
+        "part_filenames_csv": "001_02.wav,002_01.wav",
+        "part_source_structure_indices_csv": "1,2,3",
+    }
+
+
+def test_manifest_payload_copies_extra_metadata() -> None:
+    """Manifest payload should expose a detached copy of string extra metadata."""
+
+    extra = {"run_root": "out/run-1", "chapter_scope_mode": "all"}
+    manifest = RunManifest(
+        run_id="run-1",
+        config_hash="abc",
+        book=BookMeta(source_pdf=Path("book.pdf"), title="Book", author=None, language="cs"),
+        merged_audio_path=Path("out/run-1/audio/bookvoice_merged.wav"),
+        total_llm_cost_usd=0.1,
+        total_tts_cost_usd=0.2,
+        total_cost_usd=0.3,
+        extra=extra,
+    )
+
+    payload = manifest_payload(manifest)
+    payload_extra = cast(dict[str, str], payload["extra"])
+    payload_extra["run_root"] = "changed"
+
+    assert payload_extra["chapter_scope_mode"] == "all"
+    assert extra["run_root"] == "out/run-1"
+
+
+def test_manifest_payload_coerces_extra_values_to_strings() -> None:
+    """Manifest payload should keep extra metadata JSON-safe for path-like values."""
+
+    manifest = RunManifest(
+        run_id="run-1",
+        config_hash="abc",
+        book=BookMeta(source_pdf=Path("book.pdf"), title="Book", author=None, language="cs"),
+        merged_audio_path=Path("out/run-1/audio/bookvoice_merged.wav"),
+        total_llm_cost_usd=0.1,
+        total_tts_cost_usd=0.2,
+        total_cost_usd=0.3,
+        extra=cast(dict[str, str], {"run_root": Path("out/run-1")}),
+    )
+
+    assert manifest_payload(manifest)["extra"] == {"run_root": str(Path("out/run-1"))}
+
+
 def test_translated_document_payload_and_loader_roundtrip(tmp_path: Path) -> None:
     """Translated-document artifact should serialize deterministically and load back."""
 
@@ -213,3 +574,204 @@ def test_load_translated_document_rejects_unordered_chapter_indices(
 
     with pytest.raises(PipelineStageError, match="strictly ordered"):
         load_translated_document(artifact_path)
+
+
+def test_load_chunks_accepts_native_and_legacy_textual_values(tmp_path: Path) -> None:
+    """Chunk loading should keep native JSON types and coerce legacy string integers."""
+
+    chunk = Chunk(
+        chapter_index=1,
+        chunk_index=0,
+        text="Text.",
+        char_start=0,
+        char_end=5,
+        part_index=1,
+        part_title="Part",
+        part_id="001_01_part",
+        source_order_indices=(1, 2),
+    )
+    legacy_mapping: dict[str, object] = {
+        **chunk_payload(chunk),
+        "chunk_index": "1",
+        "char_start": "6",
+        "char_end": "11",
+        "source_order_indices": ["3"],
+    }
+    path = tmp_path / "chunks.json"
+    path.write_text(
+        json.dumps({"chunks": [chunk_payload(chunk), legacy_mapping]}), encoding="utf-8"
+    )
+
+    loaded = load_chunks(path)
+
+    assert loaded[0] == chunk
+    assert (loaded[1].chunk_index, loaded[1].char_start, loaded[1].char_end) == (1, 6, 11)
+    assert loaded[1].source_order_indices == (3,)
+
+
+def test_loaders_accept_numeric_float_indices(tmp_path: Path) -> None:
+    """Whole-number floats in index fields should load as integers, as before."""
+
+    chapters_path = tmp_path / "chapters.json"
+    chapters_path.write_text(
+        json.dumps({"chapters": [{"index": 2.0, "title": "Kapitola", "text": "Text."}]}),
+        encoding="utf-8",
+    )
+    chunks_path = tmp_path / "chunks.json"
+    chunk = Chunk(chapter_index=2, chunk_index=0, text="Text.", char_start=0, char_end=5)
+    chunks_path.write_text(
+        json.dumps({"chunks": [{**chunk_payload(chunk), "chunk_index": 0.0, "char_end": 5.0}]}),
+        encoding="utf-8",
+    )
+
+    assert load_chapters(chapters_path)[0].index == 2
+    loaded_chunk = load_chunks(chunks_path)[0]
+    assert (loaded_chunk.chunk_index, loaded_chunk.char_end) == (0, 5)
+    assert type(loaded_chunk.char_end) is int
+
+
+@pytest.mark.parametrize("chunk_index", [1.7, True])
+def test_load_chunks_rejects_fractional_and_boolean_indices(
+    tmp_path: Path, chunk_index: object
+) -> None:
+    """Fractional floats and booleans in index fields should be malformed, not truncated."""
+
+    chunk = Chunk(chapter_index=1, chunk_index=0, text="Text.", char_start=0, char_end=5)
+    path = tmp_path / "chunks.json"
+    path.write_text(
+        json.dumps({"chunks": [{**chunk_payload(chunk), "chunk_index": chunk_index}]}),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(PipelineStageError, match="Malformed chunk item"):
+        load_chunks(path)
+
+
+@pytest.mark.parametrize(
+    ("loader", "list_key", "item", "message"),
+    [
+        (load_chapters, "chapters", {"index": 1, "title": "Kapitola"}, "Malformed chapter item"),
+        (load_chunks, "chunks", "not-an-object", "Malformed chunk item"),
+        (load_chunks, "chunks", {"chapter_index": 1}, "Malformed chunk item"),
+        (load_translations, "translations", ["chunk"], "Malformed translation item"),
+        (
+            load_translations,
+            "translations",
+            {"chunk": "not-an-object", "translated_text": "", "provider": "", "model": ""},
+            "Malformed translation item",
+        ),
+        (
+            load_rewrites,
+            "rewrites",
+            {"translation": "not-an-object", "rewritten_text": "", "provider": "", "model": ""},
+            "Malformed rewrite item",
+        ),
+        (
+            load_rewrites,
+            "rewrites",
+            {"translation": {"chunk": [1, 0]}, "rewritten_text": "", "provider": "", "model": ""},
+            "Malformed rewrite item",
+        ),
+        (load_audio_parts, "audio_parts", 7, "Malformed audio part item"),
+        (
+            load_audio_parts,
+            "audio_parts",
+            {"chapter_index": 1, "chunk_index": 0, "path": "a.wav"},
+            "Malformed audio part item",
+        ),
+    ],
+)
+def test_batch_loaders_map_malformed_items_to_stage_errors(
+    tmp_path: Path,
+    loader: Any,
+    list_key: str,
+    item: object,
+    message: str,
+) -> None:
+    """Non-mapping items and missing required fields should raise resume-artifact errors."""
+
+    artifact_path = tmp_path / "artifact.json"
+    artifact_path.write_text(json.dumps({list_key: [item]}), encoding="utf-8")
+
+    with pytest.raises(PipelineStageError, match=message) as exc_info:
+        loader(artifact_path)
+
+    assert exc_info.value.stage == "resume-artifacts"
+
+
+def test_typed_loaders_reuse_items_until_artifact_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Unchanged artifacts should be parsed once; rewritten artifacts should reload."""
+
+    decode_calls: list[bytes] = []
+    original_decode = artifacts_module.decode_json_artifact
+
+    def _counting_decode(data: bytes) -> Any:
+        """Count artifact decodes while delegating to the real decoder."""
+
+        decode_calls.append(data)
+        return original_decode(data)
+
+    monkeypatch.setattr(artifacts_module, "decode_json_artifact", _counting_decode)
+    chunk = Chunk(chapter_index=1, chunk_index=0, text="Text.", char_start=0, char_end=5)
+    path = tmp_path / "chunks.json"
+    path.write_text(json.dumps(chunk_artifact_payload([chunk], {}, {})), encoding="utf-8")
+
+    first = load_chunks(path)
+    first.clear()
+    second = load_chunks(path)
+
+    assert second == [chunk]
+    assert len(decode_calls) == 1
+
+    replacement = Chunk(
+        chapter_index=1, chunk_index=1, text="Other text.", char_start=0, char_end=11
+    )
+    path.write_text(json.dumps(chunk_artifact_payload([replacement], {}, {})), encoding="utf-8")
+
+    assert load_chunks(path) == [replacement]
+    assert len(decode_calls) == 2
+
+
+def test_chapter_artifact_loader_reuses_parse_until_artifact_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The combined chapter loader should be stat-cached and hand out fresh containers."""
+
+    decode_calls: list[bytes] = []
+    original_decode = artifacts_module.decode_json_artifact
+
+    def _counting_decode(data: bytes) -> Any:
+        """Count artifact decodes while delegating to the real decoder."""
+
+        decode_calls.append(data)
+        return original_decode(data)
+
+    monkeypatch.setattr(artifacts_module, "decode_json_artifact", _counting_decode)
+    chapter = Chapter(index=1, title="Kapitola 1", text="Text.")
+    path = tmp_path / "chapters.json"
+    path.write_text(
+        json.dumps(chapter_artifact_payload([chapter], "pdf_outline", "", {}, [])), encoding="utf-8"
+    )
+
+    chapters, metadata, _ = load_chapter_artifact(path)
+    chapters.clear()
+    metadata.clear()
+    second = load_chapter_artifact(path)
+
+    assert second[0] == [chapter]
+    assert second[1]["source"] == "pdf_outline"
+    assert load_chapters(path) == [chapter]
+    assert load_chapter_metadata(path)["source"] == "pdf_outline"
+    assert load_normalized_structure(path) == []
+    assert len(decode_calls) == 1
+
+    replacement = Chapter(index=1, title="Kapitola 1", text="Other text.")
+    path.write_text(
+        json.dumps(chapter_artifact_payload([replacement], "pdf_outline", "", {}, [])),
+        encoding="utf-8",
+    )
+
+    assert load_chapter_artifact(path)[0] == [replacement]
+    assert len(decode_calls) == 2
@@ -0,0 +1,65 @@
+"""Unit tests for deterministic pipeline cost-estimation helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from bookvoice.models.datatypes import Chunk, RewriteResult, TranslationResult
+from bookvoice.pipeline.costs import (
+    add_rewrite_costs,
+    add_translation_costs,
+    add_tts_costs,
+    rounded_cost_summary,
+)
+from bookvoice.telemetry.cost_tracker import CostTracker
+
+
+def test_stage_costs_aggregate_billable_characters_per_stage() -> None:
+    """Stage helpers should price summed billable characters, counting empty items as one."""
+
+    translations = [
+        TranslationResult(
+            chunk=Chunk(chapter_index=1, chunk_index=0, text="a" * 600, char_start=0, char_end=600),
+            translated_text="b" * 400,
+            provider="openai",
+            model="gpt-4.1-mini",
+        ),
+        TranslationResult(
+            chunk=Chunk(chapter_index=1, chunk_index=1, text="", char_start=600, char_end=600),
+            translated_text="",
+            provider="openai",
+            model="gpt-4.1-mini",
+        ),
+    ]
+    rewrites = [
+        RewriteResult(
+            translation=item,
+            rewritten_text=item.translated_text,
+            provider="openai",
+            model="gpt-4.1-mini",
+        )
+        for item in translations
+    ]
+    cost_tracker = CostTracker()
+
+    add_translation_costs(translations, cost_tracker)
+    add_rewrite_costs(rewrites, cost_tracker)
+    add_tts_costs(rewrites, cost_tracker)
+
+    assert cost_tracker.llm_cost_usd == pytest.approx(1.001 * 0.0015 + 0.801 * 0.0008)
+    assert cost_tracker.tts_cost_usd == pytest.approx(0.401 * 0.0150)
+    assert rounded_cost_summary(cost_tracker)["total_cost_usd"] == pytest.approx(
+        round(1.001 * 0.0015 + 0.801 * 0.0008, 6) + round(0.401 * 0.0150, 6)
+    )
+
+
+def test_stage_costs_skip_empty_inputs() -> None:
+    """Empty stage outputs should leave the tracker untouched."""
+
+    cost_tracker = CostTracker()
+
+    add_translation_costs([], cost_tracker)
+    add_rewrite_costs([], cost_tracker)
+    add_tts_costs([], cost_tracker)
+
+    assert cost_tracker.summary()["total_cost_usd"] == 0.0
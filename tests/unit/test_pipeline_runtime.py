@@ -0,0 +1,176 @@
+"""Unit tests for pipeline runtime configuration and run-identity helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from bookvoice.config import BookvoiceConfig
+from bookvoice.errors import PipelineStageError
+from bookvoice.io.chapter_splitter import ChapterSplitter
+from bookvoice.models.datatypes import Chapter
+from bookvoice.pipeline import BookvoicePipeline
+
+
+def test_config_hash_is_stable_across_releases() -> None:
+    """Config hashes should stay pinned so existing run directories keep their IDs."""
+
+    pipeline = BookvoicePipeline()
+    default_config = BookvoiceConfig(input_pdf=Path("book.pdf"), output_dir=Path("out"))
+    scoped_config = BookvoiceConfig(
+        input_pdf=Path("kniha.pdf"),
+        output_dir=Path("out"),
+        chapter_selection="1-2",
+        extra={"packaging_mode": "aac", "title": "Žluť"},
+    )
+
+    assert pipeline._config_hash(default_config) == (
+        "9f7e9a18b0fdb326e2d704d7e1a5963a893e49fb48d78cbdcb8fb8530f35a6e4"
+    )
+    assert pipeline._config_hash(scoped_config) == (
+        "7ba4a7fbef2ac2819f32a1fb60bfa5008959806f779a053ce953f56835cabef6"
+    )
+
+
+def test_config_hash_tracks_config_mutation() -> None:
+    """Memoized config hashes should follow field changes on mutable configs."""
+
+    pipeline = BookvoicePipeline()
+    config = BookvoiceConfig(input_pdf=Path("book.pdf"), output_dir=Path("out"))
+    original_hash = pipeline._config_hash(config)
+
+    config.extra["packaging_mode"] = "aac"
+    mutated_hash = pipeline._config_hash(config)
+    config.extra.clear()
+
+    assert mutated_hash != original_hash
+    assert pipeline._config_hash(config) == original_hash
+
+
+def test_prepare_run_derives_run_id_from_config_hash(tmp_path: Path) -> None:
+    """Run IDs and artifact roots should derive from the config hash prefix."""
+
+    pipeline = BookvoicePipeline()
+    config = BookvoiceConfig(input_pdf=tmp_path / "book.pdf", output_dir=tmp_path / "out")
+
+    run_id, config_hash, store = pipeline._prepare_run(config)
+
+    assert run_id == f"run-{config_hash[:12]}"
+    assert store.root == config.output_dir / run_id
+
+
+def test_stage_guard_wraps_unexpected_errors_with_stage_context(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Guarded stage methods should raise stage-aware errors with the stage hint."""
+
+    def _broken_split(self: ChapterSplitter, text: str) -> list[Chapter]:
+        """Simulate an unexpected splitter failure."""
+
+        raise RuntimeError("splitter exploded")
+
+    monkeypatch.setattr(ChapterSplitter, "split", _broken_split)
+    pipeline = BookvoicePipeline()
+
+    with pytest.raises(PipelineStageError) as exc_info:
+        pipeline._split_chapters("Chapter 1\nText.", tmp_path / "missing.pdf")
+
+    assert exc_info.value.stage == "split"
+    assert exc_info.value.detail == "Failed to split chapters: splitter exploded"
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+
+def test_pipeline_reuses_stage_helpers_between_calls() -> None:
+    """Stage helpers should be built once per pipeline and stay correct on reuse."""
+
+    pipeline = BookvoicePipeline()
+
+    first = pipeline._clean_with_metadata("E\nVERY MOMENT IN BUSINESS MATTERS.")
+    cleaner = pipeline._text_cleaner
+    second = pipeline._clean_with_metadata("Plain text.")
+
+    assert pipeline._text_cleaner is cleaner
+    assert pipeline._chapter_splitter is pipeline._chapter_splitter
+    assert first == ("EVERY MOMENT IN BUSINESS MATTERS.", {"drop_cap_merges_count": 1})
+    assert second == ("Plain text.", {"drop_cap_merges_count": 0})
+
+
+def test_pipeline_clean_memo_does_not_retain_raw_text() -> None:
+    """Repeated cleaning should hit the memo without keeping the raw text as its key."""
+
+    pipeline = BookvoicePipeline()
+    raw_text = "E\nVERY MOMENT IN BUSINESS MATTERS."
+
+    first = pipeline._clean_with_metadata(raw_text)
+    second = pipeline._clean_with_metadata("".join(raw_text))
+
+    assert second == first
+    assert len(pipeline._cleaned_text_memo) == 1
+    assert all(isinstance(key, bytes) for key in pipeline._cleaned_text_memo)
+
+
+def test_pipeline_memoizes_extract_for_unchanged_source(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Extracting an unchanged source twice should run the extractor once."""
+
+    source = tmp_path / "book.pdf"
+    source.write_bytes(b"%PDF-1.4 placeholder")
+    config = BookvoiceConfig(input_pdf=source, output_dir=tmp_path / "out")
+    pipeline = BookvoicePipeline()
+    calls: list[Path] = []
+
+    def _fake_extract(config: BookvoiceConfig) -> str:
+        """Record the extraction call and return deterministic text."""
+
+        calls.append(config.source_path)
+        return f"text #{len(calls)}"
+
+    monkeypatch.setattr(pipeline, "_extract_source_text", _fake_extract)
+
+    first = pipeline._extract(config)
+    second = pipeline._extract(config)
+    source.write_bytes(b"%PDF-1.4 placeholder, edited")
+    third = pipeline._extract(config)
+
+    assert (first, second, third) == ("text #1", "text #1", "text #2")
+    assert len(calls) == 2
+
+
+def test_chapter_scope_selection_keeps_index_order() -> None:
+    """Selected chapters should come back in index order, even from unordered input."""
+
+    pipeline = BookvoicePipeline()
+    chapters = [Chapter(index=index, title=f"C{index}", text="x") for index in (3, 1, 4, 2)]
+
+    selected, scope = pipeline._resolve_chapter_scope(chapters, "2-3")
+    resumed, _ = pipeline._resolve_resume_chapter_scope(
+        sorted(chapters, key=lambda chapter: chapter.index),
+        {"chapter_scope_indices_csv": "1,4"},
+    )
+
+    assert [chapter.index for chapter in selected] == [2, 3]
+    assert scope["chapter_scope_indices_csv"] == "2,3"
+    assert scope["chapter_scope_available_indices_csv"] == "1,2,3,4"
+    assert [chapter.index for chapter in resumed] == [1, 4]
+
+
+def test_pipeline_import_defers_provider_http_stack() -> None:
+    """Importing the CLI and pipeline should not load provider HTTP or PDF modules."""
+
+    probe = (
+        "import sys, bookvoice.cli, bookvoice.pipeline; "
+        "print(sorted(name for name in ('requests', 'bookvoice.provider_factory', 'pypdf') "
+        "if name in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert completed.stdout.strip() == "[]"
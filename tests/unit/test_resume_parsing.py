@@ -1,6 +1,22 @@
-"""Unit tests for manifest parsing helpers used by pipeline resume."""
+"""Unit tests for manifest parsing and stage detection helpers used by pipeline resume."""
 
-from bookvoice.pipeline.resume import manifest_bool, manifest_string
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from bookvoice.pipeline.resume import (
+    all_paths_exist,
+    detect_next_stage,
+    existing_artifact_paths,
+    manifest_anchored_paths,
+    manifest_bool,
+    manifest_string,
+    resolve_artifact_path,
+    resolve_run_root,
+    validate_resume_artifact_consistency,
+)
 
 
 def test_manifest_string_uses_default_for_blank_values() -> None:
@@ -28,3 +44,150 @@ def test_manifest_bool_uses_default_for_invalid_tokens() -> None:
 
     assert manifest_bool(payload, "rewrite_bypass", False) is False
     assert manifest_bool(payload, "rewrite_bypass", True) is True
+
+
+def _stage_paths(run_root: Path) -> dict[str, Path]:
+    """Build the resume artifact path keyword arguments for one run root."""
+
+    return {
+        "raw_text_path": run_root / "text/raw.txt",
+        "clean_text_path": run_root / "text/clean.txt",
+        "chapters_path": run_root / "text/chapters.json",
+        "chunks_path": run_root / "text/chunks.json",
+        "translations_path": run_root / "text/translations.json",
+        "rewrites_path": run_root / "text/rewrites.json",
+        "audio_parts_path": run_root / "audio/parts.json",
+        "merged_path": run_root / "audio/bookvoice_merged.wav",
+        "packaged_path": run_root / "audio/package.json",
+    }
+
+
+def test_existing_artifact_paths_lists_each_parent_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Presence detection should scan shared parents once and tolerate missing ones."""
+
+    (tmp_path / "text").mkdir()
+    (tmp_path / "text/raw.txt").write_text("raw", encoding="utf-8")
+    (tmp_path / "text/chapters.json").write_text("{}", encoding="utf-8")
+    scanned: list[str] = []
+    original_scandir = os.scandir
+
+    def recording_scandir(path: Path) -> Iterator[os.DirEntry[str]]:
+        """Record scanned directories before delegating to `os.scandir`."""
+
+        scanned.append(path.name)
+        return original_scandir(path)
+
+    monkeypatch.setattr("bookvoice.pipeline.resume.os.scandir", recording_scandir)
+
+    existing = existing_artifact_paths(_stage_paths(tmp_path).values())
+
+    assert existing == {tmp_path / "text/raw.txt", tmp_path / "text/chapters.json"}
+    assert scanned == ["text", "audio"]
+
+
+def test_all_paths_exist_checks_parts_against_directory_listings(tmp_path: Path) -> None:
+    """Part existence should hold only when every listed file is present."""
+
+    chunks_dir = tmp_path / "audio/chunks"
+    chunks_dir.mkdir(parents=True)
+    parts = [chunks_dir / f"{index:03d}.wav" for index in range(1, 4)]
+    for part in parts[:2]:
+        part.write_bytes(b"RIFF")
+
+    assert all_paths_exist(parts[:2] + parts[:1])
+    assert not all_paths_exist(parts)
+    assert not all_paths_exist([tmp_path / "missing/001.wav"])
+    assert all_paths_exist([])
+
+
+@pytest.mark.parametrize(
+    ("present", "packaging_enabled", "expected"),
+    [
+        ((), False, "extract"),
+        (("raw_text_path",), False, "clean"),
+        (("raw_text_path", "clean_text_path", "chapters_path", "chunks_path"), False, "translate"),
+        (tuple(_stage_paths(Path("run")))[:8], True, "package"),
+        (tuple(_stage_paths(Path("run")))[:8], False, "done"),
+    ],
+)
+def test_detect_next_stage_returns_first_missing_stage(
+    tmp_path: Path,
+    present: tuple[str, ...],
+    packaging_enabled: bool,
+    expected: str,
+) -> None:
+    """Stage detection should keep the ordered first-missing-artifact fallthrough."""
+
+    paths = _stage_paths(tmp_path)
+    for key in present:
+        paths[key].parent.mkdir(parents=True, exist_ok=True)
+        paths[key].write_bytes(b"")
+
+    next_stage = detect_next_stage(
+        raw_text_path=paths["raw_text_path"],
+        clean_text_path=paths["clean_text_path"],
+        chapters_path=paths["chapters_path"],
+        chunks_path=paths["chunks_path"],
+        translations_path=paths["translations_path"],
+        rewrites_path=paths["rewrites_path"],
+        audio_parts_path=paths["audio_parts_path"],
+        merged_path=paths["merged_path"],
+        packaged_path=paths["packaged_path"],
+        packaging_enabled=packaging_enabled,
+    )
+
+    assert next_stage == expected
+
+
+def test_manifest_anchored_paths_resolve_relative_artifacts_from_snapshot(
+    tmp_path: Path,
+) -> None:
+    """Relative manifest paths should resolve against the anchored-path snapshot."""
+
+    manifest_path = tmp_path / "run-1/run_manifest.json"
+    (tmp_path / "run-1/text").mkdir(parents=True)
+    (tmp_path / "run-1/text/chunks.json").write_text("{}", encoding="utf-8")
+    extra: dict[str, object] = {
+        "run_root": ".",
+        "chunks": "text/chunks.json",
+        "rewrites": "text/rewrites.json",
+        "raw_text": str(tmp_path / "elsewhere/raw.txt"),
+    }
+
+    anchored = manifest_anchored_paths(manifest_path, {}, extra)
+    run_root = resolve_run_root(manifest_path, extra, existing_paths=anchored)
+
+    assert anchored == {tmp_path / "run-1", tmp_path / "run-1/text/chunks.json"}
+    assert run_root == tmp_path / "run-1"
+    assert resolve_artifact_path(
+        manifest_path, run_root, extra, "chunks", Path("unused"), existing_paths=anchored
+    ) == tmp_path / "run-1/text/chunks.json"
+    assert resolve_artifact_path(
+        manifest_path, run_root, extra, "rewrites", Path("unused"), existing_paths=anchored
+    ) == Path("text/rewrites.json")
+
+
+def test_validate_resume_artifact_consistency_uses_provided_snapshot(tmp_path: Path) -> None:
+    """A caller-provided presence snapshot should replace filesystem probing."""
+
+    paths = _stage_paths(tmp_path)
+    snapshot = frozenset((paths["raw_text_path"], paths["clean_text_path"]))
+
+    report = validate_resume_artifact_consistency(
+        raw_text_path=paths["raw_text_path"],
+        clean_text_path=paths["clean_text_path"],
+        chapters_path=paths["chapters_path"],
+        chunks_path=paths["chunks_path"],
+        translations_path=paths["translations_path"],
+        rewrites_path=paths["rewrites_path"],
+        audio_parts_path=paths["audio_parts_path"],
+        merged_path=paths["merged_path"],
+        packaged_path=paths["packaged_path"],
+        packaging_enabled=False,
+        existing_paths=snapshot,
+    )
+
+    assert report.status == "recoverable"
+    assert report.next_stage == "split"
@@ -1,6 +1,12 @@
+import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
-from bookvoice.io.storage import ArtifactStore
+import pytest
+
+from bookvoice.io import storage as storage_module
+from bookvoice.io.storage import ArtifactStore, DeferredArtifactWriter
 
 
 def test_artifact_store_roundtrip_text_json_audio(tmp_path: Path) -> None:
@@ -16,3 +22,168 @@ def test_artifact_store_roundtrip_text_json_audio(tmp_path: Path) -> None:
     assert store.load_text(Path("text/raw.txt")) == "hello"
     assert store.exists(Path("meta/run.json"))
     assert not store.exists(Path("missing.txt"))
+
+
+def test_artifact_store_save_json_keeps_deterministic_layout(tmp_path: Path) -> None:
+    """Saved JSON should stay indented, key-sorted, and UTF-8 encoded."""
+
+    store = ArtifactStore(tmp_path / "artifacts")
+    payload: dict[str, object] = {
+        "title": "Česká kniha",
+        "chunks": [{"text": "žluťoučký kůň", "indices": [1, 2]}],
+        "metadata": {},
+    }
+
+    json_path = store.save_json(Path("text/chunks.json"), payload)
+
+    assert json_path.read_text(encoding="utf-8") == json.dumps(
+        payload, ensure_ascii=False, indent=2, sort_keys=True
+    )
+
+
+def test_artifact_store_reuses_prepared_directories(tmp_path: Path) -> None:
+    """Repeated writes into one directory should keep working after the first mkdir."""
+
+    store = ArtifactStore(tmp_path / "artifacts")
+
+    first = store.save_audio(Path("audio/chunks/001.wav"), b"one")
+    second = store.save_audio(Path("audio/chunks/002.wav"), b"two")
+
+    assert first.parent == second.parent
+    assert first.read_bytes() == b"one"
+    assert second.read_bytes() == b"two"
+
+
+def test_artifact_store_writes_large_text_in_slices(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Text longer than one write slice should round-trip byte-for-byte as UTF-8."""
+
+    monkeypatch.setattr("bookvoice.io.storage._TEXT_WRITE_SLICE_CHARS", 4)
+    store = ArtifactStore(tmp_path / "artifacts")
+    content = "Příliš žluťoučký kůň\núpěl ďábelské ódy."
+
+    text_path = store.save_text(Path("text/clean.txt"), content)
+
+    assert text_path.read_bytes() == content.encode("utf-8")
+    assert store.load_text(Path("text/clean.txt")) == content
+
+
+def test_artifact_store_keeps_previous_artifact_when_write_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed JSON write should leave the prior artifact intact and no temp files."""
+
+    store = ArtifactStore(tmp_path / "artifacts")
+    json_path = store.save_json(Path("text/chunks.json"), {"chunks": [1]})
+    previous = json_path.read_bytes()
+
+    def failing_replace(source: Path, target: Path) -> None:
+        """Simulate an interrupted rename onto the final artifact path."""
+
+        raise OSError(f"cannot replace {target} with {source}")
+
+    monkeypatch.setattr("bookvoice.io.storage.os.replace", failing_replace)
+    with pytest.raises(OSError):
+        store.save_json(Path("text/chunks.json"), {"chunks": [2]})
+
+    assert json_path.read_bytes() == previous
+    assert sorted(path.name for path in json_path.parent.iterdir()) == ["chunks.json"]
+
+
+def test_artifact_store_skips_rewriting_identical_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Re-saving identical JSON should not replace the file; changed JSON still should."""
+
+    store = ArtifactStore(tmp_path / "artifacts")
+    json_path = store.save_json(Path("run_manifest.json"), {"chunks": [1, 2], "id": "a"})
+    replaced: list[Path] = []
+    real_replace = os.replace
+
+    def recording_replace(source: Path, target: Path) -> None:
+        """Record replaced targets before delegating to the real rename."""
+
+        replaced.append(Path(target))
+        real_replace(source, target)
+
+    monkeypatch.setattr("bookvoice.io.storage.os.replace", recording_replace)
+    store.save_json(Path("run_manifest.json"), {"chunks": [1, 2], "id": "a"})
+    assert replaced == []
+
+    store.save_json(Path("run_manifest.json"), {"chunks": [1, 2], "id": "ab"})
+    assert replaced == [json_path]
+    assert json.loads(json_path.read_text(encoding="utf-8"))["id"] == "ab"
+
+
+@pytest.mark.parametrize(
+    "previous",
+    [
+        {"chunks": [1, 2, 3], "id": "a"},
+        {"chunks": [1], "id": "a"},
+        {"chunks": [9, 2], "id": "a"},
+        {"chunks": [1, 2], "id": "a", "zz": True},
+    ],
+)
+def test_artifact_store_encodes_changed_json_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, previous: dict[str, object]
+) -> None:
+    """Changed JSON should be encoded once and land byte-identical to a fresh write."""
+
+    payload: dict[str, object] = {"chunks": [1, 2], "id": "a"}
+    fresh_path = ArtifactStore(tmp_path / "fresh").save_json(Path("a.json"), payload)
+    store = ArtifactStore(tmp_path / "artifacts")
+    json_path = store.save_json(Path("a.json"), previous)
+    encodes: list[object] = []
+    real_iter_chunks = storage_module.iter_json_artifact_chunks
+
+    def counting_iter_chunks(value: object) -> Iterator[bytes]:
+        """Count payload encodes before delegating to the real encoder."""
+
+        encodes.append(value)
+        return real_iter_chunks(value)
+
+    monkeypatch.setattr(storage_module, "iter_json_artifact_chunks", counting_iter_chunks)
+    store.save_json(Path("a.json"), payload)
+
+    assert encodes == [payload]
+    assert json_path.read_bytes() == fresh_path.read_bytes()
+    assert sorted(path.name for path in json_path.parent.iterdir()) == ["a.json"]
+
+
+def test_deferred_artifact_writer_persists_queued_json(tmp_path: Path) -> None:
+    """Deferred writes should return final paths and be on disk after flush."""
+
+    store = ArtifactStore(tmp_path / "artifacts")
+
+    with DeferredArtifactWriter(store) as writer:
+        first = writer.save_json(Path("text/chunks.json"), {"chunks": []})
+        second = writer.save_json(Path("text/translations.json"), {"translations": []})
+        writer.flush()
+
+        assert json.loads(first.read_text(encoding="utf-8")) == {"chunks": []}
+        assert json.loads(second.read_text(encoding="utf-8")) == {"translations": []}
+
+    assert first == store.root / "text/chunks.json"
+
+
+def test_deferred_artifact_writer_reraises_write_failures(tmp_path: Path) -> None:
+    """Flushing should surface background write errors to the caller."""
+
+    store = ArtifactStore(tmp_path / "artifacts")
+    writer = DeferredArtifactWriter(store)
+    writer.save_json(Path("meta/bad.json"), {"value": object()})
+
+    with pytest.raises(TypeError):
+        writer.close()
+
+
+def test_deferred_artifact_writer_persists_queued_text(tmp_path: Path) -> None:
+    """Deferred text writes should land on disk once the writer closes."""
+
+    store = ArtifactStore(tmp_path / "artifacts")
+
+    with DeferredArtifactWriter(store) as writer:
+        raw_path = writer.save_text(Path("text/raw.txt"), "Příliš žluťoučký kůň")
+
+    assert raw_path.read_text(encoding="utf-8") == "Příliš žluťoučký kůň"